@@ -1,5 +1,5 @@
 from ._version import __version__
-from .api import get, now, utcnow
+from .api import get, now, scan, try_get, utcnow
 from .arrow import Arrow
 from .factory import ArrowFactory
 from .formatter import (
@@ -14,17 +14,26 @@ from .formatter import (
     FORMAT_RSS,
     FORMAT_W3C,
 )
+from .intervals import IntervalIndex, IntervalSet
 from .parser import ParserError
+from .series import bucketize, find_gaps, resample
 
 # https://mypy.readthedocs.io/en/stable/command_line.html#cmdoption-mypy-no-implicit-reexport
 # Mypy with --strict or --no-implicit-reexport requires an explicit reexport.
 __all__ = [
     "__version__",
     "get",
+    "try_get",
+    "scan",
     "now",
     "utcnow",
+    "bucketize",
+    "find_gaps",
+    "resample",
     "Arrow",
     "ArrowFactory",
+    "IntervalIndex",
+    "IntervalSet",
     "FORMAT_ATOM",
     "FORMAT_COOKIE",
     "FORMAT_RFC822",
@@ -7,11 +7,12 @@ methods for use as a module API.
 from datetime import date, datetime
 from datetime import tzinfo as dt_tzinfo
 from time import struct_time
-from typing import Any, List, Optional, Tuple, Type, Union, overload
+from typing import Any, Iterator, List, Optional, Tuple, Type, Union, overload
 
 from arrow.arrow import TZ_EXPR, Arrow
 from arrow.constants import DEFAULT_LOCALE
 from arrow.factory import ArrowFactory
+from arrow.logs import DEFAULT_CHUNK_SIZE, SCAN_SOURCE
 
 # internal default factory.
 _factory = ArrowFactory()
@@ -94,6 +95,31 @@ def get(*args: Any, **kwargs: Any) -> Arrow:
 get.__doc__ = _factory.get.__doc__
 
 
+def try_get(*args: Any, **kwargs: Any) -> Optional[Arrow]:
+    """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``try_get`` method."""
+
+    return _factory.try_get(*args, **kwargs)
+
+
+try_get.__doc__ = _factory.try_get.__doc__
+
+
+def scan(
+    source: SCAN_SOURCE,
+    fmt: str,
+    tzinfo: Optional[TZ_EXPR] = None,
+    locale: str = DEFAULT_LOCALE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> Iterator[Tuple[int, Arrow]]:
+    """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``scan`` method."""
+
+    return _factory.scan(source, fmt, tzinfo, locale, chunk_size, encoding)
+
+
+scan.__doc__ = _factory.scan.__doc__
+
+
 def utcnow() -> Arrow:
     """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``utcnow`` method."""
 
@@ -123,4 +149,4 @@ def factory(type: Type[Arrow]) -> ArrowFactory:
     return ArrowFactory(type)
 
 
-__all__ = ["get", "utcnow", "now", "factory"]
+__all__ = ["get", "try_get", "scan", "utcnow", "now", "factory"]
@@ -4,9 +4,9 @@ replacement.
 
 """
 #test this here
-import calendar
 import re
 import sys
+from array import array
 from datetime import date
 from datetime import datetime as dt_datetime
 from datetime import time as dt_time
@@ -16,8 +16,10 @@ from math import trunc
 from time import struct_time
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Final,
+    FrozenSet,
     Generator,
     Iterable,
     List,
@@ -33,7 +35,7 @@ from typing import (
 from dateutil import tz as dateutil_tz
 from dateutil.relativedelta import relativedelta
 
-from arrow import formatter, locales, parser, util
+from arrow import formatter, locales, parser, util, zones
 from arrow.constants import DEFAULT_LOCALE, DEHUMANIZE_LOCALES
 from arrow.locales import TimeFrameLiteral
 
@@ -74,6 +76,27 @@ _GRANULARITY = Literal[
     "year",
 ]
 
+_EPOCH_UNITS = Literal["ms", "us", "ns"]
+
+# the shift units of a timedelta, which is cheaper to build than a relativedelta
+_TIMEDELTA_UNITS: Final[FrozenSet[str]] = frozenset(
+    ["weeks", "days", "hours", "minutes", "seconds", "microseconds"]
+)
+
+# the months in a step of the relative frames stepped on the month index
+_FRAME_MONTHS: Final[Mapping[str, int]] = {"months": 1, "years": 12}
+
+_EPOCH: Final[dt_datetime] = dt_datetime(1970, 1, 1, tzinfo=zones.UTC)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+_EPOCH_NS_FACTORS: Final[Mapping[str, int]] = {"ms": 1_000_000, "us": 1000, "ns": 1}
+
+# positional arguments are noticeably faster than keywords for timedelta
+_EPOCH_DELTAS: Final[Mapping[str, Callable[[int], timedelta]]] = {
+    "ms": lambda value: timedelta(0, 0, 0, value),
+    "us": lambda value: timedelta(0, 0, value),
+    "ns": lambda value: timedelta(0, 0, value // 1000),
+}
+
 
 class Arrow:
     """An :class:`Arrow <arrow.arrow.Arrow>` object.
@@ -157,7 +180,7 @@ class Arrow:
         **kwargs: Any,
     ) -> None:
         if tzinfo is None:
-            tzinfo = dateutil_tz.tzutc()
+            tzinfo = zones.UTC
         # detect that tzinfo is a pytz object (issue #626)
         elif (
             isinstance(tzinfo, dt_tzinfo)
@@ -192,21 +215,9 @@ class Arrow:
         """
 
         if tzinfo is None:
-            tzinfo = dateutil_tz.tzlocal()
+            tzinfo = zones.local()
 
-        dt = dt_datetime.now(tzinfo)
-
-        return cls(
-            dt.year,
-            dt.month,
-            dt.day,
-            dt.hour,
-            dt.minute,
-            dt.second,
-            dt.microsecond,
-            dt.tzinfo,
-            fold=getattr(dt, "fold", 0),
-        )
+        return cls._wrap(dt_datetime.now(tzinfo))
 
     @classmethod
     def utcnow(cls) -> "Arrow":
@@ -220,19 +231,7 @@ class Arrow:
 
         """
 
-        dt = dt_datetime.now(dateutil_tz.tzutc())
-
-        return cls(
-            dt.year,
-            dt.month,
-            dt.day,
-            dt.hour,
-            dt.minute,
-            dt.second,
-            dt.microsecond,
-            dt.tzinfo,
-            fold=getattr(dt, "fold", 0),
-        )
+        return cls._wrap(dt_datetime.now(zones.UTC))
 
     @classmethod
     def fromtimestamp(
@@ -249,7 +248,7 @@ class Arrow:
         """
 
         if tzinfo is None:
-            tzinfo = dateutil_tz.tzlocal()
+            tzinfo = zones.local()
         elif isinstance(tzinfo, str):
             tzinfo = parser.TzinfoParser.parse(tzinfo)
 
@@ -257,19 +256,196 @@ class Arrow:
             raise ValueError(f"The provided timestamp {timestamp!r} is invalid.")
 
         timestamp = util.normalize_timestamp(float(timestamp))
-        dt = dt_datetime.fromtimestamp(timestamp, tzinfo)
 
-        return cls(
-            dt.year,
-            dt.month,
-            dt.day,
-            dt.hour,
-            dt.minute,
-            dt.second,
-            dt.microsecond,
-            dt.tzinfo,
-            fold=getattr(dt, "fold", 0),
-        )
+        return cls._wrap(dt_datetime.fromtimestamp(timestamp, tzinfo))
+
+    @classmethod
+    def from_epoch_ms(cls, ms: int, tzinfo: Optional[TZ_EXPR] = None) -> "Arrow":
+        """Constructs an :class:`Arrow <arrow.arrow.Arrow>` object from an integer number of
+        milliseconds since the Unix epoch.
+
+        Unlike :meth:`fromtimestamp`, the value is not validated or normalized, and exact
+        integer arithmetic is used, so no precision is lost to float rounding.
+
+        :param ms: an ``int`` number of milliseconds since 1970-01-01T00:00:00Z.
+        :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` to convert to.
+            Defaults to UTC.
+
+        Usage::
+
+            >>> arrow.Arrow.from_epoch_ms(1367757045123)
+            <Arrow [2013-05-05T12:30:45.123000+00:00]>
+
+        """
+
+        return cls._from_epoch(timedelta(0, 0, 0, ms), tzinfo)
+
+    @classmethod
+    def from_epoch_us(cls, us: int, tzinfo: Optional[TZ_EXPR] = None) -> "Arrow":
+        """Constructs an :class:`Arrow <arrow.arrow.Arrow>` object from an integer number of
+        microseconds since the Unix epoch, with exact integer arithmetic.
+
+        :param us: an ``int`` number of microseconds since 1970-01-01T00:00:00Z.
+        :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` to convert to.
+            Defaults to UTC.
+
+        Usage::
+
+            >>> arrow.Arrow.from_epoch_us(1367757045123456)
+            <Arrow [2013-05-05T12:30:45.123456+00:00]>
+
+        """
+
+        return cls._from_epoch(timedelta(0, 0, us), tzinfo)
+
+    @classmethod
+    def from_epoch_ns(cls, ns: int, tzinfo: Optional[TZ_EXPR] = None) -> "Arrow":
+        """Constructs an :class:`Arrow <arrow.arrow.Arrow>` object from an integer number of
+        nanoseconds since the Unix epoch, with exact integer arithmetic.
+
+        Nanoseconds are truncated to the microsecond resolution of ``datetime``, rounding
+        towards the past.
+
+        :param ns: an ``int`` number of nanoseconds since 1970-01-01T00:00:00Z.
+        :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` to convert to.
+            Defaults to UTC.
+
+        Usage::
+
+            >>> arrow.Arrow.from_epoch_ns(1367757045123456789)
+            <Arrow [2013-05-05T12:30:45.123456+00:00]>
+
+        """
+
+        return cls._from_epoch(timedelta(0, 0, ns // 1000), tzinfo)
+
+    @classmethod
+    def from_epochs(
+        cls,
+        values: Iterable[int],
+        unit: _EPOCH_UNITS = "ms",
+        tzinfo: Optional[TZ_EXPR] = None,
+    ) -> List["Arrow"]:
+        """Constructs :class:`Arrow <arrow.arrow.Arrow>` objects from many integer epoch
+        values, as :meth:`from_epoch_ms`, :meth:`from_epoch_us` or :meth:`from_epoch_ns`
+        would one at a time.
+
+        :param values: an iterable of ``int`` values, such as a list, an ``array('q')`` or a
+            ``memoryview``.  A ``bytes`` or ``bytearray`` buffer is read as native int64
+            values.
+        :param unit: (optional) the unit of the values, one of 'ms', 'us' or 'ns'.  Defaults
+            to 'ms'.
+        :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` to convert to.
+            Defaults to UTC.
+        :returns: a ``list`` of :class:`Arrow <arrow.arrow.Arrow>` objects, in input order.
+
+        Usage::
+
+            >>> arrow.Arrow.from_epochs([1367757045123, 1367757046123])
+            [<Arrow [2013-05-05T12:30:45.123000+00:00]>, <Arrow [2013-05-05T12:30:46.123000+00:00]>]
+
+        """
+
+        to_delta = _EPOCH_DELTAS.get(unit)
+        if to_delta is None:
+            raise ValueError(
+                f"Unsupported epoch unit {unit!r}, expected one of 'ms', 'us' or 'ns'."
+            )
+
+        if isinstance(values, (bytes, bytearray)):
+            values = memoryview(values).cast("q")
+
+        epoch = _EPOCH
+        wrap = cls._wrap
+
+        if tzinfo is None:
+            return [wrap(epoch + to_delta(value)) for value in values]
+
+        if isinstance(tzinfo, str):
+            tzinfo = parser.TzinfoParser.parse(tzinfo)
+
+        return [wrap((epoch + to_delta(value)).astimezone(tzinfo)) for value in values]
+
+    @staticmethod
+    def to_epochs(
+        values: Iterable[Union["Arrow", dt_datetime]], unit: _EPOCH_UNITS = "ms"
+    ) -> "array[int]":
+        """Converts many :class:`Arrow <arrow.arrow.Arrow>` objects or datetimes to exact
+        integer epoch values, the reverse of :meth:`from_epochs`.
+
+        :param values: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects or
+            datetimes.  Naive datetimes are in UTC.
+        :param unit: (optional) the unit of the result, one of 'ms', 'us' or 'ns'.  Defaults
+            to 'ms'.  Milliseconds are rounded towards the past.
+        :returns: an ``array('q')`` of epoch values, in input order.
+
+        Usage::
+
+            >>> arrow.Arrow.to_epochs([arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456)], 'us')
+            array('q', [1367757045123456])
+
+        """
+
+        if unit not in _EPOCH_DELTAS:
+            raise ValueError(
+                f"Unsupported epoch unit {unit!r}, expected one of 'ms', 'us' or 'ns'."
+            )
+
+        # whole milliseconds are floored directly, nanoseconds scaled up from microseconds
+        step = timedelta(milliseconds=1) if unit == "ms" else _MICROSECOND
+        factor = 1000 if unit == "ns" else 1
+        epoch = _EPOCH
+
+        result: "array[int]" = array("q")
+        append = result.append
+
+        for value in values:
+            dt = value._datetime if isinstance(value, Arrow) else value
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=zones.UTC)
+
+            append((dt - epoch) // step * factor)
+
+        return result
+
+    @classmethod
+    def _from_epoch(cls, delta: timedelta, tzinfo: Optional[TZ_EXPR]) -> "Arrow":
+        dt = _EPOCH + delta
+
+        if tzinfo is not None:
+            if isinstance(tzinfo, str):
+                tzinfo = parser.TzinfoParser.parse(tzinfo)
+            dt = dt.astimezone(tzinfo)
+
+        return cls._wrap(dt)
+
+    @classmethod
+    def _wrap(cls, dt: dt_datetime) -> "Arrow":
+        """Wraps an aware ``datetime`` without the checks and copy of the constructor.
+
+        Falls back to the constructor for pytz timezones, which it converts, and for
+        subclasses that override it.
+
+        """
+
+        tzinfo = dt.tzinfo
+
+        if cls.__init__ is not Arrow.__init__ or hasattr(tzinfo, "localize"):
+            return cls(
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                dt.microsecond,
+                tzinfo,
+                fold=dt.fold,
+            )
+
+        arrow = object.__new__(cls)
+        arrow._datetime = dt
+        return arrow
 
     @classmethod
     def utcfromtimestamp(cls, timestamp: Union[int, float, str]) -> "Arrow":
@@ -481,24 +657,19 @@ class Arrow:
         end = cls._get_datetime(end).replace(tzinfo=tzinfo)
 
         current = cls.fromdatetime(start)
-        original_day = start.day
-        day_is_clipped = False
-        i = 0
 
-        while current <= end and i < limit:
-            i += 1
-            yield current
+        if frame_relative in _FRAME_MONTHS:
+            months = _FRAME_MONTHS[frame_relative] * relative_steps
+            sticky = frame in ["month", "quarter", "year"]
 
-            values = [getattr(current, f) for f in cls._ATTRS]
-            current = cls(*values, tzinfo=tzinfo).shift(  # type: ignore[misc]
-                check_imaginary=True, **{frame_relative: relative_steps}
-            )
+            for dt in cls._month_range(current._datetime, end, limit, months, sticky):
+                yield cls._wrap(dt)
+            return
 
-            if frame in ["month", "quarter", "year"] and current.day < original_day:
-                day_is_clipped = True
+        step = timedelta(**{frame_relative: relative_steps})
 
-            if day_is_clipped and not cls._is_last_day_of_month(current):
-                current = current.replace(day=original_day)
+        for dt in cls._wall_range(current._datetime, end, limit, step):
+            yield cls._wrap(dt)
 
     def span(
         self,
@@ -695,8 +866,17 @@ class Arrow:
         end = cls.fromdatetime(end, tzinfo)
         _range = cls.range(frame, start, end, tz, limit)
         if not exact:
-            for r in _range:
-                yield r.span(frame, bounds=bounds, exact=exact)
+            frame_absolute, frame_relative, relative_steps = cls._get_frames(frame)
+
+            if frame_relative in _FRAME_MONTHS:
+                months = _FRAME_MONTHS[frame_relative] * relative_steps
+                for r in _range:
+                    yield cls._month_span(r._datetime, frame_absolute, months, bounds)
+            else:
+                for r in _range:
+                    yield r.span(frame, bounds=bounds, exact=exact)
+
+            return
 
         for r in _range:
             floor, ceil = r.span(frame, bounds=bounds, exact=exact)
@@ -901,6 +1081,49 @@ class Arrow:
 
         return self.timestamp()
 
+    @property
+    def int_timestamp_ms(self) -> int:
+        """Returns the exact number of milliseconds since the Unix epoch, rounded towards
+        the past.
+
+        Computed with integer arithmetic, so unlike ``timestamp() * 1000`` no precision is
+        lost for dates far from the epoch.
+
+        Usage::
+
+            >>> arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456).int_timestamp_ms
+            1367757045123
+
+        """
+
+        return util.epoch_us(self._datetime) // 1000
+
+    @property
+    def int_timestamp_us(self) -> int:
+        """Returns the exact number of microseconds since the Unix epoch.
+
+        Usage::
+
+            >>> arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456).int_timestamp_us
+            1367757045123456
+
+        """
+
+        return util.epoch_us(self._datetime)
+
+    @property
+    def int_timestamp_ns(self) -> int:
+        """Returns the exact number of nanoseconds since the Unix epoch.
+
+        Usage::
+
+            >>> arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456).int_timestamp_ns
+            1367757045123456000
+
+        """
+
+        return util.epoch_us(self._datetime) * 1000
+
     @property
     def fold(self) -> int:
         """Returns the ``fold`` value of the :class:`Arrow <arrow.arrow.Arrow>` object."""
@@ -914,13 +1137,13 @@ class Arrow:
 
         """
 
-        return dateutil_tz.datetime_ambiguous(self._datetime)
+        return zones.datetime_ambiguous(self._datetime)
 
     @property
     def imaginary(self) -> bool:
         """Indicates whether the :class: `Arrow <arrow.arrow.Arrow>` object exists in the current timezone."""
 
-        return not dateutil_tz.datetime_exists(self._datetime)
+        return not zones.datetime_exists(self._datetime)
 
     # mutation and duplication.
 
@@ -1029,19 +1252,30 @@ class Arrow:
                     f"Invalid shift time frame. Please select one of the following: {supported_attr}."
                 )
 
-        # core datetime does not support quarters, translate to months.
-        relative_kwargs.setdefault("months", 0)
-        relative_kwargs["months"] += (
-            relative_kwargs.pop("quarters", 0) * self._MONTHS_PER_QUARTER
-        )
+        # integer shifts in these units are exact either way
+        if _TIMEDELTA_UNITS.issuperset(relative_kwargs) and all(
+            type(value) is int for value in relative_kwargs.values()
+        ):
+            current = self._datetime + timedelta(**relative_kwargs)
+
+        else:
+            # core datetime does not support quarters, translate to months.
+            relative_kwargs.setdefault("months", 0)
+            relative_kwargs["months"] += (
+                relative_kwargs.pop("quarters", 0) * self._MONTHS_PER_QUARTER
+            )
 
-        current = self._datetime + relativedelta(**relative_kwargs)
+            current = self._datetime + relativedelta(**relative_kwargs)
 
         # If check_imaginary is True, perform the check for imaginary times (DST transitions)
-        if check_imaginary and not dateutil_tz.datetime_exists(current):
-            current = dateutil_tz.resolve_imaginary(current)
+        if (
+            check_imaginary
+            and not zones.has_fixed_offset(self.tzinfo)
+            and not zones.datetime_exists(current)
+        ):
+            current = zones.resolve_imaginary(current)
 
-        return self.fromdatetime(current)
+        return self._wrap(current)
 
     def to(self, tz: TZ_EXPR) -> "Arrow":
         """Returns a new :class:`Arrow <arrow.arrow.Arrow>` object, converted
@@ -1454,15 +1688,19 @@ class Arrow:
 
     def is_between(
         self,
-        start: "Arrow",
-        end: "Arrow",
+        start: Union["Arrow", dt_datetime],
+        end: Union["Arrow", dt_datetime],
         bounds: _BOUNDS = "()",
     ) -> bool:
         """Returns a boolean denoting whether the :class:`Arrow <arrow.arrow.Arrow>` object is between
         the start and end limits.
 
-        :param start: an :class:`Arrow <arrow.arrow.Arrow>` object.
-        :param end: an :class:`Arrow <arrow.arrow.Arrow>` object.
+        Points in time are compared exactly, as integer microseconds since the epoch.
+
+        :param start: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime``.  Naive
+            datetimes are in UTC.
+        :param end: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime``.  Naive
+            datetimes are in UTC.
         :param bounds: (optional) a ``str`` of either '()', '(]', '[)', or '[]' that specifies
             whether to include or exclude the start and end values in the range. '(' excludes
             the start, '[' includes the start, ')' excludes the end, and ']' includes the end.
@@ -1489,26 +1727,102 @@ class Arrow:
 
         util.validate_bounds(bounds)
 
-        if not isinstance(start, Arrow):
-            raise TypeError(
-                f"Cannot parse start date argument type of {type(start)!r}."
+        low = self._epoch_us(start, "start")
+        high = self._epoch_us(end, "end")
+
+        if bounds[0] == "(":
+            low += 1
+        if bounds[1] == ")":
+            high -= 1
+
+        return low <= util.epoch_us(self._datetime) <= high
+
+    @classmethod
+    def between_mask(
+        cls,
+        values: Iterable[Union["Arrow", dt_datetime, int]],
+        start: Union["Arrow", dt_datetime, int],
+        end: Union["Arrow", dt_datetime, int],
+        bounds: _BOUNDS = "()",
+        unit: _EPOCH_UNITS = "ms",
+    ) -> List[bool]:
+        """Returns whether each of many values is between the start and end limits, as
+        :meth:`is_between` would for one.
+
+        Integer epoch values are compared as integers, without building any objects, and
+        the limits are converted once for the whole batch.
+
+        :param values: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects, datetimes
+            or integer epoch values, such as an ``array('q')``.  Naive datetimes are in UTC.
+        :param start: an :class:`Arrow <arrow.arrow.Arrow>` object, ``datetime`` or integer
+            epoch value.
+        :param end: an :class:`Arrow <arrow.arrow.Arrow>` object, ``datetime`` or integer
+            epoch value.
+        :param bounds: (optional) a ``str`` of either '()', '(]', '[)', or '[]' that specifies
+            whether to include or exclude the start and end values in the range.  Defaults
+            to '()'.
+        :param unit: (optional) the unit of integer epoch values, one of 'ms', 'us' or 'ns'.
+            Defaults to 'ms'.
+        :returns: a ``list`` of booleans, in input order.
+
+        Usage::
+
+            >>> start = arrow.Arrow(2013, 5, 5)
+            >>> end = arrow.Arrow(2013, 5, 6)
+            >>> arrow.Arrow.between_mask([1367712000000, 1367798400000], start, end, '[)')
+            [True, False]
+
+        """
+
+        util.validate_bounds(bounds)
+
+        factor = _EPOCH_NS_FACTORS.get(unit)
+        if factor is None:
+            raise ValueError(
+                f"Unsupported epoch unit {unit!r}, expected one of 'ms', 'us' or 'ns'."
             )
 
-        if not isinstance(end, Arrow):
-            raise TypeError(f"Cannot parse end date argument type of {type(start)!r}.")
+        def epoch_ns(value: Union["Arrow", dt_datetime, int], name: str) -> int:
+            if type(value) is int:
+                return value * factor
+            return cls._epoch_us(value, name) * 1000  # type: ignore[arg-type]
 
-        include_start = bounds[0] == "["
-        include_end = bounds[1] == "]"
+        # the closed range of epoch nanoseconds inside the bounds
+        low = epoch_ns(start, "start")
+        high = epoch_ns(end, "end")
 
-        target_ts = self.float_timestamp
-        start_ts = start.float_timestamp
-        end_ts = end.float_timestamp
+        if bounds[0] == "(":
+            low += 1
+        if bounds[1] == ")":
+            high -= 1
 
-        return (
-            (start_ts <= target_ts <= end_ts)
-            and (include_start or start_ts < target_ts)
-            and (include_end or target_ts < end_ts)
-        )
+        # the same range for integer values, which are multiples of factor
+        unit_low = -(-low // factor)
+        unit_high = high // factor
+
+        if isinstance(values, array):
+            return [unit_low <= value <= unit_high for value in values]
+
+        return [
+            unit_low <= value <= unit_high
+            if type(value) is int
+            else low <= epoch_ns(value, "value") <= high
+            for value in values
+        ]
+
+    @staticmethod
+    def _epoch_us(value: Union["Arrow", dt_datetime], name: str) -> int:
+        """Returns the epoch microseconds of an Arrow object or datetime, naive in UTC."""
+
+        if isinstance(value, Arrow):
+            return util.epoch_us(value._datetime)
+
+        if isinstance(value, dt_datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=zones.UTC)
+            return util.epoch_us(value)
+
+        raise TypeError(f"Cannot parse {name} date argument type of {type(value)!r}.")
 
     # datetime methods
 
@@ -1716,7 +2030,7 @@ class Arrow:
 
     def __add__(self, other: Any) -> "Arrow":
         if isinstance(other, (timedelta, relativedelta)):
-            return self.fromdatetime(self._datetime + other, self._datetime.tzinfo)
+            return self._wrap(self._datetime + other)
 
         return NotImplemented
 
@@ -1733,7 +2047,7 @@ class Arrow:
 
     def __sub__(self, other: Any) -> Union[timedelta, "Arrow"]:
         if isinstance(other, (timedelta, relativedelta)):
-            return self.fromdatetime(self._datetime - other, self._datetime.tzinfo)
+            return self._wrap(self._datetime - other)
 
         elif isinstance(other, dt_datetime):
             return self._datetime - other
@@ -1864,9 +2178,127 @@ class Arrow:
             return end, limit
 
     @staticmethod
-    def _is_last_day_of_month(date: "Arrow") -> bool:
-        """Returns a boolean indicating whether the datetime is the last day of the month."""
-        return cast(int, date.day) == calendar.monthrange(date.year, date.month)[1]
+    def _month_range(
+        start: dt_datetime, end: dt_datetime, limit: int, months: int, sticky: bool
+    ) -> Generator[dt_datetime, None, None]:
+        """Yields the datetimes from ``start`` to ``end`` a number of months apart, stepping
+        on a ``year * 12 + month`` index, as :meth:`range` does for calendar frames.
+
+        Days past the end of a month are clipped to it, and once ``sticky`` ranges have
+        clipped a day, the day of ``start`` is restored in every month long enough for it.
+
+        """
+
+        tzinfo = start.tzinfo
+        original_day = start.day
+        day_is_clipped = False
+        current = start
+        i = 0
+
+        while current <= end and i < limit:
+            i += 1
+            yield current
+
+            year, month = divmod(current.year * 12 + current.month - 1 + months, 12)
+            month += 1
+            length = util.month_length(year, month)
+
+            current = dt_datetime(
+                year,
+                month,
+                min(current.day, length),
+                current.hour,
+                current.minute,
+                current.second,
+                current.microsecond,
+                tzinfo,
+            )
+
+            if not zones.datetime_exists(current):
+                current = zones.resolve_imaginary(current)
+                length = util.month_length(current.year, current.month)
+
+            if sticky and current.day < original_day:
+                day_is_clipped = True
+
+            if day_is_clipped and current.day != length:
+                current = current.replace(day=original_day)
+
+    @staticmethod
+    def _wall_range(
+        start: dt_datetime, end: dt_datetime, limit: int, step: timedelta
+    ) -> Generator[dt_datetime, None, None]:
+        """Yields the datetimes from ``start`` to ``end`` a wall clock step apart, moving
+        those skipped by DST changes forward, as :meth:`range` does for frames up to weeks.
+
+        The transitions of the timezone are looked up once, and only the steps landing near
+        one of them are checked for skipped wall times.
+
+        """
+
+        windows = zones.transition_windows(cast(dt_tzinfo, start.tzinfo), start)
+        window = next(windows, None)
+        current = start
+        i = 0
+
+        while current <= end and i < limit:
+            i += 1
+            yield current
+
+            current += step
+
+            while window is not None and window[1] < current:
+                window = next(windows, None)
+
+            if (
+                window is not None
+                and window[0] <= current
+                and not zones.datetime_exists(current)
+            ):
+                current = zones.resolve_imaginary(current)
+
+    @classmethod
+    def _month_span(
+        cls, dt: dt_datetime, frame: str, months: int, bounds: _BOUNDS
+    ) -> Tuple["Arrow", "Arrow"]:
+        """Returns the span of a month, quarter or year frame holding a datetime, as
+        :meth:`span` does, finding the next floor on the month index."""
+
+        util.validate_bounds(bounds)
+
+        tzinfo = dt.tzinfo
+
+        if frame == "year":
+            month = 1
+        elif frame == "quarter":
+            month = dt.month - (dt.month - 1) % cls._MONTHS_PER_QUARTER
+        else:
+            month = dt.month
+
+        floor = dt_datetime(dt.year, month, 1, tzinfo=tzinfo)
+
+        # span shifts quarter floors onto the start of the quarter, which moves them past
+        # skipped wall times
+        if frame == "quarter" and not zones.datetime_exists(floor):
+            floor = zones.resolve_imaginary(floor)
+
+        year, month = divmod(dt.year * 12 + month - 1 + months, 12)
+        ceil = floor.replace(year=year, month=month + 1)
+
+        if not zones.datetime_exists(ceil):
+            ceil = zones.resolve_imaginary(ceil)
+
+        if bounds[0] == "(":
+            floor += _MICROSECOND
+            if not zones.datetime_exists(floor):
+                floor = zones.resolve_imaginary(floor)
+
+        if bounds[1] == ")":
+            ceil -= _MICROSECOND
+            if not zones.datetime_exists(ceil):
+                ceil = zones.resolve_imaginary(ceil)
+
+        return cls._wrap(floor), cls._wrap(ceil)
 
 
 Arrow.min = Arrow.fromdatetime(dt_datetime.min)
@@ -0,0 +1,100 @@
+"""A coarse clock for stamping many events with the current time cheaply."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from datetime import tzinfo as dt_tzinfo
+from typing import Optional, Tuple
+
+from arrow import parser, zones
+from arrow.arrow import TZ_EXPR, Arrow
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=zones.UTC)
+
+
+class CoarseClock:
+    """A clock that reuses its last reading for a fixed number of milliseconds.
+
+    Reading the clock costs a call to :func:`time.time_ns` and a comparison, and a new
+    :class:`Arrow <arrow.arrow.Arrow>` object is only built once per ``granularity``, so
+    events stamped in quick succession share a value. Readings never go backwards, even if
+    the system clock does, and a clock can be shared between threads.
+
+    :param granularity: (optional) the number of milliseconds a reading is reused for.
+        Defaults to 1.
+    :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` or tzinfo object for
+        the readings.  Defaults to UTC.
+
+    Usage::
+
+        >>> from arrow.clock import CoarseClock
+        >>> clock = CoarseClock(granularity=10)
+        >>> clock.now()
+        <Arrow [2013-05-05T12:30:45.123000+00:00]>
+        >>> clock.now() is clock.now()
+        True
+
+    """
+
+    __slots__ = ("granularity", "tzinfo", "_granularity_ns", "_reading", "_lock")
+
+    granularity: int
+    tzinfo: dt_tzinfo
+    _granularity_ns: int
+    # the start of the current period in ns and the reading for it, swapped as a whole
+    _reading: Tuple[int, Optional[Arrow]]
+    _lock: threading.Lock
+
+    def __init__(self, granularity: int = 1, tzinfo: Optional[TZ_EXPR] = None) -> None:
+        if granularity < 1:
+            raise ValueError(
+                "The granularity must be a positive number of milliseconds."
+            )
+
+        if tzinfo is None:
+            tzinfo = zones.UTC
+        elif isinstance(tzinfo, str):
+            tzinfo = parser.TzinfoParser.parse(tzinfo)
+
+        self.granularity = granularity
+        self.tzinfo = tzinfo
+        self._granularity_ns = granularity * 1_000_000
+        self._reading = (0, None)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(granularity={self.granularity}, tzinfo={self.tzinfo!r})"
+
+    def now(self) -> Arrow:
+        """Returns the current time, truncated to the clock's granularity.
+
+        Usage::
+
+            >>> CoarseClock(granularity=1000).now()
+            <Arrow [2013-05-05T12:30:45+00:00]>
+
+        """
+
+        start, reading = self._reading
+        now = time.time_ns()
+
+        if reading is not None and now < start + self._granularity_ns:
+            return reading
+
+        period = now - now % self._granularity_ns
+
+        with self._lock:
+            start, reading = self._reading
+
+            if reading is not None and period <= start:
+                # another thread got there first, or the system clock went back
+                return reading
+
+            dt = _EPOCH + timedelta(microseconds=period // 1000)
+            if self.tzinfo is not zones.UTC:
+                dt = dt.astimezone(self.tzinfo)
+
+            reading = Arrow._wrap(dt)
+            self._reading = (period, reading)
+
+        return reading
@@ -10,11 +10,11 @@ from datetime import date, datetime
 from datetime import tzinfo as dt_tzinfo
 from decimal import Decimal
 from time import struct_time
-from typing import Any, List, Optional, Tuple, Type, Union, overload
+from typing import Any, Iterator, List, Optional, Tuple, Type, Union, overload
 
 from dateutil import tz as dateutil_tz
 
-from arrow import parser
+from arrow import logs, parser, zones
 from arrow.arrow import TZ_EXPR, Arrow
 from arrow.constants import DEFAULT_LOCALE
 from arrow.util import is_timestamp, iso_to_gregorian
@@ -302,6 +302,104 @@ class ArrowFactory:
         else:
             return self.type(*args, **kwargs)
 
+    def try_get(self, *args: Any, **kwargs: Any) -> Optional[Arrow]:
+        """Returns an :class:`Arrow <arrow.arrow.Arrow>` object based on flexible inputs, or
+        ``None`` if a ``str`` input cannot be parsed.
+
+        Accepts the same arguments as :meth:`get <arrow.factory.ArrowFactory.get>`. Strings that
+        fail to parse are rejected without raising, which makes this suitable for validating
+        inputs that are mostly not dates. All other inputs behave exactly as with ``get``.
+
+        Usage::
+
+            >>> import arrow
+            >>> arrow.try_get('2013-05-05 12:30:45', 'YYYY-MM-DD HH:mm:ss')
+            <Arrow [2013-05-05T12:30:45+00:00]>
+
+            >>> arrow.try_get('not a date') is None
+            True
+
+        """
+
+        unsupported_kwargs = set(kwargs) - {"locale", "tzinfo", "normalize_whitespace"}
+
+        # get sends an explicit tzinfo=None on to the constructor
+        if (
+            unsupported_kwargs
+            or ("tzinfo" in kwargs and kwargs["tzinfo"] is None)
+            or not 1 <= len(args) <= 2
+            or not isinstance(args[0], str)
+        ):
+            return self.get(*args, **kwargs)
+
+        locale = kwargs.get("locale", DEFAULT_LOCALE)
+        tz = kwargs.get("tzinfo", None)
+        normalize_whitespace = kwargs.get("normalize_whitespace", False)
+
+        dt_parser = parser.DateTimeParser(locale)
+
+        # (str) -> parse @ tzinfo
+        if len(args) == 1:
+            dt = dt_parser.try_parse_iso(args[0], normalize_whitespace)
+
+        # (str, format) -> parse @ tzinfo
+        elif isinstance(args[1], (str, list)):
+            dt = dt_parser.try_parse(args[0], args[1], normalize_whitespace)
+
+        else:
+            return self.get(*args, **kwargs)
+
+        if dt is None:
+            return None
+
+        return self.type.fromdatetime(dt, tzinfo=tz)
+
+    def scan(
+        self,
+        source: logs.SCAN_SOURCE,
+        fmt: str,
+        tzinfo: Optional[TZ_EXPR] = None,
+        locale: str = DEFAULT_LOCALE,
+        chunk_size: int = logs.DEFAULT_CHUNK_SIZE,
+        encoding: str = "utf-8",
+    ) -> Iterator[Tuple[int, Arrow]]:
+        """Lazily finds every timestamp matching a format in a log, file or buffer, and
+        yields ``(offset, Arrow)`` pairs.
+
+        The input is streamed in chunks, so memory use stays flat for logs of any size. See
+        :func:`arrow.logs.scan` for the details.
+
+        :param source: a ``str``, a ``bytes``, ``bytearray`` or ``mmap`` buffer, a file object
+            opened in text or binary mode, or an iterable of lines.
+        :param fmt: the format of the timestamps to find.
+        :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` or tzinfo object
+            replacing the parsed timezone.  Naive timestamps default to UTC.
+        :param locale: (optional) a ``str`` specifying a locale.  Defaults to 'en-us'.
+        :param chunk_size: (optional) the number of characters or bytes to read at a time.
+        :param encoding: (optional) the ASCII compatible encoding of binary input.  Defaults
+            to 'utf-8'.
+
+        Usage::
+
+            >>> import arrow
+            >>> with open('app.log', 'rb') as f:
+            ...     for offset, timestamp in arrow.scan(f, 'YYYY-MM-DD HH:mm:ss'):
+            ...         print(offset, timestamp)
+            0 2013-05-05T12:30:45+00:00
+            61 2013-05-05T12:31:02+00:00
+
+        """
+
+        if isinstance(tzinfo, str):
+            tzinfo = parser.TzinfoParser.parse(tzinfo)
+
+        matches = logs.scan(source, fmt, locale, chunk_size, encoding)
+
+        return (
+            (offset, self.type.fromdatetime(dt, tzinfo=tzinfo))
+            for offset, dt in matches
+        )
+
     def utcnow(self) -> Arrow:
         """Returns an :class:`Arrow <arrow.arrow.Arrow>` object, representing "now" in UTC time.
 
@@ -337,7 +435,7 @@ class ArrowFactory:
         """
 
         if tz is None:
-            tz = dateutil_tz.tzlocal()
+            tz = zones.local()
         elif not isinstance(tz, dt_tzinfo):
             tz = parser.TzinfoParser.parse(tz)
 
@@ -6,7 +6,7 @@ from typing import Final, Optional, Pattern, cast
 
 from dateutil import tz as dateutil_tz
 
-from arrow import locales
+from arrow import locales, util
 from arrow.constants import DEFAULT_LOCALE
 
 FORMAT_ATOM: Final[str] = "YYYY-MM-DD HH:mm:ssZZ"
@@ -114,7 +114,7 @@ class DateTimeFormatter:
             return f"{dt.timestamp()}"
 
         if token == "x":
-            return f"{dt.timestamp() * 1_000_000:.0f}"
+            return f"{util.epoch_us(dt)}"
 
         if token == "ZZZ":
             return dt.tzname()
@@ -0,0 +1,573 @@
+"""Indexes and sets of time intervals, backed by integer epoch microseconds."""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from heapq import merge
+from math import isqrt
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from arrow import util
+from arrow.arrow import _BOUNDS, TZ_EXPR, Arrow
+from arrow.parser import TzinfoParser
+
+SPAN = Sequence[Any]
+MOMENT = Union[Arrow, datetime]
+RANGES = Tuple[Tuple[int, int], ...]
+
+# spans below this depth of the implicit tree are scanned linearly
+_SCAN_LEVEL = 3
+
+
+def _closed_range(start: MOMENT, end: MOMENT, bounds: str) -> Tuple[int, int]:
+    """Returns the closed range of epoch microseconds inside ``start`` and ``end``."""
+
+    low = Arrow._epoch_us(start, "start")
+    high = Arrow._epoch_us(end, "end")
+
+    if bounds[0] == "(":
+        low += 1
+    if bounds[1] == ")":
+        high -= 1
+
+    return low, high
+
+
+class IntervalIndex:
+    """An index of time spans answering which of them contain a moment or overlap a window.
+
+    Spans are tuples whose first two items are their start and end, as
+    :class:`Arrow <arrow.arrow.Arrow>` objects or datetimes, such as the tuples returned by
+    :meth:`Arrow.span_range <arrow.arrow.Arrow.span_range>` and
+    :meth:`Arrow.interval <arrow.arrow.Arrow.interval>`.  Further items, such as a label,
+    are kept, and queries return the span tuples themselves, ordered by start.
+
+    The endpoints are stored as sorted integer epoch microseconds in an implicit
+    augmented interval tree, so a query takes O(log n + k) for k results.  Spans added or
+    removed after the last build are kept aside and folded in once there are about
+    sqrt(n) of them.
+
+    :param spans: (optional) an iterable of span tuples.
+    :param bounds: (optional) a ``str`` of either '()', '(]', '[)', or '[]' that specifies
+        whether spans include their start and end, as with
+        :meth:`Arrow.is_between <arrow.arrow.Arrow.is_between>`.  Defaults to '[]', which
+        suits spans whose end is the last microsecond of a frame.
+
+    Usage::
+
+        >>> from arrow import IntervalIndex
+        >>> start = arrow.Arrow(2013, 5, 5, 12)
+        >>> index = IntervalIndex(arrow.Arrow.span_range('hour', start, start.shift(hours=3)))
+        >>> index.at(arrow.Arrow(2013, 5, 5, 13, 30))
+        [(<Arrow [2013-05-05T13:00:00+00:00]>, <Arrow [2013-05-05T13:59:59.999999+00:00]>)]
+
+    """
+
+    __slots__ = (
+        "bounds",
+        "_spans",
+        "_ranges",
+        "_next_id",
+        "_ids",
+        "_lows",
+        "_highs",
+        "_maxes",
+        "_root_level",
+        "_pending",
+        "_removed",
+    )
+
+    bounds: str
+    # every span in the index by id, with its closed range
+    _spans: Dict[int, Tuple[int, int, SPAN]]
+    # ids by closed range, to find spans to remove
+    _ranges: Dict[Tuple[int, int], List[int]]
+    _next_id: int
+    # the built tree: ids, starts, ends and subtree maximum ends, sorted by start
+    _ids: List[int]
+    _lows: List[int]
+    _highs: List[int]
+    _maxes: List[int]
+    _root_level: int
+    # ids added after the build, and ids removed from it
+    _pending: Set[int]
+    _removed: Set[int]
+
+    def __init__(self, spans: Iterable[SPAN] = (), bounds: _BOUNDS = "[]") -> None:
+        util.validate_bounds(bounds)
+
+        self.bounds = bounds
+        self._spans = {}
+        self._ranges = {}
+        self._next_id = 0
+
+        for span in spans:
+            self._insert(span)
+
+        self._build()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{len(self)} spans, {self.bounds!r}]>"
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __iter__(self) -> Iterator[SPAN]:
+        """Iterates over the spans, ordered by start."""
+
+        return iter(self._sorted(list(self._spans)))
+
+    def add(self, span: SPAN) -> None:
+        """Adds a span to the index.
+
+        :param span: a tuple whose first two items are the start and end of the span.
+
+        """
+
+        self._pending.add(self._insert(span))
+        self._maybe_rebuild()
+
+    def remove(self, span: SPAN) -> None:
+        """Removes a span equal to ``span`` from the index.
+
+        :param span: a tuple whose first two items are the start and end of the span.
+        :raises ValueError: if no such span is in the index.
+
+        """
+
+        ids = self._ranges.get(_closed_range(span[0], span[1], self.bounds), [])
+
+        for span_id in ids:
+            if self._spans[span_id][2] == span:
+                break
+        else:
+            raise ValueError(f"{span!r} is not in the index.")
+
+        ids.remove(span_id)
+        del self._spans[span_id]
+
+        if span_id in self._pending:
+            self._pending.remove(span_id)
+        else:
+            self._removed.add(span_id)
+            self._maybe_rebuild()
+
+    def at(self, moment: MOMENT) -> List[SPAN]:
+        """Returns the spans containing a moment, ordered by start.
+
+        :param moment: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime``.  Naive
+            datetimes are in UTC.
+
+        """
+
+        point = Arrow._epoch_us(moment, "moment")
+        return self._sorted(self._query(point, point))
+
+    def at_many(self, moments: Iterable[MOMENT]) -> List[List[SPAN]]:
+        """Returns the spans containing each of many moments, as :meth:`at` would.
+
+        :param moments: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects or
+            datetimes.  Naive datetimes are in UTC.
+
+        """
+
+        epoch_us = Arrow._epoch_us
+        query = self._query
+        sort = self._sorted
+
+        result = []
+        for moment in moments:
+            point = epoch_us(moment, "moment")
+            result.append(sort(query(point, point)))
+
+        return result
+
+    def overlapping(
+        self, start: MOMENT, end: MOMENT, bounds: _BOUNDS = "[]"
+    ) -> List[SPAN]:
+        """Returns the spans sharing at least one moment with a window, ordered by start.
+
+        :param start: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` for the
+            start of the window.  Naive datetimes are in UTC.
+        :param end: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` for the end
+            of the window.  Naive datetimes are in UTC.
+        :param bounds: (optional) whether the window includes its start and end, as with
+            :meth:`Arrow.is_between <arrow.arrow.Arrow.is_between>`.  Defaults to '[]'.
+
+        """
+
+        util.validate_bounds(bounds)
+
+        low, high = _closed_range(start, end, bounds)
+        if low > high:
+            return []
+
+        return self._sorted(self._query(low, high))
+
+    def _insert(self, span: SPAN) -> int:
+        low, high = _closed_range(span[0], span[1], self.bounds)
+
+        span_id = self._next_id
+        self._next_id += 1
+
+        self._spans[span_id] = (low, high, span)
+        self._ranges.setdefault((low, high), []).append(span_id)
+
+        return span_id
+
+    def _sorted(self, ids: List[int]) -> List[SPAN]:
+        spans = self._spans
+        ids.sort(key=lambda span_id: (spans[span_id][0], span_id))
+        return [spans[span_id][2] for span_id in ids]
+
+    def _maybe_rebuild(self) -> None:
+        if len(self._pending) + len(self._removed) > max(32, isqrt(len(self._spans))):
+            self._build()
+
+    def _build(self) -> None:
+        """Lays the non-empty spans out as an implicit interval tree.
+
+        The spans are sorted by start.  The node at index ``i`` is at the level given by the
+        number of trailing one bits of ``i``, its children are ``i -/+ 2 ** (level - 1)``,
+        and ``_maxes[i]`` holds the greatest end in its subtree.
+
+        """
+
+        entries = sorted(
+            (low, span_id, high)
+            for span_id, (low, high, _) in self._spans.items()
+            if low <= high
+        )
+
+        self._ids = ids = [span_id for _, span_id, _ in entries]
+        self._lows = [low for low, _, _ in entries]
+        self._highs = highs = [high for _, _, high in entries]
+        self._maxes = maxes = list(highs)
+        self._pending = set()
+        self._removed = set()
+
+        count = len(ids)
+        level = 0
+
+        if count:
+            # the greatest end of the rightmost, possibly incomplete, subtree so far
+            last_index = (count - 1) & ~1
+            last = maxes[last_index]
+            level = 1
+
+            while 1 << level <= count:
+                half = 1 << (level - 1)
+
+                for i in range((half << 1) - 1, count, half << 2):
+                    right = maxes[i + half] if i + half < count else last
+                    maxes[i] = max(highs[i], maxes[i - half], right)
+
+                last_index = (
+                    last_index - half if last_index >> level & 1 else last_index + half
+                )
+                if last_index < count and maxes[last_index] > last:
+                    last = maxes[last_index]
+
+                level += 1
+
+            level -= 1
+
+        self._root_level = level
+
+    def _query(self, low: int, high: int) -> List[int]:
+        """Returns the ids of the spans sharing a moment with the closed range."""
+
+        ids, lows, highs, maxes = self._ids, self._lows, self._highs, self._maxes
+        count = len(ids)
+        found = []
+
+        if count:
+            # (index, level, whether the left subtree has been visited)
+            stack = [((1 << self._root_level) - 1, self._root_level, False)]
+
+            while stack:
+                i, level, left_done = stack.pop()
+
+                if level <= _SCAN_LEVEL:
+                    first = i >> level << level
+                    last = min(first + (1 << (level + 1)) - 1, count)
+                    for j in range(first, last):
+                        if lows[j] > high:
+                            break
+                        if highs[j] >= low:
+                            found.append(ids[j])
+
+                elif not left_done:
+                    stack.append((i, level, True))
+                    child = i - (1 << (level - 1))
+                    # the left child may be past the end of an incomplete tree
+                    if child >= count or maxes[child] >= low:
+                        stack.append((child, level - 1, False))
+
+                elif i < count and lows[i] <= high:
+                    if highs[i] >= low:
+                        found.append(ids[i])
+                    stack.append((i + (1 << (level - 1)), level - 1, False))
+
+            if self._removed:
+                removed = self._removed
+                found = [span_id for span_id in found if span_id not in removed]
+
+        spans = self._spans
+        for span_id in self._pending:
+            span_low, span_high, _ = spans[span_id]
+            if span_low <= high and span_high >= low and span_low <= span_high:
+                found.append(span_id)
+
+        return found
+
+
+class IntervalSet:
+    """An immutable set of moments, held as sorted, non-overlapping time spans.
+
+    Spans are tuples whose first two items are their start and end, as
+    :class:`Arrow <arrow.arrow.Arrow>` objects or datetimes, such as the tuples returned by
+    :meth:`Arrow.span_range <arrow.arrow.Arrow.span_range>` and
+    :meth:`Arrow.interval <arrow.arrow.Arrow.interval>`.  They are normalized into closed
+    ranges of integer epoch microseconds, merging those that overlap or touch, so set
+    operations are linear sweeps over the ranges after an O(n log n) sort on construction.
+    Spans are only turned back into :class:`Arrow <arrow.arrow.Arrow>` objects as they are
+    iterated over.
+
+    :param spans: (optional) an iterable of span tuples.
+    :param bounds: (optional) a ``str`` of either '()', '(]', '[)', or '[]' that specifies
+        whether spans include their start and end, as with
+        :meth:`Arrow.is_between <arrow.arrow.Arrow.is_between>`.  Defaults to '[]', which
+        suits spans whose end is the last microsecond of a frame.
+
+    Usage::
+
+        >>> from arrow import IntervalSet
+        >>> on_call = IntervalSet([
+        ...     (arrow.Arrow(2013, 5, 5, 9), arrow.Arrow(2013, 5, 5, 13)),
+        ...     (arrow.Arrow(2013, 5, 5, 12), arrow.Arrow(2013, 5, 5, 17)),
+        ... ], bounds='[)')
+        >>> list(on_call)
+        [(<Arrow [2013-05-05T09:00:00+00:00]>, <Arrow [2013-05-05T16:59:59.999999+00:00]>)]
+        >>> on_call.complement(arrow.Arrow(2013, 5, 5), arrow.Arrow(2013, 5, 6), '[)').duration()
+        datetime.timedelta(seconds=57600)
+
+    """
+
+    __slots__ = ("_ranges",)
+
+    # sorted, disjoint and non-adjacent closed ranges of epoch microseconds
+    _ranges: RANGES
+
+    def __init__(self, spans: Iterable[SPAN] = (), bounds: _BOUNDS = "[]") -> None:
+        util.validate_bounds(bounds)
+
+        ranges = sorted(_closed_range(span[0], span[1], bounds) for span in spans)
+        self._ranges = _coalesce(ranges)
+
+    @classmethod
+    def _from_ranges(cls, ranges: RANGES) -> "IntervalSet":
+        interval_set = cls.__new__(cls)
+        interval_set._ranges = ranges
+        return interval_set
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{len(self)} spans]>"
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __iter__(self) -> Iterator[Tuple[Arrow, Arrow]]:
+        """Iterates over the spans as ``(start, end)`` tuples in UTC, ending on their last
+        microsecond."""
+
+        return self.spans()
+
+    def __contains__(self, moment: MOMENT) -> bool:
+        point = Arrow._epoch_us(moment, "moment")
+        index = bisect_right(self._ranges, (point, float("inf"))) - 1
+
+        return index >= 0 and point <= self._ranges[index][1]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self._ranges == other._ranges
+
+    def __hash__(self) -> int:
+        return hash(self._ranges)
+
+    def __or__(self, other: Any) -> "IntervalSet":
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self.union(other)
+
+    def __and__(self, other: Any) -> "IntervalSet":
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self.intersection(other)
+
+    def __sub__(self, other: Any) -> "IntervalSet":
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self.difference(other)
+
+    def spans(
+        self, bounds: _BOUNDS = "[]", tzinfo: Optional[TZ_EXPR] = None
+    ) -> Iterator[Tuple[Arrow, Arrow]]:
+        """Lazily converts the spans back into ``(start, end)`` tuples.
+
+        :param bounds: (optional) whether the returned start and end belong to the span, as
+            with :meth:`Arrow.is_between <arrow.arrow.Arrow.is_between>`.  Defaults to '[]',
+            whose ends are the last microsecond of each span; with '[)' they are the first
+            microsecond after it.
+        :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` to convert to.
+            Defaults to UTC.
+
+        Usage::
+
+            >>> spans = IntervalSet([(arrow.Arrow(2013, 5, 5, 9), arrow.Arrow(2013, 5, 5, 17))], '[)')
+            >>> list(spans.spans('[)', tzinfo='US/Pacific'))
+            [(<Arrow [2013-05-05T02:00:00-07:00]>, <Arrow [2013-05-05T10:00:00-07:00]>)]
+
+        """
+
+        util.validate_bounds(bounds)
+
+        if isinstance(tzinfo, str):
+            tzinfo = TzinfoParser.parse(tzinfo)
+
+        start_offset = bounds[0] == "("
+        end_offset = bounds[1] == ")"
+
+        return (
+            (
+                Arrow.from_epoch_us(low - start_offset, tzinfo),
+                Arrow.from_epoch_us(high + end_offset, tzinfo),
+            )
+            for low, high in self._ranges
+        )
+
+    def duration(self) -> timedelta:
+        """Returns the total time covered by the spans."""
+
+        return timedelta(0, 0, sum(high - low + 1 for low, high in self._ranges))
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """Returns the moments in either set.
+
+        :param other: an :class:`IntervalSet`.
+
+        """
+
+        return self._from_ranges(_coalesce(merge(self._ranges, other._ranges)))
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """Returns the moments in both sets.
+
+        :param other: an :class:`IntervalSet`.
+
+        """
+
+        ours, theirs = self._ranges, other._ranges
+        result = []
+        i = j = 0
+
+        while i < len(ours) and j < len(theirs):
+            low = max(ours[i][0], theirs[j][0])
+            high = min(ours[i][1], theirs[j][1])
+
+            if low <= high:
+                result.append((low, high))
+
+            # the range ending first cannot overlap anything further on
+            if ours[i][1] < theirs[j][1]:
+                i += 1
+            else:
+                j += 1
+
+        return self._from_ranges(tuple(result))
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """Returns the moments in this set but not in ``other``.
+
+        :param other: an :class:`IntervalSet`.
+
+        """
+
+        return self._from_ranges(_subtract(self._ranges, other._ranges))
+
+    def complement(
+        self, start: MOMENT, end: MOMENT, bounds: _BOUNDS = "[]"
+    ) -> "IntervalSet":
+        """Returns the moments of a window that are not in this set.
+
+        :param start: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` for the
+            start of the window.  Naive datetimes are in UTC.
+        :param end: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` for the end
+            of the window.  Naive datetimes are in UTC.
+        :param bounds: (optional) whether the window includes its start and end, as with
+            :meth:`Arrow.is_between <arrow.arrow.Arrow.is_between>`.  Defaults to '[]'.
+
+        """
+
+        util.validate_bounds(bounds)
+
+        window = _coalesce([_closed_range(start, end, bounds)])
+        return self._from_ranges(_subtract(window, self._ranges))
+
+
+def _coalesce(ranges: Iterable[Tuple[int, int]]) -> RANGES:
+    """Merges sorted closed ranges that overlap or touch, dropping empty ones."""
+
+    result: List[Tuple[int, int]] = []
+
+    for low, high in ranges:
+        if low > high:
+            continue
+
+        if result and low <= result[-1][1] + 1:
+            if high > result[-1][1]:
+                result[-1] = (result[-1][0], high)
+        else:
+            result.append((low, high))
+
+    return tuple(result)
+
+
+def _subtract(ours: RANGES, theirs: RANGES) -> RANGES:
+    """Removes normalized ranges from normalized ranges."""
+
+    result = []
+    j = 0
+
+    for low, high in ours:
+        # skip the ranges ending before this one, which cannot overlap later ones either
+        while j < len(theirs) and theirs[j][1] < low:
+            j += 1
+
+        k = j
+        while k < len(theirs) and theirs[k][0] <= high and low <= high:
+            if theirs[k][0] > low:
+                result.append((low, theirs[k][0] - 1))
+            low = theirs[k][1] + 1
+            k += 1
+
+        if low <= high:
+            result.append((low, high))
+
+    return tuple(result)
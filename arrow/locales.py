@@ -1,6 +1,7 @@
 """Provides internationalization for arrow in over 60 languages and dialects."""
 
 from math import trunc
+from threading import Lock
 from typing import (
     Any,
     ClassVar,
@@ -16,6 +17,8 @@ from typing import (
     cast,
 )
 
+from arrow import stats
+
 TimeFrameLiteral = Literal[
     "now",
     "second",
@@ -40,7 +43,10 @@ _TimeFrameElements = Union[
     str, Sequence[str], Mapping[str, str], Mapping[str, Sequence[str]]
 ]
 
+# Filled in when locale classes are defined and only read afterwards; the lock keeps
+# the duplicate check atomic for locales defined at runtime.
 _locale_map: Dict[str, Type["Locale"]] = {}
+_locale_map_lock = Lock()
 
 
 def get_locale(name: str) -> "Locale":
@@ -57,6 +63,9 @@ def get_locale(name: str) -> "Locale":
     if locale_cls is None:
         raise ValueError(f"Unsupported locale {normalized_locale_name!r}.")
 
+    if stats._enabled:
+        stats._count("locale_constructions")
+
     return locale_cls()
 
 
@@ -72,6 +81,9 @@ def get_locale_by_class_name(name: str) -> "Locale":
     if locale_cls is None:
         raise ValueError(f"Unsupported locale {name!r}.")
 
+    if stats._enabled:
+        stats._count("locale_constructions")
+
     return locale_cls()
 
 
@@ -117,11 +129,12 @@ class Locale:
     _month_name_to_ordinal: Optional[Dict[str, int]]
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
-        for locale_name in cls.names:
-            if locale_name in _locale_map:
-                raise LookupError(f"Duplicated locale name: {locale_name}")
+        with _locale_map_lock:
+            for locale_name in cls.names:
+                if locale_name in _locale_map:
+                    raise LookupError(f"Duplicated locale name: {locale_name}")
 
-            _locale_map[locale_name.lower().replace("_", "-")] = cls
+                _locale_map[locale_name.lower().replace("_", "-")] = cls
 
     def __init__(self) -> None:
         self._month_name_to_ordinal = None
@@ -221,13 +234,18 @@ class Locale:
 
         """
 
-        if self._month_name_to_ordinal is None:
-            self._month_name_to_ordinal = self._name_to_ordinal(self.month_names)
-            self._month_name_to_ordinal.update(
+        month_name_to_ordinal = self._month_name_to_ordinal
+
+        if month_name_to_ordinal is None:
+            # build the mapping completely before publishing it, so that concurrent
+            # callers never see it half filled
+            month_name_to_ordinal = self._name_to_ordinal(self.month_names)
+            month_name_to_ordinal.update(
                 self._name_to_ordinal(self.month_abbreviations)
             )
+            self._month_name_to_ordinal = month_name_to_ordinal
 
-        return self._month_name_to_ordinal.get(name)
+        return month_name_to_ordinal.get(name)
 
     def year_full(self, year: int) -> str:
         """Returns the year for specific locale if available
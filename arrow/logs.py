@@ -0,0 +1,355 @@
+"""Helpers for finding timestamps in large logs, text files and memory-mapped buffers."""
+
+import mmap
+import os
+import re
+from datetime import datetime
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from arrow.arrow import TZ_EXPR, Arrow
+from arrow.constants import DEFAULT_LOCALE
+from arrow.parser import (
+    DateTimeParser,
+    ParserMatchError,
+    TzinfoParser,
+    _FormatExtractor,
+)
+from arrow.util import validate_bounds
+
+#: The default number of characters or bytes read at a time by :func:`scan`.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_BUFFER_TYPES = (str, bytes, bytearray, mmap.mmap)
+
+#: The number of bytes of a line searched for its timestamp by :func:`seek_range`.
+PROBE_SIZE = 1024
+
+SCAN_SOURCE = Union[str, bytes, bytearray, mmap.mmap, IO[Any], Iterable[Any]]
+SEEK_SOURCE = Union[str, "os.PathLike[str]", bytes, bytearray, mmap.mmap]
+
+
+def scan(
+    source: SCAN_SOURCE,
+    fmt: str,
+    locale: str = DEFAULT_LOCALE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> Iterator[Tuple[int, datetime]]:
+    """Lazily finds every timestamp matching a format in a text source.
+
+    The source is read in chunks of about ``chunk_size`` characters or bytes, each cut
+    after its last newline, so memory use stays flat however large the input is and a
+    timestamp is never split between two chunks. Timestamps spanning several lines are
+    therefore not found. Matches follow the same word boundary rules as
+    :meth:`DateTimeParser.parse <arrow.parser.DateTimeParser.parse>`; those that do not
+    form a valid date, such as ``2021-02-30``, are skipped.
+
+    :param source: a ``str``, a ``bytes``, ``bytearray`` or ``mmap`` buffer, a file object
+        opened in text or binary mode, or an iterable of ``str`` or ``bytes`` lines.
+    :param fmt: the format of the timestamps to find.
+    :param locale: (optional) a ``str`` specifying a locale.  Defaults to 'en-us'.
+    :param chunk_size: (optional) the number of characters or bytes to read at a time.
+    :param encoding: (optional) the ASCII compatible encoding of binary input.  Defaults
+        to 'utf-8'.
+    :returns: an iterator of ``(offset, datetime)`` pairs, where ``offset`` is the position
+        of the match in characters for text input and in bytes for binary input.
+
+    Usage::
+
+        >>> from arrow import logs
+        >>> list(logs.scan(b"started 2021-10-12 14:30\\nstopped 2021-10-12 14:35\\n", "YYYY-MM-DD HH:mm"))
+        [(8, datetime.datetime(2021, 10, 12, 14, 30)), (33, datetime.datetime(2021, 10, 12, 14, 35))]
+
+    """
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer.")
+
+    dt_parser = DateTimeParser(locale)
+
+    try:
+        pattern, extractor = dt_parser._generate_pattern_re(fmt)
+    except re.error as e:
+        raise ParserMatchError(f"Failed to generate regular expression pattern: {e}.")
+
+    return _scan(dt_parser, pattern, extractor, source, chunk_size, encoding)
+
+
+def seek_range(
+    source: SEEK_SOURCE,
+    fmt: str,
+    start: Union[Arrow, datetime],
+    end: Union[Arrow, datetime],
+    bounds: str = "[)",
+    tzinfo: Optional[TZ_EXPR] = None,
+    locale: str = DEFAULT_LOCALE,
+    encoding: str = "utf-8",
+) -> Tuple[int, int]:
+    """Finds the byte range holding the lines of a sorted log between two times.
+
+    The log is memory-mapped and binary searched on byte offsets: each probe moves to the
+    next line start and parses the first timestamp matching ``fmt`` on that line, so a
+    lookup takes O(log n) parses however large the log is. Lines without a timestamp, such
+    as tracebacks, belong to the closest timestamped line before them.
+
+    :param source: the path of a log file, or a ``bytes``, ``bytearray`` or ``mmap`` buffer,
+        sorted by timestamp.
+    :param fmt: the format of the timestamps.
+    :param start: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` for the start
+        of the range.  Naive datetimes are in UTC.
+    :param end: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` for the end of
+        the range.  Naive datetimes are in UTC.
+    :param bounds: (optional) a ``str`` of either '()', '(]', '[)', or '[]' that specifies
+        whether to include or exclude the start and end values, as with
+        :meth:`Arrow.is_between <arrow.arrow.Arrow.is_between>`.  Defaults to '[)'.
+    :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` or tzinfo object
+        replacing the parsed timezone.  Naive timestamps default to UTC.
+    :param locale: (optional) a ``str`` specifying a locale.  Defaults to 'en-us'.
+    :param encoding: (optional) the ASCII compatible encoding of the log.  Defaults to
+        'utf-8'.
+    :returns: a ``(start_offset, end_offset)`` tuple; the lines in range are
+        ``log[start_offset:end_offset]``.
+
+    Usage::
+
+        >>> import arrow
+        >>> from arrow import logs
+        >>> begin, stop = logs.seek_range(
+        ...     'app.log',
+        ...     'YYYY-MM-DD HH:mm:ss',
+        ...     arrow.get(2013, 5, 5, 14),
+        ...     arrow.get(2013, 5, 5, 14, 5),
+        ... )
+        >>> with open('app.log', 'rb') as f:
+        ...     f.seek(begin)
+        ...     lines = f.read(stop - begin).splitlines()
+
+    """
+
+    validate_bounds(bounds)
+
+    dt_parser = DateTimeParser(locale)
+
+    try:
+        pattern, extractor = dt_parser._generate_pattern_re(fmt)
+    except re.error as e:
+        raise ParserMatchError(f"Failed to generate regular expression pattern: {e}.")
+
+    if isinstance(tzinfo, str):
+        tzinfo = TzinfoParser.parse(tzinfo)
+
+    def timestamp(text: str) -> Optional[Arrow]:
+        match = pattern.search(text)
+        if match is None:
+            return None
+
+        dt = _build(dt_parser, extractor, match)
+        if dt is None:
+            return None
+
+        return Arrow.fromdatetime(dt, tzinfo=tzinfo)
+
+    start = _to_arrow(start)
+    end = _to_arrow(end)
+
+    include_start = bounds[0] == "["
+    include_end = bounds[1] == "]"
+
+    def after_start(ts: Arrow) -> bool:
+        return ts >= start if include_start else ts > start
+
+    def after_end(ts: Arrow) -> bool:
+        return ts > end if include_end else ts >= end
+
+    if not isinstance(source, (bytes, bytearray, mmap.mmap)):
+        with open(source, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0, 0
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return _seek_range(buffer, timestamp, after_start, after_end, encoding)
+
+    return _seek_range(source, timestamp, after_start, after_end, encoding)
+
+
+def _to_arrow(value: Union[Arrow, datetime]) -> Arrow:
+    if isinstance(value, Arrow):
+        return value
+
+    if isinstance(value, datetime):
+        return Arrow.fromdatetime(value)
+
+    raise TypeError(f"Can't compare {type(value).__name__!r} to a log timestamp.")
+
+
+def _seek_range(
+    buffer: Union[bytes, bytearray, mmap.mmap],
+    timestamp: Callable[[str], Optional[Arrow]],
+    after_start: Callable[[Arrow], bool],
+    after_end: Callable[[Arrow], bool],
+    encoding: str,
+) -> Tuple[int, int]:
+    size = len(buffer)
+
+    def next_timestamp(position: int) -> Tuple[int, Optional[Arrow]]:
+        """Returns the start and timestamp of the first timestamped line starting at or
+        after ``position``, or ``(size, None)``."""
+
+        if position > 0:
+            # resync to the start of the next line
+            newline = buffer.find(b"\n", position - 1)
+            position = size if newline < 0 else newline + 1
+
+        while position < size:
+            line_end = buffer.find(b"\n", position, position + PROBE_SIZE)
+            if line_end < 0:
+                line_end = min(size, position + PROBE_SIZE)
+
+            ts = timestamp(
+                buffer[position:line_end].decode(encoding, "surrogateescape")
+            )
+            if ts is not None:
+                return position, ts
+
+            newline = buffer.find(b"\n", line_end)
+            position = size if newline < 0 else newline + 1
+
+        return size, None
+
+    def bisect(low: int, predicate: Callable[[Arrow], bool]) -> int:
+        """Returns the start of the first timestamped line at or after ``low`` whose
+        timestamp satisfies ``predicate``, or the size of the buffer."""
+
+        high = size
+        while low < high:
+            middle = (low + high) // 2
+            position, ts = next_timestamp(middle)
+
+            if ts is None or predicate(ts):
+                high = middle
+            else:
+                # timestamps are sorted, so no line up to this one can match
+                low = position + 1
+
+        return next_timestamp(low)[0]
+
+    range_start = bisect(0, after_start)
+    range_end = bisect(range_start, after_end)
+
+    return range_start, range_end
+
+
+def _scan(
+    dt_parser: DateTimeParser,
+    pattern: Pattern[str],
+    extractor: _FormatExtractor,
+    source: SCAN_SOURCE,
+    chunk_size: int,
+    encoding: str,
+) -> Iterator[Tuple[int, datetime]]:
+    offset = 0
+
+    for chunk in _chunks(_blocks(source, chunk_size), chunk_size):
+        if isinstance(chunk, str):
+            for match in pattern.finditer(chunk):
+                dt = _build(dt_parser, extractor, match)
+                if dt is not None:
+                    yield offset + match.start(), dt
+
+        else:
+            text = chunk.decode(encoding, "surrogateescape")
+            # every character is a single byte, so character and byte offsets agree
+            single_byte = len(text) == len(chunk)
+            position = byte_position = 0
+
+            for match in pattern.finditer(text):
+                dt = _build(dt_parser, extractor, match)
+                if dt is None:
+                    continue
+
+                if single_byte:
+                    byte_position = match.start()
+                else:
+                    byte_position += len(
+                        text[position : match.start()].encode(
+                            encoding, "surrogateescape"
+                        )
+                    )
+                    position = match.start()
+
+                yield offset + byte_position, dt
+
+        offset += len(chunk)
+
+
+def _build(
+    dt_parser: DateTimeParser, extractor: _FormatExtractor, match: Match[str]
+) -> Optional[datetime]:
+    try:
+        return dt_parser._build_from_match(extractor, match)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _blocks(source: SCAN_SOURCE, chunk_size: int) -> Iterator[Any]:
+    """Reads a source as a sequence of ``str`` or ``bytes`` blocks."""
+
+    if isinstance(source, _BUFFER_TYPES):
+        for start in range(0, len(source), chunk_size):
+            yield source[start : start + chunk_size]
+
+    elif hasattr(source, "read"):
+        read = source.read
+        block = read(chunk_size)
+        while block:
+            yield block
+            block = read(chunk_size)
+
+    else:
+        yield from source
+
+
+def _chunks(blocks: Iterable[Any], chunk_size: int) -> Iterator[Any]:
+    """Joins blocks into chunks that end after a newline.
+
+    Every chunk but the last holds at least ``chunk_size`` characters or bytes.
+
+    """
+
+    parts: List[Any] = []
+    size = 0
+    empty: Any = None
+    newline: Any = None
+
+    for block in blocks:
+        if empty is None:
+            empty, newline = ("", "\n") if isinstance(block, str) else (b"", b"\n")
+
+        parts.append(block)
+        size += len(block)
+
+        if size >= chunk_size:
+            data = empty.join(parts)
+            cut = data.rfind(newline) + 1
+
+            if cut:
+                yield data[:cut]
+                data = data[cut:]
+
+            parts = [data] if data else []
+            size = len(data)
+
+    if parts:
+        yield empty.join(parts)
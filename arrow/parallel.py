@@ -0,0 +1,291 @@
+"""Parses and formats large batches of datetimes across several processes or threads."""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from datetime import tzinfo as dt_tzinfo
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from dateutil import tz as dateutil_tz
+
+from arrow.arrow import TZ_EXPR, Arrow
+from arrow.constants import DEFAULT_LOCALE
+from arrow.formatter import DateTimeFormatter
+from arrow.parser import DateTimeParser, TzinfoParser
+
+#: The default number of values given to a worker at a time.
+DEFAULT_CHUNK_SIZE = 10_000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dateutil_tz.tzutc())
+_MICROSECOND = timedelta(microseconds=1)
+
+_T = TypeVar("_T")
+
+# per worker process state, set up by _init_worker
+_parser = DateTimeParser(DEFAULT_LOCALE, cache_size=16)
+_tzinfo: dt_tzinfo = dateutil_tz.tzutc()
+
+
+def parse_many(
+    strings: Iterable[str],
+    fmt: Union[str, List[str]],
+    workers: Optional[int] = None,
+    tzinfo: Optional[TZ_EXPR] = None,
+    locale: str = DEFAULT_LOCALE,
+    default: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> "array[int]":
+    """Parses many datetime strings with a format, in parallel.
+
+    The strings are sent in chunks to a pool of worker processes, each of which keeps its
+    own parser and pattern cache. Workers send back compact arrays of epoch microseconds
+    rather than pickled :class:`Arrow <arrow.arrow.Arrow>` objects, and the results are
+    reassembled in input order. Only a few chunks per worker are in flight at a time.
+
+    :param strings: an iterable of datetime strings.
+    :param fmt: the format, or list of formats, of the strings.
+    :param workers: (optional) the number of worker processes.  Defaults to the number of
+        CPUs; with ``1`` the strings are parsed in the calling process.
+    :param tzinfo: (optional) a :ref:`timezone expression <tz-expr>` or tzinfo object for
+        strings without a timezone.  Defaults to UTC.
+    :param locale: (optional) a ``str`` specifying a locale.  Defaults to 'en-us'.
+    :param default: (optional) the value stored for strings that cannot be parsed.  By
+        default a :class:`ParserError <arrow.parser.ParserError>` is raised instead for
+        strings that do not match the format, and a ``ValueError`` for impossible dates
+        such as ``'2013-02-30'``.
+    :param chunk_size: (optional) the number of strings sent to a worker at a time.
+    :returns: an ``array('q')`` of microseconds since the Unix epoch, one per string.
+
+    Usage::
+
+        >>> from arrow import parallel
+        >>> parallel.parse_many(['2021-10-12 14:30', '2021-10-12 14:35'], 'YYYY-MM-DD HH:mm', workers=2)
+        array('q', [1634049000000000, 1634049300000000])
+
+    """
+
+    workers = _validate(workers, chunk_size)
+
+    result: "array[int]" = array("q")
+    chunks = _chunks(strings, chunk_size)
+
+    if workers == 1:
+        # a parser of its own, as the worker state is shared by every calling thread
+        dt_parser = DateTimeParser(locale, cache_size=16)
+        dt_tzinfo = _resolve_tzinfo(tzinfo)
+        for chunk in chunks:
+            result.extend(_parse_strings(chunk, fmt, default, dt_parser, dt_tzinfo))
+        return result
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(locale, tzinfo)
+    ) as executor:
+        for block in _ordered(executor, workers, _parse_chunk, chunks, fmt, default):
+            result.extend(block)
+
+    return result
+
+
+def threaded_parse_many(
+    strings: Iterable[str],
+    fmt: Union[str, List[str]],
+    workers: Optional[int] = None,
+    tzinfo: Optional[TZ_EXPR] = None,
+    locale: str = DEFAULT_LOCALE,
+    default: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> "array[int]":
+    """Thread pool counterpart of :func:`parse_many`.
+
+    All threads share one parser and its pattern cache. On free-threaded builds of Python
+    this scales across cores without the cost of starting processes and copying inputs;
+    with the GIL, threads only overlap while strings are being read.
+
+    Takes the same arguments and returns the same ``array('q')`` of epoch microseconds as
+    :func:`parse_many`.
+
+    """
+
+    workers = _validate(workers, chunk_size)
+
+    dt_parser = DateTimeParser(locale, cache_size=16)
+    dt_tzinfo = _resolve_tzinfo(tzinfo)
+    result: "array[int]" = array("q")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for block in _ordered(
+            executor,
+            workers,
+            _parse_strings,
+            _chunks(strings, chunk_size),
+            fmt,
+            default,
+            dt_parser,
+            dt_tzinfo,
+        ):
+            result.extend(block)
+
+    return result
+
+
+def threaded_format_many(
+    values: Iterable[Union[Arrow, datetime]],
+    fmt: str = "YYYY-MM-DD HH:mm:ssZZ",
+    locale: str = DEFAULT_LOCALE,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[str]:
+    """Formats many :class:`Arrow <arrow.arrow.Arrow>` objects or datetimes with a thread pool.
+
+    All threads share one formatter, and the strings are returned in input order. Each
+    string is the same as returned by :meth:`Arrow.format <arrow.arrow.Arrow.format>`.
+
+    :param values: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects or datetimes.
+    :param fmt: (optional) the format string.  Defaults to 'YYYY-MM-DD HH:mm:ssZZ'.
+    :param locale: (optional) a ``str`` specifying a locale.  Defaults to 'en-us'.
+    :param workers: (optional) the number of threads.  Defaults to the number of CPUs.
+    :param chunk_size: (optional) the number of values given to a thread at a time.
+    :returns: a ``list`` of formatted strings.
+
+    Usage::
+
+        >>> from arrow import parallel
+        >>> parallel.threaded_format_many([arrow.Arrow(2021, 10, 12, 14, 30)], 'YYYY-MM-DD HH:mm')
+        ['2021-10-12 14:30']
+
+    """
+
+    workers = _validate(workers, chunk_size)
+
+    formatter = DateTimeFormatter(locale)
+    result: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for block in _ordered(
+            executor,
+            workers,
+            _format_values,
+            _chunks(values, chunk_size),
+            fmt,
+            formatter,
+        ):
+            result.extend(block)
+
+    return result
+
+
+def _validate(workers: Optional[int], chunk_size: int) -> int:
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("The number of workers must be a positive integer.")
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer.")
+
+    return workers
+
+
+def _ordered(
+    executor: Executor,
+    workers: int,
+    fn: Callable[..., _T],
+    chunks: Iterable[List[Any]],
+    *args: Any,
+) -> Iterator[_T]:
+    """Yields ``fn(chunk, *args)`` for each chunk in order, keeping at most two chunks per
+    worker in flight."""
+
+    pending: Deque["Future[_T]"] = deque()
+
+    for chunk in chunks:
+        pending.append(executor.submit(fn, chunk, *args))
+
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _chunks(values: Iterable[_T], chunk_size: int) -> Iterator[List[_T]]:
+    iterator = iter(values)
+    chunk = list(islice(iterator, chunk_size))
+
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def _init_worker(locale: str, tzinfo: Optional[TZ_EXPR]) -> None:
+    global _parser, _tzinfo
+
+    _parser = DateTimeParser(locale, cache_size=16)
+    _tzinfo = _resolve_tzinfo(tzinfo)
+
+
+def _resolve_tzinfo(tzinfo: Optional[TZ_EXPR]) -> dt_tzinfo:
+    if tzinfo is None:
+        return dateutil_tz.tzutc()
+
+    if isinstance(tzinfo, str):
+        return TzinfoParser.parse(tzinfo)
+
+    return tzinfo
+
+
+def _parse_chunk(
+    strings: List[str], fmt: Union[str, List[str]], default: Optional[int]
+) -> "array[int]":
+    return _parse_strings(strings, fmt, default, _parser, _tzinfo)
+
+
+def _parse_strings(
+    strings: List[str],
+    fmt: Union[str, List[str]],
+    default: Optional[int],
+    dt_parser: DateTimeParser,
+    dt_tzinfo: dt_tzinfo,
+) -> "array[int]":
+    result: "array[int]" = array("q")
+    append = result.append
+
+    for string in strings:
+        if default is None:
+            dt = dt_parser.parse(string, fmt)
+        else:
+            parsed = dt_parser.try_parse(string, fmt)
+            if parsed is None:
+                append(default)
+                continue
+            dt = parsed
+
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=dt_tzinfo)
+
+        append((dt - _EPOCH) // _MICROSECOND)
+
+    return result
+
+
+def _format_values(
+    values: List[Union[Arrow, datetime]], fmt: str, formatter: DateTimeFormatter
+) -> List[str]:
+    return [
+        formatter.format(value.datetime if isinstance(value, Arrow) else value, fmt)
+        for value in values
+    ]
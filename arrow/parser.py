@@ -1,33 +1,32 @@
 """Provides the :class:`Arrow <arrow.parser.DateTimeParser>` class, a better way to parse datetime strings."""
 
 import re
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timedelta
 from datetime import tzinfo as dt_tzinfo
 from functools import lru_cache
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Literal,
     Match,
     Optional,
     Pattern,
-    SupportsFloat,
-    SupportsInt,
     Tuple,
-    TypedDict,
     Union,
     cast,
-    overload,
 )
 
 from dateutil import tz
 
-from arrow import locales
+from arrow import locales, stats, zones
 from arrow.constants import DEFAULT_LOCALE
-from arrow.util import next_weekday, normalize_timestamp
+from arrow.util import iso_to_gregorian, next_weekday, normalize_timestamp
 
 
 class ParserError(ValueError):
@@ -59,8 +58,6 @@ class ParserMatchError(ParserError):
     pass
 
 
-_WEEKDATE_ELEMENT = Union[str, bytes, SupportsInt, bytearray]
-
 _FORMAT_TYPE = Literal[
     "YYYY",
     "YY",
@@ -96,44 +93,85 @@ _FORMAT_TYPE = Literal[
 ]
 
 
-class _Parts(TypedDict, total=False):
+# Positions of the datetime fields in the list filled in by a :class:`_FormatExtractor`.
+(
+    _YEAR,
+    _MONTH,
+    _DAY_OF_YEAR,
+    _DAY,
+    _HOUR,
+    _MINUTE,
+    _SECOND,
+    _MICROSECOND,
+    _TIMESTAMP,
+    _EXPANDED_TIMESTAMP,
+    _TZINFO,
+    _AM_PM,
+    _DAY_OF_WEEK,
+    _WEEKDATE,
+) = range(14)
+
+_FIELD_COUNT = 14
+
+_HOUR_TOKENS = ("HH", "H", "hh", "h")
+
+
+def _parse_two_digit_year(value: str) -> int:
+    year = int(value)
+    return 1900 + year if year > 68 else 2000 + year
+
+
+def _parse_subsecond(value: str) -> int:
+    # We have the *most significant* digits of an arbitrary-precision integer.
+    # We want the six most significant digits as an integer, rounded.
+    # IDEA: add nanosecond support somehow? Need datetime support for it first.
+    value = value.ljust(7, "0")
+
+    # floating-point (IEEE-754) defaults to half-to-even rounding
+    seventh_digit = int(value[6])
+    if seventh_digit == 5:
+        rounding = int(value[5]) % 2
+    elif seventh_digit > 5:
+        rounding = 1
+    else:
+        rounding = 0
+
+    return int(value[:6]) + rounding
+
+
+def _parse_tzinfo(value: str) -> dt_tzinfo:
+    return TzinfoParser.parse(value)
+
+
+class _FormatExtractor:
     """
-    A dictionary that represents different parts of a datetime.
-
-    :class:`_Parts` is a TypedDict that represents various components of a date or time,
-    such as year, month, day, hour, minute, second, microsecond, timestamp, expanded_timestamp, tzinfo,
-    am_pm, day_of_week, and weekdate.
-
-    :ivar year: The year, if present, as an integer.
-    :ivar month: The month, if present, as an integer.
-    :ivar day_of_year: The day of the year, if present, as an integer.
-    :ivar day: The day, if present, as an integer.
-    :ivar hour: The hour, if present, as an integer.
-    :ivar minute: The minute, if present, as an integer.
-    :ivar second: The second, if present, as an integer.
-    :ivar microsecond: The microsecond, if present, as an integer.
-    :ivar timestamp: The timestamp, if present, as a float.
-    :ivar expanded_timestamp: The expanded timestamp, if present, as an integer.
-    :ivar tzinfo: The timezone info, if present, as a :class:`dt_tzinfo` object.
-    :ivar am_pm: The AM/PM indicator, if present, as a string literal "am" or "pm".
-    :ivar day_of_week: The day of the week, if present, as an integer.
-    :ivar weekdate: The week date, if present, as a tuple of three integers or None.
+    Maps the match groups of a format pattern straight to datetime fields.
+
+    An extractor is built once per format, next to its regular expression, so parsing a
+    string does not dispatch on the format tokens again. Each step holds the token, the
+    match groups it reads, the position of the field it sets (``None`` if the token is
+    matched but ignored) and the function converting the matched text.
+
+    :ivar steps: The extraction steps, in the order the tokens appear in the format.
+    :ivar meridian_token: The meridian token, if it follows an hour token in the format.
     """
 
-    year: int
-    month: int
-    day_of_year: int
-    day: int
-    hour: int
-    minute: int
-    second: int
-    microsecond: int
-    timestamp: float
-    expanded_timestamp: int
-    tzinfo: dt_tzinfo
-    am_pm: Literal["am", "pm"]
-    day_of_week: int
-    weekdate: Tuple[_WEEKDATE_ELEMENT, _WEEKDATE_ELEMENT, Optional[_WEEKDATE_ELEMENT]]
+    __slots__ = ("steps", "meridian_token")
+
+    steps: Tuple[
+        Tuple[_FORMAT_TYPE, Tuple[str, ...], Optional[int], Callable[..., Any]], ...
+    ]
+    meridian_token: Optional[_FORMAT_TYPE]
+
+    def __init__(
+        self,
+        steps: Iterable[
+            Tuple[_FORMAT_TYPE, Tuple[str, ...], Optional[int], Callable[..., Any]]
+        ],
+        meridian_token: Optional[_FORMAT_TYPE] = None,
+    ) -> None:
+        self.steps = tuple(steps)
+        self.meridian_token = meridian_token
 
 
 class DateTimeParser:
@@ -142,6 +180,9 @@ class DateTimeParser:
     Contains the regular expressions and functions to parse and split the input strings into tokens and eventually
     produce a datetime that is used by :class:`Arrow <arrow.arrow.Arrow>` internally.
 
+    A parser keeps no state between calls apart from its thread-safe cache, so one
+    instance can be shared between threads.
+
     :param locale: the locale string
     :param cache_size: the size of the LRU cache used for regular expressions. Defaults to 0.
 
@@ -198,6 +239,81 @@ class DateTimeParser:
         "W": _WEEK_DATE_RE,
     }
 
+    # token -> (match groups, field); converters are listed in _TOKEN_CONVERTERS or,
+    # for locale dependent tokens, named in _LOCALE_TOKEN_CONVERTERS
+    _TOKEN_FIELDS: ClassVar[
+        Dict[_FORMAT_TYPE, Tuple[Tuple[str, ...], Optional[int]]]
+    ] = {
+        "YYYY": (("YYYY",), _YEAR),
+        "YY": (("YY",), _YEAR),
+        "MMMM": (("MMMM",), _MONTH),
+        "MMM": (("MMM",), _MONTH),
+        "MM": (("MM",), _MONTH),
+        "M": (("M",), _MONTH),
+        "DDDD": (("DDDD",), _DAY_OF_YEAR),
+        "DDD": (("DDD",), _DAY_OF_YEAR),
+        "DD": (("DD",), _DAY),
+        "D": (("D",), _DAY),
+        "Do": (("value",), _DAY),
+        "dddd": (("dddd",), _DAY_OF_WEEK),
+        "ddd": (("ddd",), _DAY_OF_WEEK),
+        "d": (("d",), None),
+        "HH": (("HH",), _HOUR),
+        "H": (("H",), _HOUR),
+        "hh": (("hh",), _HOUR),
+        "h": (("h",), _HOUR),
+        "mm": (("mm",), _MINUTE),
+        "m": (("m",), _MINUTE),
+        "ss": (("ss",), _SECOND),
+        "s": (("s",), _SECOND),
+        "S": (("S",), _MICROSECOND),
+        "X": (("X",), _TIMESTAMP),
+        "x": (("x",), _EXPANDED_TIMESTAMP),
+        "ZZZ": (("ZZZ",), _TZINFO),
+        "ZZ": (("ZZ",), _TZINFO),
+        "Z": (("Z",), _TZINFO),
+        "a": (("a",), _AM_PM),
+        "A": (("A",), _AM_PM),
+        "W": (("year", "week", "day"), _WEEKDATE),
+    }
+
+    _TOKEN_CONVERTERS: ClassVar[Dict[_FORMAT_TYPE, Callable[..., Any]]] = {
+        "YYYY": int,
+        "YY": _parse_two_digit_year,
+        "MM": int,
+        "M": int,
+        "DDDD": int,
+        "DDD": int,
+        "DD": int,
+        "D": int,
+        "Do": int,
+        "d": int,
+        "HH": int,
+        "H": int,
+        "hh": int,
+        "h": int,
+        "mm": int,
+        "m": int,
+        "ss": int,
+        "s": int,
+        "S": _parse_subsecond,
+        "X": float,
+        "x": int,
+        "ZZZ": _parse_tzinfo,
+        "ZZ": _parse_tzinfo,
+        "Z": _parse_tzinfo,
+        "W": tuple,
+    }
+
+    _LOCALE_TOKEN_CONVERTERS: ClassVar[Dict[_FORMAT_TYPE, str]] = {
+        "MMMM": "_parse_month_name",
+        "MMM": "_parse_month_name",
+        "dddd": "_parse_day_name",
+        "ddd": "_parse_day_abbreviation",
+        "a": "_parse_meridian",
+        "A": "_parse_meridian",
+    }
+
     SEPARATORS: ClassVar[List[str]] = ["-", "/", "."]
 
     locale: locales.Locale
@@ -240,9 +356,25 @@ class DateTimeParser:
             }
         )
         if cache_size > 0:
-            self._generate_pattern_re = lru_cache(maxsize=cache_size)(  # type: ignore
-                self._generate_pattern_re
-            )
+            cached = lru_cache(maxsize=cache_size)(self._generate_pattern_re)
+
+            def generate_pattern_re(
+                fmt: str,
+            ) -> Tuple[Pattern[str], _FormatExtractor]:
+                if not stats._enabled:
+                    return cached(fmt=fmt)
+
+                # approximate when other threads use the same parser
+                misses = cached.cache_info().misses
+                result = cached(fmt=fmt)
+                stats._count(
+                    "pattern_cache_misses"
+                    if cached.cache_info().misses > misses
+                    else "pattern_cache_hits"
+                )
+                return result
+
+            self._generate_pattern_re = generate_pattern_re  # type: ignore
 
     # TODO: since we support more than ISO 8601, we should rename this function
     # IDEA: break into multiple functions
@@ -269,6 +401,57 @@ class DateTimeParser:
         if normalize_whitespace:
             datetime_string = re.sub(r"\s+", " ", datetime_string.strip())
 
+        if stats._enabled:
+            stats._count("iso_parses")
+
+        return self._parse_multiformat(
+            datetime_string, self._generate_iso_formats(datetime_string)
+        )
+
+    def try_parse_iso(
+        self, datetime_string: str, normalize_whitespace: bool = False
+    ) -> Optional[datetime]:
+        """
+        Parses a datetime string using a ISO 8601-like format, without raising on failure.
+
+        :param datetime_string: The datetime string to parse.
+        :param normalize_whitespace: Whether to normalize whitespace in the datetime string (default is False).
+        :type datetime_string: str
+        :type normalize_whitespace: bool
+        :returns: The parsed datetime object, or ``None`` if the string cannot be parsed.
+        :rtype: Optional[datetime]
+
+        Usage::
+        >>> import arrow.parser
+        >>> arrow.parser.DateTimeParser().try_parse_iso('2021-10-12T14:30:00')
+        datetime.datetime(2021, 10, 12, 14, 30)
+        >>> arrow.parser.DateTimeParser().try_parse_iso('not a date') is None
+        True
+
+        """
+        if normalize_whitespace:
+            datetime_string = re.sub(r"\s+", " ", datetime_string.strip())
+
+        if stats._enabled:
+            stats._count("iso_parses")
+
+        try:
+            formats = self._generate_iso_formats(datetime_string)
+        except ParserError:
+            return None
+
+        return self._try_parse_formats(datetime_string, formats)
+
+    def _generate_iso_formats(self, datetime_string: str) -> List[str]:
+        """
+        Generates the list of candidate formats for an ISO 8601-like datetime string.
+
+        :param datetime_string: The datetime string to inspect.
+        :type datetime_string: str
+        :returns: The format strings to try, in order.
+        :rtype: List[str]
+        :raises ParserError: If the string cannot be in a valid ISO 8601-like format.
+        """
         has_space_divider = " " in datetime_string
         has_t_divider = "T" in datetime_string
 
@@ -365,7 +548,7 @@ class DateTimeParser:
             # _parse_token() that a timezone needs to be parsed
             formats = [f"{f}{tz_format}" for f in formats]
 
-        return self._parse_multiformat(datetime_string, formats)
+        return formats
 
     def parse(
         self,
@@ -401,9 +584,9 @@ class DateTimeParser:
             return self._parse_multiformat(datetime_string, fmt)
 
         try:
-            fmt_tokens: List[_FORMAT_TYPE]
             fmt_pattern_re: Pattern[str]
-            fmt_tokens, fmt_pattern_re = self._generate_pattern_re(fmt)
+            extractor: _FormatExtractor
+            fmt_pattern_re, extractor = self._generate_pattern_re(fmt)
         except re.error as e:
             raise ParserMatchError(
                 f"Failed to generate regular expression pattern: {e}."
@@ -416,40 +599,163 @@ class DateTimeParser:
                 f"Failed to match {fmt!r} when parsing {datetime_string!r}."
             )
 
-        parts: _Parts = {}
-        for token in fmt_tokens:
-            value: Union[Tuple[str, str, str], str]
-            if token == "Do":
-                value = match.group("value")
-            elif token == "W":
-                value = (match.group("year"), match.group("week"), match.group("day"))
-            else:
-                value = match.group(token)
+        return self._build_from_match(extractor, match)
+
+    def try_parse(
+        self,
+        datetime_string: str,
+        fmt: Union[List[str], str],
+        normalize_whitespace: bool = False,
+    ) -> Optional[datetime]:
+        """
+        Parses a datetime string using a specified format, without raising on failure.
+
+        Intended for validation-heavy workloads where most inputs do not match: no
+        exception is raised and caught for a failed candidate format.
+
+        :param datetime_string: The datetime string to parse.
+        :param fmt: The format string or list of format strings to use for parsing.
+        :param normalize_whitespace: Whether to normalize whitespace in the datetime string (default is False).
+        :type datetime_string: str
+        :type fmt: Union[List[str], str]
+        :type normalize_whitespace: bool
+        :returns: The parsed datetime object, or ``None`` if the string cannot be parsed.
+        :rtype: Optional[datetime]
+
+        Usage::
+
+        >>> import arrow.parser
+        >>> arrow.parser.DateTimeParser().try_parse('2021-10-12', ['MM/DD/YYYY', 'YYYY-MM-DD'])
+        datetime.datetime(2021, 10, 12, 0, 0)
+        >>> arrow.parser.DateTimeParser().try_parse('2021-10-12', 'MM/DD/YYYY') is None
+        True
+
+        """
+        if normalize_whitespace:
+            datetime_string = re.sub(r"\s+", " ", datetime_string)
+
+        return self._try_parse_formats(
+            datetime_string, fmt if isinstance(fmt, list) else [fmt]
+        )
+
+    def _try_parse_formats(
+        self, datetime_string: str, formats: Iterable[str]
+    ) -> Optional[datetime]:
+        """
+        Parses a datetime string with the first matching format, returning ``None`` if the
+        string cannot be parsed with any of them.
+
+        Unlike :meth:`_parse_multiformat`, errors raised after a successful match (such as an
+        invalid day of year or an out-of-range field) also result in ``None``.
+        """
+        fallbacks = 0
+
+        try:
+            for fmt in formats:
+                _datetime = self._try_parse(datetime_string, fmt)
+                if _datetime is not None:
+                    if fallbacks and stats._enabled:
+                        stats._count("format_fallbacks", fallbacks)
+                    return _datetime
+                fallbacks += 1
+        except (ValueError, OverflowError):
+            pass
+
+        return None
+
+    def _try_parse(self, datetime_string: str, fmt: str) -> Optional[datetime]:
+        """
+        Non-raising counterpart of :meth:`parse` for a single format.
+
+        Returns ``None`` wherever :meth:`parse` would raise a :class:`ParserMatchError`, so
+        that the multi-format and ISO paths do not pay for an exception per failed
+        candidate. Any other error is propagated unchanged.
+
+        :param datetime_string: The datetime string to parse.
+        :param fmt: The format string to use for parsing.
+        :type datetime_string: str
+        :type fmt: str
+        :returns: The parsed datetime object, or ``None`` if the format does not match.
+        :rtype: Optional[datetime]
+        """
+        try:
+            fmt_pattern_re: Pattern[str]
+            extractor: _FormatExtractor
+            fmt_pattern_re, extractor = self._generate_pattern_re(fmt)
+        except re.error:
+            return None
+
+        match = fmt_pattern_re.search(datetime_string)
+
+        if match is None:
+            return None
+
+        try:
+            return self._build_from_match(extractor, match)
+        except ParserMatchError:
+            return None
+
+    def _build_from_match(
+        self, extractor: _FormatExtractor, match: Match[str]
+    ) -> datetime:
+        """
+        Builds a datetime from the groups of a successful format pattern match.
+
+        :param extractor: The extractor generated for the format alongside its pattern.
+        :param match: The match object returned by the format pattern.
+        :type extractor: _FormatExtractor
+        :type match: Match[str]
+        :returns: The parsed datetime object.
+        :rtype: datetime
+        :raises ParserMatchError: If a token has no match group or an invalid value.
+        """
+        fields: List[Any] = [None] * _FIELD_COUNT
+        group = match.group
+
+        for token, groups, field, convert in extractor.steps:
+            value = group(*groups)
 
             if value is None:
                 raise ParserMatchError(
                     f"Unable to find a match group for the specified token {token!r}."
                 )
 
-            self._parse_token(token, value, parts)  # type: ignore[arg-type]
+            if field is not None:
+                fields[field] = convert(value)
+
+        if extractor.meridian_token is not None and fields[_AM_PM] == "am":
+            hour = fields[_HOUR]
+            if hour is not None and not 0 <= hour <= 12:
+                raise ParserMatchError(
+                    f"Hour token value must be between 0 and 12 inclusive for token {extractor.meridian_token!r}."
+                )
 
-        return self._build_datetime(parts)
+        return self._build_datetime(fields)
 
-    def _generate_pattern_re(self, fmt: str) -> Tuple[List[_FORMAT_TYPE], Pattern[str]]:
+    def _generate_pattern_re(self, fmt: str) -> Tuple[Pattern[str], _FormatExtractor]:
         """
-        Generates a regular expression pattern from a format string.
+        Generates a regular expression pattern and its field extractor from a format string.
 
         :param fmt: The format string to convert into a regular expression pattern.
         :type fmt: str
-        :returns: A tuple containing a list of format tokens and the corresponding regular expression pattern.
-        :rtype: Tuple[List[_FORMAT_TYPE], Pattern[str]]
+        :returns: A tuple containing the regular expression pattern and the extractor mapping its groups to datetime fields.
+        :rtype: Tuple[Pattern[str], _FormatExtractor]
         :raises ParserError: If an unrecognized token is encountered in the format string.
         """
+        if stats._enabled:
+            return stats._timed("pattern_compile", self._compile_pattern_re, fmt)
+
+        return self._compile_pattern_re(fmt)
+
+    def _compile_pattern_re(self, fmt: str) -> Tuple[Pattern[str], _FormatExtractor]:
+        """Does the work of :meth:`_generate_pattern_re`, which adds the statistics."""
         # fmt is a string of tokens like 'YYYY-MM-DD'
         # we construct a new string by replacing each
         # token by its pattern:
         # 'YYYY-MM-DD' -> '(?P<YYYY>\d{4})-(?P<MM>\d{2})-(?P<DD>\d{2})'
-        tokens: List[_FORMAT_TYPE] = []
+        steps = []
+        meridian_token: Optional[_FORMAT_TYPE] = None
+        has_hour = False
         offset = 0
 
         # Escape all special RegEx chars
@@ -473,7 +779,11 @@ class DateTimeParser:
             except KeyError:
                 raise ParserError(f"Unrecognized token {token!r}.")
             input_pattern = f"(?P<{token}>{input_re.pattern})"
-            tokens.append(token)
+            steps.append((token, *self._TOKEN_FIELDS[token], self._converter(token)))
+            if token in _HOUR_TOKENS:
+                has_hour = True
+            elif token in ("a", "A") and has_hour and meridian_token is None:
+                meridian_token = token
             # a pattern doesn't have the same length as the token
             # it replaces! We keep the difference in the offset variable.
             # This works because the string is scanned left-to-right and matches
@@ -524,190 +834,65 @@ class DateTimeParser:
             starting_word_boundary, final_fmt_pattern, ending_word_boundary
         )
 
-        return tokens, re.compile(bounded_fmt_pattern, flags=re.IGNORECASE)
-
-    @overload
-    def _parse_token(
-        self,
-        token: Literal[
-            "YYYY",
-            "YY",
-            "MM",
-            "M",
-            "DDDD",
-            "DDD",
-            "DD",
-            "D",
-            "Do",
-            "HH",
-            "hh",
-            "h",
-            "H",
-            "mm",
-            "m",
-            "ss",
-            "s",
-            "x",
-        ],
-        value: Union[str, bytes, SupportsInt, bytearray],
-        parts: _Parts,
-    ) -> None:
-        ...  # pragma: no cover
-
-    @overload
-    def _parse_token(
-        self,
-        token: Literal["X"],
-        value: Union[str, bytes, SupportsFloat, bytearray],
-        parts: _Parts,
-    ) -> None:
-        ...  # pragma: no cover
-
-    @overload
-    def _parse_token(
-        self,
-        token: Literal["MMMM", "MMM", "dddd", "ddd", "S"],
-        value: Union[str, bytes, bytearray],
-        parts: _Parts,
-    ) -> None:
-        ...  # pragma: no cover
-
-    @overload
-    def _parse_token(
-        self,
-        token: Literal["a", "A", "ZZZ", "ZZ", "Z"],
-        value: Union[str, bytes],
-        parts: _Parts,
-    ) -> None:
-        ...  # pragma: no cover
-
-    @overload
-    def _parse_token(
-        self,
-        token: Literal["W"],
-        value: Tuple[_WEEKDATE_ELEMENT, _WEEKDATE_ELEMENT, Optional[_WEEKDATE_ELEMENT]],
-        parts: _Parts,
-    ) -> None:
-        ...  # pragma: no cover
+        return (
+            re.compile(bounded_fmt_pattern, flags=re.IGNORECASE),
+            _FormatExtractor(steps, meridian_token),
+        )
 
-    def _parse_token(
-        self,
-        token: Any,
-        value: Any,
-        parts: _Parts,
-    ) -> None:
+    def _converter(self, token: _FORMAT_TYPE) -> Callable[..., Any]:
         """
-        Parse a token and its value, and update the `_Parts` dictionary with the parsed values.
-
-        The function supports several tokens, including "YYYY", "YY", "MMMM", "MMM", "MM", "M", "DDDD", "DDD", "DD", "D", "Do", "dddd", "ddd", "HH", "H", "mm", "m", "ss", "s", "S", "X", "x", "ZZZ", "ZZ", "Z", "a", "A", and "W". Each token is matched and the corresponding value is parsed and added to the `_Parts` dictionary.
-
-        :param token: The token to parse.
-        :type token: Any
-        :param value: The value of the token.
-        :type value: Any
-        :param parts: A dictionary to update with the parsed values.
-        :type parts: _Parts
-        :raises ParserMatchError: If the hour token value is not between 0 and 12 inclusive for tokens "a" or "A".
+        Returns the function converting the text matched by a token into its field value.
 
+        :param token: The format token.
+        :type token: _FORMAT_TYPE
+        :returns: The converter for the token.
+        :rtype: Callable
         """
-        if token == "YYYY":
-            parts["year"] = int(value)
-
-        elif token == "YY":
-            value = int(value)
-            parts["year"] = 1900 + value if value > 68 else 2000 + value
-
-        elif token in ["MMMM", "MMM"]:
-            # FIXME: month_number() is nullable
-            parts["month"] = self.locale.month_number(value.lower())  # type: ignore[typeddict-item]
+        converter = self._TOKEN_CONVERTERS.get(token)
 
-        elif token in ["MM", "M"]:
-            parts["month"] = int(value)
+        if converter is None:
+            converter = getattr(self, self._LOCALE_TOKEN_CONVERTERS[token])
 
-        elif token in ["DDDD", "DDD"]:
-            parts["day_of_year"] = int(value)
+        return converter
 
-        elif token in ["DD", "D"]:
-            parts["day"] = int(value)
+    def _parse_month_name(self, value: str) -> Optional[int]:
+        return self.locale.month_number(value.lower())
 
-        elif token == "Do":
-            parts["day"] = int(value)
+    def _parse_day_name(self, value: str) -> int:
+        # locale day names are 1-indexed
+        return [x.lower() for x in self.locale.day_names].index(value.lower()) - 1
 
-        elif token == "dddd":
-            # locale day names are 1-indexed
-            day_of_week = [x.lower() for x in self.locale.day_names].index(
-                value.lower()
-            )
-            parts["day_of_week"] = day_of_week - 1
-
-        elif token == "ddd":
-            # locale day abbreviations are 1-indexed
-            day_of_week = [x.lower() for x in self.locale.day_abbreviations].index(
-                value.lower()
-            )
-            parts["day_of_week"] = day_of_week - 1
-
-        elif token.upper() in ["HH", "H"]:
-            parts["hour"] = int(value)
-
-        elif token in ["mm", "m"]:
-            parts["minute"] = int(value)
-
-        elif token in ["ss", "s"]:
-            parts["second"] = int(value)
-
-        elif token == "S":
-            # We have the *most significant* digits of an arbitrary-precision integer.
-            # We want the six most significant digits as an integer, rounded.
-            # IDEA: add nanosecond support somehow? Need datetime support for it first.
-            value = value.ljust(7, "0")
-
-            # floating-point (IEEE-754) defaults to half-to-even rounding
-            seventh_digit = int(value[6])
-            if seventh_digit == 5:
-                rounding = int(value[5]) % 2
-            elif seventh_digit > 5:
-                rounding = 1
-            else:
-                rounding = 0
-
-            parts["microsecond"] = int(value[:6]) + rounding
-
-        elif token == "X":
-            parts["timestamp"] = float(value)
-
-        elif token == "x":
-            parts["expanded_timestamp"] = int(value)
+    def _parse_day_abbreviation(self, value: str) -> int:
+        # locale day abbreviations are 1-indexed
+        return [x.lower() for x in self.locale.day_abbreviations].index(
+            value.lower()
+        ) - 1
 
-        elif token in ["ZZZ", "ZZ", "Z"]:
-            parts["tzinfo"] = TzinfoParser.parse(value)
-
-        elif token in ["a", "A"]:
-            if value in (self.locale.meridians["am"], self.locale.meridians["AM"]):
-                parts["am_pm"] = "am"
-                if "hour" in parts and not 0 <= parts["hour"] <= 12:
-                    raise ParserMatchError(
-                        f"Hour token value must be between 0 and 12 inclusive for token {token!r}."
-                    )
-            elif value in (self.locale.meridians["pm"], self.locale.meridians["PM"]):
-                parts["am_pm"] = "pm"
-        elif token == "W":
-            parts["weekdate"] = value
+    def _parse_meridian(self, value: str) -> Optional[str]:
+        if value in (self.locale.meridians["am"], self.locale.meridians["AM"]):
+            return "am"
+        elif value in (self.locale.meridians["pm"], self.locale.meridians["PM"]):
+            return "pm"
+        return None
 
     @staticmethod
-    def _build_datetime(parts: _Parts) -> datetime:
+    def _build_datetime(fields: List[Any]) -> datetime:
         """
-        Build a datetime object from a dictionary of date parts.
+        Build a datetime object from the fields extracted from a date string.
 
-        :param parts: A dictionary containing the date parts extracted from a date string.
-        :type parts: dict
+        :param fields: The field values, indexed by field position; ``None`` marks a missing field.
+        :type fields: list
         :return: A datetime object representing the date and time.
         :rtype: datetime.datetime
         """
-        weekdate = parts.get("weekdate")
+        year: Optional[int] = fields[_YEAR]
+        month: Optional[int] = fields[_MONTH]
+        day: Optional[int] = fields[_DAY]
+
+        weekdate = fields[_WEEKDATE]
 
         if weekdate is not None:
-            year, week = int(weekdate[0]), int(weekdate[1])
+            week_year, week = int(weekdate[0]), int(weekdate[1])
 
             if weekdate[2] is not None:
                 _day = int(weekdate[2])
@@ -715,21 +900,21 @@ class DateTimeParser:
                 # day not given, default to 1
                 _day = 1
 
-            date_string = f"{year}-{week}-{_day}"
-
-            #  tokens for ISO 8601 weekdates
-            dt = datetime.strptime(date_string, "%G-%V-%u")
+            try:
+                week_date = iso_to_gregorian(week_year, week, _day)
+            except OverflowError:
+                raise ParserError(
+                    f"The provided week date {week_year}-W{week:02d}-{_day} is out of range."
+                )
 
-            parts["year"] = dt.year
-            parts["month"] = dt.month
-            parts["day"] = dt.day
+            year, month, day = week_date.year, week_date.month, week_date.day
 
-        timestamp = parts.get("timestamp")
+        timestamp: Optional[float] = fields[_TIMESTAMP]
 
         if timestamp is not None:
             return datetime.fromtimestamp(timestamp, tz=tz.tzutc())
 
-        expanded_timestamp = parts.get("expanded_timestamp")
+        expanded_timestamp: Optional[int] = fields[_EXPANDED_TIMESTAMP]
 
         if expanded_timestamp is not None:
             return datetime.fromtimestamp(
@@ -737,12 +922,10 @@ class DateTimeParser:
                 tz=tz.tzutc(),
             )
 
-        day_of_year = parts.get("day_of_year")
+        day_of_year: Optional[int] = fields[_DAY_OF_YEAR]
 
         if day_of_year is not None:
-            _year = parts.get("year")
-            month = parts.get("month")
-            if _year is None:
+            if year is None:
                 raise ParserError(
                     "Year component is required with the DDD and DDDD tokens."
                 )
@@ -752,38 +935,45 @@ class DateTimeParser:
                     "Month component is not allowed with the DDD and DDDD tokens."
                 )
 
-            date_string = f"{_year}-{day_of_year}"
-            try:
-                dt = datetime.strptime(date_string, "%Y-%j")
-            except ValueError:
+            ordinal_date: Optional[date] = None
+            if 1 <= day_of_year <= 366:
+                try:
+                    ordinal_date = date.fromordinal(
+                        date(year, 1, 1).toordinal() + day_of_year - 1
+                    )
+                except ValueError:
+                    pass
+
+            if ordinal_date is None:
                 raise ParserError(
                     f"The provided day of year {day_of_year!r} is invalid."
                 )
 
-            parts["year"] = dt.year
-            parts["month"] = dt.month
-            parts["day"] = dt.day
+            year, month, day = ordinal_date.year, ordinal_date.month, ordinal_date.day
 
-        day_of_week: Optional[int] = parts.get("day_of_week")
-        day = parts.get("day")
+        day_of_week: Optional[int] = fields[_DAY_OF_WEEK]
 
         # If day is passed, ignore day of week
         if day_of_week is not None and day is None:
-            year = parts.get("year", 1970)
-            month = parts.get("month", 1)
-            day = 1
-
             # dddd => first day of week after epoch
             # dddd YYYY => first day of week in specified year
             # dddd MM YYYY => first day of week in specified year and month
             # dddd MM => first day after epoch in specified month
-            next_weekday_dt = next_weekday(datetime(year, month, day), day_of_week)
-            parts["year"] = next_weekday_dt.year
-            parts["month"] = next_weekday_dt.month
-            parts["day"] = next_weekday_dt.day
+            next_weekday_dt = next_weekday(
+                datetime(
+                    1970 if year is None else year, 1 if month is None else month, 1
+                ),
+                day_of_week,
+            )
+            year = next_weekday_dt.year
+            month = next_weekday_dt.month
+            day = next_weekday_dt.day
 
-        am_pm = parts.get("am_pm")
-        hour = parts.get("hour", 0)
+        am_pm: Optional[str] = fields[_AM_PM]
+        hour: int = fields[_HOUR] or 0
+        minute: int = fields[_MINUTE] or 0
+        second: int = fields[_SECOND] or 0
+        microsecond: int = fields[_MICROSECOND] or 0
 
         if am_pm == "pm" and hour < 12:
             hour += 12
@@ -792,11 +982,11 @@ class DateTimeParser:
 
         # Support for midnight at the end of day
         if hour == 24:
-            if parts.get("minute", 0) != 0:
+            if minute != 0:
                 raise ParserError("Midnight at the end of day must not contain minutes")
-            if parts.get("second", 0) != 0:
+            if second != 0:
                 raise ParserError("Midnight at the end of day must not contain seconds")
-            if parts.get("microsecond", 0) != 0:
+            if microsecond != 0:
                 raise ParserError(
                     "Midnight at the end of day must not contain microseconds"
                 )
@@ -806,29 +996,28 @@ class DateTimeParser:
             day_increment = 0
 
         # account for rounding up to 1000000
-        microsecond = parts.get("microsecond", 0)
         if microsecond == 1000000:
             microsecond = 0
             second_increment = 1
         else:
             second_increment = 0
 
-        increment = timedelta(days=day_increment, seconds=second_increment)
-
-        return (
-            datetime(
-                year=parts.get("year", 1),
-                month=parts.get("month", 1),
-                day=parts.get("day", 1),
-                hour=hour,
-                minute=parts.get("minute", 0),
-                second=parts.get("second", 0),
-                microsecond=microsecond,
-                tzinfo=parts.get("tzinfo"),
-            )
-            + increment
+        dt = datetime(
+            year=1 if year is None else year,
+            month=1 if month is None else month,
+            day=1 if day is None else day,
+            hour=hour,
+            minute=minute,
+            second=second,
+            microsecond=microsecond,
+            tzinfo=fields[_TZINFO],
         )
 
+        if day_increment or second_increment:
+            dt += timedelta(days=day_increment, seconds=second_increment)
+
+        return dt
+
     def _parse_multiformat(self, string: str, formats: Iterable[str]) -> datetime:
         """
         Parse a date and time string using multiple formats.
@@ -846,22 +1035,30 @@ class DateTimeParser:
         :raises ParserError: If no format matches the input string.
         """
         _datetime: Optional[datetime] = None
+        fallbacks = 0
 
         for fmt in formats:
-            try:
-                _datetime = self.parse(string, fmt)
+            _datetime = self._try_parse(string, fmt)
+            if _datetime is not None:
                 break
-            except ParserMatchError:
-                pass
+            fallbacks += 1
 
         if _datetime is None:
-            supported_formats = ", ".join(formats)
-            raise ParserError(
-                f"Could not match input {string!r} to any of the following formats: {supported_formats}."
-            )
+            raise self._multiformat_error(string, formats)
+
+        if fallbacks and stats._enabled:
+            stats._count("format_fallbacks", fallbacks)
 
         return _datetime
 
+    @staticmethod
+    def _multiformat_error(string: str, formats: Iterable[str]) -> ParserError:
+        """Build the error raised when no format in a list matches the input string."""
+        supported_formats = ", ".join(formats)
+        return ParserError(
+            f"Could not match input {string!r} to any of the following formats: {supported_formats}."
+        )
+
     # generates a capture group of choices separated by an OR operator
     @staticmethod
     def _generate_choice_re(
@@ -884,6 +1081,233 @@ class DateTimeParser:
         return re.compile(r"({})".format("|".join(choices)), flags=flags)
 
 
+class _FormatPlan:
+    """The compiled patterns of a list of formats parsed by
+    :class:`AdaptiveDateTimeParser`, and the position of the format it tries first.
+
+    Each entry holds the pattern and extractor of a format and the separators every match
+    of it contains, or is ``None`` if the format is not a valid regular expression, so
+    that a format whose separators are missing from a string is known not to match it
+    without a search.
+
+    :ivar entries: The entries, in the order of the formats.
+    :ivar hot: The position of the format with the most hits.
+    """
+
+    __slots__ = ("entries", "hot")
+
+    entries: Tuple[Optional[Tuple[Pattern[str], _FormatExtractor, str]], ...]
+    hot: int
+
+    def __init__(
+        self,
+        entries: Iterable[Optional[Tuple[Pattern[str], _FormatExtractor, str]]],
+    ) -> None:
+        self.entries = tuple(entries)
+        self.hot = 0
+
+
+class AdaptiveDateTimeParser(DateTimeParser):
+    """A :class:`DateTimeParser <arrow.parser.DateTimeParser>` that learns which formats
+    match most often when parsing with a list of formats.
+
+    Real-world inputs tend to be dominated by one or two formats, so the format of a list
+    with the most hits is tried first, with ties broken by position in the list given by
+    the caller. Before its match is accepted, every format listed ahead of it is checked
+    against the input, which is cheap for formats with separators the input lacks; if any
+    of them could also match, parsing falls back to the caller's order. The result is
+    therefore always the same as with :class:`DateTimeParser <arrow.parser.DateTimeParser>`,
+    and a parser can be shared between threads.
+
+    The patterns of each format list are compiled once, so lists holding an unrecognized
+    token are parsed as by :class:`DateTimeParser <arrow.parser.DateTimeParser>`, without
+    adaptive ordering or statistics.
+
+    :param locale: the locale string
+    :param cache_size: the size of the LRU cache used for regular expressions. Defaults to 64.
+
+    Usage::
+
+        >>> from arrow.parser import AdaptiveDateTimeParser
+        >>> p = AdaptiveDateTimeParser()
+        >>> p.parse('2021-10-12 14:30', ['MM/DD/YYYY', 'YYYY-MM-DD HH:mm'])
+        datetime.datetime(2021, 10, 12, 14, 30)
+        >>> p.stats()
+        {'hits': {'YYYY-MM-DD HH:mm': 1}, 'fallbacks': 0, 'misses': 0}
+
+    """
+
+    # punctuation outside of tokens is matched literally, unlike letters, which ignore case
+    _SEPARATORS: ClassVar[FrozenSet[str]] = frozenset(
+        " !\"$%&'()*+,-./:;<=>?@\\^_`{|}~"
+    )
+    _PLANS_SIZE: ClassVar[int] = 64
+
+    _hits: Dict[str, int]
+    _fallbacks: int
+    _misses: int
+    _stats_lock: threading.Lock
+    _plans: Dict[Tuple[str, ...], Optional[_FormatPlan]]
+
+    def __init__(self, locale: str = DEFAULT_LOCALE, cache_size: int = 64) -> None:
+        super().__init__(locale, cache_size)
+        self._stats_lock = threading.Lock()
+        self._plans = {}
+        self.reset_stats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the adaptive ordering counters.
+
+        ``hits`` maps each format to the number of inputs it parsed, ``fallbacks`` counts
+        inputs that had to be parsed in the caller's order because several formats could
+        match them, and ``misses`` counts inputs that matched no format at all.
+
+        """
+
+        with self._stats_lock:
+            return {
+                "hits": dict(self._hits),
+                "fallbacks": self._fallbacks,
+                "misses": self._misses,
+            }
+
+    def reset_stats(self) -> None:
+        """Clears the hit counters, restoring the caller's order for every format list."""
+
+        with self._stats_lock:
+            self._hits = {}
+            self._fallbacks = 0
+            self._misses = 0
+            self._plans = {}
+
+    def _parse_multiformat(self, string: str, formats: Iterable[str]) -> datetime:
+        formats = tuple(formats)
+        plan = self._plan(formats)
+
+        if plan is None:
+            return super()._parse_multiformat(string, formats)
+
+        entries = plan.entries
+        hot = plan.hot
+        entry = entries[hot]
+        match: Optional[Match[str]] = None
+
+        if entry is not None:
+            match = entry[0].search(string)
+
+            if match is not None:
+                if not hot or self._unmatched_before(string, entries, hot):
+                    try:
+                        _datetime = self._build_from_match(entry[1], match)
+                    except ParserMatchError:
+                        pass
+                    else:
+                        self._record_hit(plan, formats, hot)
+                        return _datetime
+
+                with self._stats_lock:
+                    self._fallbacks += 1
+
+        # the format tried first is only searched again if it matched but was not usable
+        skipped = hot if match is None else -1
+
+        for index, entry in enumerate(entries):
+            if entry is None or index == skipped:
+                continue
+
+            match = entry[0].search(string)
+
+            if match is None:
+                continue
+
+            try:
+                _datetime = self._build_from_match(entry[1], match)
+            except ParserMatchError:
+                continue
+
+            self._record_hit(plan, formats, index)
+            return _datetime
+
+        with self._stats_lock:
+            self._misses += 1
+
+        raise self._multiformat_error(string, formats)
+
+    def _plan(self, formats: Tuple[str, ...]) -> Optional[_FormatPlan]:
+        """Returns the plan of a format list, or ``None`` if a format holds an
+        unrecognized token."""
+
+        try:
+            return self._plans[formats]
+        except KeyError:
+            pass
+
+        entries: List[Optional[Tuple[Pattern[str], _FormatExtractor, str]]] = []
+        plan: Optional[_FormatPlan] = None
+
+        try:
+            for fmt in formats:
+                try:
+                    pattern, extractor = self._generate_pattern_re(fmt)
+                except re.error:
+                    entries.append(None)
+                    continue
+
+                literals = self._FORMAT_RE.sub("", self._ESCAPE_RE.sub("", fmt))
+                separators = "".join(sorted(set(literals) & self._SEPARATORS))
+                entries.append((pattern, extractor, separators))
+
+            plan = _FormatPlan(entries)
+        except ParserError:
+            pass
+
+        # threads racing here at worst build a plan twice
+        if len(self._plans) >= self._PLANS_SIZE:
+            self._plans.clear()
+        self._plans[formats] = plan
+
+        return plan
+
+    @staticmethod
+    def _unmatched_before(
+        string: str,
+        entries: Tuple[Optional[Tuple[Pattern[str], _FormatExtractor, str]], ...],
+        index: int,
+    ) -> bool:
+        """Returns whether no format listed before a position can match a string."""
+
+        for entry in entries[:index]:
+            if entry is None:
+                continue
+
+            pattern, _, separators = entry
+
+            for separator in separators:
+                if separator not in string:
+                    break
+            else:
+                if pattern.search(string) is not None:
+                    return False
+
+        return True
+
+    def _record_hit(
+        self, plan: _FormatPlan, formats: Tuple[str, ...], index: int
+    ) -> None:
+        with self._stats_lock:
+            fmt = formats[index]
+            hits = self._hits.get(fmt, 0) + 1
+            self._hits[fmt] = hits
+
+            hot = plan.hot
+
+            if index != hot:
+                hot_hits = self._hits.get(formats[hot], 0)
+
+                if hits > hot_hits or (hits == hot_hits and index < hot):
+                    plan.hot = index
+
+
 class TzinfoParser:
     """
     Parser for timezone information.
@@ -906,10 +1330,13 @@ class TzinfoParser:
         """
         tzinfo: Optional[dt_tzinfo] = None
 
+        path = "local"
+
         if tzinfo_string == "local":
-            tzinfo = tz.tzlocal()
+            tzinfo = zones.local()
 
         elif tzinfo_string in ["utc", "UTC", "Z"]:
+            path = "utc"
             tzinfo = tz.tzutc()
 
         else:
@@ -925,12 +1352,17 @@ class TzinfoParser:
                 if sign == "-":
                     seconds *= -1
 
+                path = "offset"
                 tzinfo = tz.tzoffset(None, seconds)
 
             else:
-                tzinfo = tz.gettz(tzinfo_string)
+                path = "named"
+                tzinfo = zones.gettz(tzinfo_string)
 
         if tzinfo is None:
             raise ParserError(f"Could not parse timezone expression {tzinfo_string!r}.")
 
+        if stats._enabled:
+            stats._count(f"tz_parses_{path}")
+
         return tzinfo
@@ -0,0 +1,522 @@
+"""Groups and checks streams of timestamped items against the spans of a time frame."""
+
+from datetime import datetime, timedelta
+from datetime import tzinfo as dt_tzinfo
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from dateutil.relativedelta import relativedelta
+
+from arrow import util, zones
+from arrow.arrow import _T_FRAMES, TZ_EXPR, Arrow
+
+MOMENT = Union[Arrow, datetime]
+SERIES = Iterable[Tuple[MOMENT, Any]]
+
+_DAY = 86_400_000_000
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# the length in microseconds of the frames that never vary in a fixed offset timezone
+_FIXED_FRAMES: Dict[str, int] = {
+    "microsecond": 1,
+    "second": 1_000_000,
+    "minute": 60_000_000,
+    "hour": 3_600_000_000,
+    "day": _DAY,
+    "week": 7 * _DAY,
+}
+
+
+def _mean(values: List[Any]) -> Any:
+    return sum(values) / len(values)
+
+
+# the named reductions of the values of a span
+_HOW: Dict[str, Callable[[List[Any]], Any]] = {
+    "first": itemgetter(0),
+    "last": itemgetter(-1),
+    "mean": _mean,
+    "count": len,
+    "sum": sum,
+    "min": min,
+    "max": max,
+}
+
+
+def bucketize(
+    iterable: Iterable[Any],
+    frame: _T_FRAMES,
+    key: Optional[Callable[[Any], MOMENT]] = None,
+    week_start: int = 1,
+    tz: Optional[TZ_EXPR] = None,
+    aggregate: Optional[Callable[[List[Any]], Any]] = None,
+    ordered: bool = True,
+) -> Iterator[Tuple[Arrow, Any]]:
+    """Lazily groups timestamped items by the span of a time frame they fall in.
+
+    Bucket boundaries are exactly those of :meth:`Arrow.span <arrow.arrow.Arrow.span>`, but
+    are only computed once per bucket: each timestamp is compared with the integer epoch
+    range of the current bucket, and new buckets in fixed offset timezones are found by
+    integer truncation.  Sorted input is grouped as it is read, holding only the items of
+    the current bucket.
+
+    :param iterable: an iterable of items.
+    :param frame: the timeframe.  Can be any ``datetime`` property (day, hour, minute...),
+        ``week`` or ``quarter``.
+    :param key: (optional) a function returning the :class:`Arrow <arrow.arrow.Arrow>`
+        object or ``datetime`` of an item.  By default the items are the timestamps.
+        Naive datetimes are in UTC.
+    :param week_start: (optional) only used in combination with the week timeframe.
+        Follows isoweekday() where Monday is 1 and Sunday is 7.
+    :param tz: (optional) a :ref:`timezone expression <tz-expr>` whose calendar the
+        buckets follow.  Defaults to the timezone of the first timestamp.
+    :param aggregate: (optional) a function reducing the ``list`` of items of a bucket.
+        By default the lists are returned.
+    :param ordered: (optional) whether the items are sorted by timestamp.  Defaults to
+        ``True``; with ``False`` every bucket is held until the input is exhausted.
+    :returns: an iterator of ``(bucket_start, items)`` tuples, ordered by bucket.
+    :raises ValueError: with ``ordered=True``, if an item belongs to a bucket before the
+        current one.
+
+    Usage::
+
+        >>> events = [arrow.Arrow(2013, 5, 5, 12, 30), arrow.Arrow(2013, 5, 5, 12, 45), arrow.Arrow(2013, 5, 5, 14)]
+        >>> list(arrow.bucketize(events, 'hour', aggregate=len))
+        [(<Arrow [2013-05-05T12:00:00+00:00]>, 2), (<Arrow [2013-05-05T14:00:00+00:00]>, 1)]
+
+    """
+
+    grid = _Grid(frame, week_start, tz)
+
+    if ordered:
+        return _ordered_buckets(grid, iterable, key, aggregate)
+
+    return _unordered_buckets(grid, iterable, key, aggregate)
+
+
+def find_gaps(
+    sorted_timestamps: Iterable[MOMENT],
+    frame: _T_FRAMES,
+    start: Optional[MOMENT] = None,
+    end: Optional[MOMENT] = None,
+    week_start: int = 1,
+    tz: Optional[TZ_EXPR] = None,
+) -> Iterator[Tuple[Arrow, Arrow]]:
+    """Lazily finds the spans of a time frame holding none of a sorted stream of timestamps.
+
+    The timestamps are read once and compared with the expected sequence of spans, as
+    given by :meth:`Arrow.span <arrow.arrow.Arrow.span>`, using integer epoch ranges, so
+    memory use stays flat however long the window is.  Consecutive missing spans are
+    reported together.
+
+    :param sorted_timestamps: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects or
+        datetimes, sorted.  Naive datetimes are in UTC.
+    :param frame: the timeframe.  Can be any ``datetime`` property (day, hour, minute...),
+        ``week`` or ``quarter``.
+    :param start: (optional) an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime``
+        in the first expected span.  Defaults to the first timestamp.
+    :param end: (optional) an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` in
+        the last expected span.  Defaults to the last timestamp.
+    :param week_start: (optional) only used in combination with the week timeframe.
+        Follows isoweekday() where Monday is 1 and Sunday is 7.
+    :param tz: (optional) a :ref:`timezone expression <tz-expr>` whose calendar the spans
+        follow.  Defaults to the timezone of ``start``, ``end`` or the first timestamp, in
+        that order.
+    :returns: an iterator of ``(gap_start, gap_end)`` tuples, where ``gap_end`` is the last
+        microsecond of the last missing span, as with
+        :meth:`Arrow.span <arrow.arrow.Arrow.span>`.
+    :raises ValueError: if the timestamps are not sorted.
+
+    Usage::
+
+        >>> readings = [arrow.Arrow(2013, 5, 5, 12, m) for m in (0, 1, 4, 5)]
+        >>> list(arrow.find_gaps(readings, 'minute'))
+        [(<Arrow [2013-05-05T12:02:00+00:00]>, <Arrow [2013-05-05T12:03:59.999999+00:00]>)]
+
+    """
+
+    grid = _Grid(frame, week_start, tz)
+
+    return _gaps(grid, sorted_timestamps, start, end)
+
+
+def resample(
+    series: Union[SERIES, Mapping[Any, SERIES]],
+    frame: _T_FRAMES,
+    how: Union[str, Callable[[List[Any]], Any]] = "mean",
+    fill: Any = None,
+    start: Optional[MOMENT] = None,
+    end: Optional[MOMENT] = None,
+    week_start: int = 1,
+    tz: Optional[TZ_EXPR] = None,
+) -> Iterator[Tuple[Arrow, Any]]:
+    """Lazily aligns sorted series of ``(timestamp, value)`` pairs to the spans of a time
+    frame, reducing the values of each span.
+
+    Span boundaries are those of :meth:`Arrow.span <arrow.arrow.Arrow.span>`, computed once
+    per span as integer epoch ranges.  Every series is read once, in step with the spans,
+    so only the values of the current span are held however long the series are.
+
+    :param series: an iterable of ``(timestamp, value)`` pairs sorted by timestamp, or a
+        mapping of names to such iterables to align several series to the same spans.
+        Timestamps are :class:`Arrow <arrow.arrow.Arrow>` objects or datetimes; naive
+        datetimes are in UTC.
+    :param frame: the timeframe.  Can be any ``datetime`` property (day, hour, minute...),
+        ``week`` or ``quarter``.
+    :param how: (optional) the reduction of the ``list`` of values of a span: ``first``,
+        ``last``, ``mean``, ``count``, ``sum``, ``min``, ``max`` or a function.  Defaults
+        to ``mean``.
+    :param fill: (optional) the value of spans holding no values.  Defaults to ``None``.
+    :param start: (optional) an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime``
+        in the first span.  Defaults to the earliest first timestamp of the series.
+    :param end: (optional) an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime`` in
+        the last span.  Defaults to the span of the latest timestamp of the series.
+    :param week_start: (optional) only used in combination with the week timeframe.
+        Follows isoweekday() where Monday is 1 and Sunday is 7.
+    :param tz: (optional) a :ref:`timezone expression <tz-expr>` whose calendar the spans
+        follow.  Defaults to the timezone of ``start`` or of the first timestamp of the
+        first series, in that order.
+    :returns: an iterator of ``(span_start, value)`` tuples, one per span, or of
+        ``(span_start, {name: value})`` tuples for a mapping of series.
+    :raises ValueError: if ``how`` is an unknown name, or a series is not sorted.
+
+    Usage::
+
+        >>> readings = [(arrow.Arrow(2013, 5, 5, 12, 10), 3), (arrow.Arrow(2013, 5, 5, 12, 40), 5), (arrow.Arrow(2013, 5, 5, 14, 20), 4)]
+        >>> list(arrow.resample(readings, 'hour', fill=0))
+        [(<Arrow [2013-05-05T12:00:00+00:00]>, 4.0), (<Arrow [2013-05-05T13:00:00+00:00]>, 0), (<Arrow [2013-05-05T14:00:00+00:00]>, 4.0)]
+
+    """
+
+    if isinstance(how, str):
+        if how not in _HOW:
+            raise ValueError(
+                f"Unsupported how {how!r}. Supported values are: {', '.join(_HOW)}."
+            )
+        how = _HOW[how]
+
+    grid = _Grid(frame, week_start, tz)
+
+    return _resampled(grid, series, how, fill, start, end)
+
+
+class _Grid:
+    """Finds the spans of a frame holding epoch microseconds.
+
+    The timezone is taken from the first timestamp converted by :meth:`epoch` unless given.
+    The last span found is kept, so runs of timestamps in the same span cost one integer
+    comparison each.
+
+    """
+
+    __slots__ = (
+        "frame",
+        "week_start",
+        "tzinfo",
+        "_step",
+        "_length",
+        "_origin",
+        "_start",
+        "_end",
+        "_floor",
+        "_next",
+    )
+
+    frame: str
+    week_start: int
+    tzinfo: Optional[dt_tzinfo]
+    # the wall clock distance between the starts of spans
+    _step: relativedelta
+    # the length and the epoch microseconds of a boundary of spans of a fixed length
+    _length: Optional[int]
+    _origin: int
+    # the last span found, and its floor once built
+    _start: int
+    _end: int
+    _floor: Optional[Arrow]
+    # the floor of the span after it and the epoch microseconds of its start
+    _next: Optional[Tuple[Arrow, int]]
+
+    def __init__(
+        self, frame: _T_FRAMES, week_start: int, tz: Optional[TZ_EXPR]
+    ) -> None:
+        if not 1 <= week_start <= 7:
+            raise ValueError("week_start argument must be between 1 and 7.")
+
+        self.frame, frame_relative, relative_steps = Arrow._get_frames(frame)
+        step: Dict[str, Any] = {frame_relative: relative_steps}
+        self._step = relativedelta(**step)
+        self.week_start = week_start
+        self.tzinfo = None
+        self._length = None
+        self._origin = 0
+        self._start = self._end = 0
+        self._floor = None
+        self._next = None
+
+        if tz is not None:
+            self._bind(Arrow._get_tzinfo(tz))
+
+    def _bind(self, tzinfo: dt_tzinfo) -> None:
+        self.tzinfo = tzinfo
+
+        if self.frame in _FIXED_FRAMES and zones.has_fixed_offset(tzinfo):
+            offset = tzinfo.utcoffset(_EPOCH) or timedelta(0)
+            self._length = _FIXED_FRAMES[self.frame]
+            self._origin = -(offset // _MICROSECOND)
+
+            if self.frame == "week":
+                # 1970-01-01 was a Thursday
+                self._origin += (self.week_start - 4) % 7 * _DAY
+
+    def epoch(self, value: MOMENT) -> int:
+        """Returns the epoch microseconds of a timestamp, adopting its timezone if none is
+        set yet."""
+
+        us = Arrow._epoch_us(value, "timestamp")
+
+        if self.tzinfo is None:
+            self._bind(value.tzinfo or zones.UTC)
+
+        return us
+
+    def locate(self, us: int) -> Tuple[int, int]:
+        """Returns the epoch microseconds of the start of the span holding ``us`` and of
+        the start of the next one."""
+
+        if self._start <= us < self._end:
+            return self._start, self._end
+
+        self._floor = None
+
+        if self._length is not None:
+            self._start = us - (us - self._origin) % self._length
+            self._end = self._start + self._length
+
+        else:
+            # spans run from their floor to the floor of the next one, both moved past
+            # wall times skipped by DST changes, so that they tile the timeline
+            if self._next is not None and self._end <= us:
+                floor, start = self._next
+            else:
+                floor, start = self._locate_floor(us)
+
+            following = self._following(floor)
+
+            if following[1] <= us:
+                floor, start = self._locate_floor(us)
+                following = self._following(floor)
+
+            self._floor = floor
+            self._next = following
+            self._start = start
+            self._end = following[1]
+
+        return self._start, self._end
+
+    def _locate_floor(self, us: int) -> Tuple[Arrow, int]:
+        floor = Arrow.from_epoch_us(us, self.tzinfo).span(
+            self.frame,  # type: ignore[arg-type]
+            week_start=self.week_start,
+        )[0]
+
+        return floor, util.epoch_us(zones.resolve_imaginary(floor._datetime))
+
+    def _following(self, floor: Arrow) -> Tuple[Arrow, int]:
+        # a frame later on the wall clock is in the next span, but past its floor if
+        # this one was moved past skipped wall times
+        wall = zones.resolve_imaginary(floor._datetime + self._step)
+
+        return self._locate_floor(util.epoch_us(wall))
+
+    def floor(self, start: int) -> Arrow:
+        """Returns the start of a span found by :meth:`locate` as an Arrow object."""
+
+        if self._floor is not None and self._start == start:
+            return self._floor
+
+        return Arrow.from_epoch_us(start, self.tzinfo)
+
+
+def _ordered_buckets(
+    grid: _Grid,
+    iterable: Iterable[Any],
+    key: Optional[Callable[[Any], MOMENT]],
+    aggregate: Optional[Callable[[List[Any]], Any]],
+) -> Iterator[Tuple[Arrow, Any]]:
+    epoch, locate = grid.epoch, grid.locate
+
+    floor: Optional[Arrow] = None
+    items: List[Any] = []
+    start = end = 0
+
+    for item in iterable:
+        us = epoch(item if key is None else key(item))
+
+        if start <= us < end:
+            items.append(item)
+            continue
+
+        previous = start
+        start, end = locate(us)
+
+        if floor is not None:
+            if start < previous:
+                raise ValueError(
+                    "Items must be sorted by timestamp; pass ordered=False for unsorted input."
+                )
+            yield floor, items if aggregate is None else aggregate(items)
+
+        floor = grid.floor(start)
+        items = [item]
+
+    if floor is not None:
+        yield floor, items if aggregate is None else aggregate(items)
+
+
+def _unordered_buckets(
+    grid: _Grid,
+    iterable: Iterable[Any],
+    key: Optional[Callable[[Any], MOMENT]],
+    aggregate: Optional[Callable[[List[Any]], Any]],
+) -> Iterator[Tuple[Arrow, Any]]:
+    epoch, locate = grid.epoch, grid.locate
+    buckets: Dict[int, Tuple[Arrow, List[Any]]] = {}
+
+    for item in iterable:
+        start = locate(epoch(item if key is None else key(item)))[0]
+
+        bucket = buckets.get(start)
+        if bucket is None:
+            bucket = buckets[start] = (grid.floor(start), [])
+
+        bucket[1].append(item)
+
+    for start in sorted(buckets):
+        floor, items = buckets[start]
+        yield floor, items if aggregate is None else aggregate(items)
+
+
+def _gaps(
+    grid: _Grid,
+    timestamps: Iterable[MOMENT],
+    start: Optional[MOMENT],
+    end: Optional[MOMENT],
+) -> Iterator[Tuple[Arrow, Arrow]]:
+    epoch, locate = grid.epoch, grid.locate
+
+    # the start of the next expected span, and the end of the last one
+    expected = None if start is None else locate(epoch(start))[0]
+    stop = None if end is None else locate(epoch(end))[1]
+    previous: Optional[int] = None
+
+    for timestamp in timestamps:
+        span_start, span_end = locate(epoch(timestamp))
+
+        if previous is not None and span_start < previous:
+            raise ValueError("The timestamps must be sorted.")
+        previous = span_start
+
+        if stop is not None and span_start >= stop:
+            break
+
+        if expected is None:
+            expected = span_start
+        elif span_start < expected:
+            continue
+        elif span_start > expected:
+            yield _gap(grid, expected, span_start)
+
+        expected = span_end
+
+    if expected is not None and stop is not None and expected < stop:
+        yield _gap(grid, expected, stop)
+
+
+def _resampled(
+    grid: _Grid,
+    series: Union[SERIES, Mapping[Any, SERIES]],
+    how: Callable[[List[Any]], Any],
+    fill: Any,
+    start: Optional[MOMENT],
+    end: Optional[MOMENT],
+) -> Iterator[Tuple[Arrow, Any]]:
+    epoch, locate = grid.epoch, grid.locate
+
+    # the start of the first span, found before reading the series so that start's
+    # timezone is adopted first
+    span_start = None if start is None else locate(epoch(start))[0]
+
+    names: Optional[List[Any]] = None
+    if isinstance(series, Mapping):
+        names = list(series)
+        iterators = [iter(series[name]) for name in names]
+    else:
+        iterators = [iter(series)]
+    # the next pair of each series, with its timestamp in epoch microseconds
+    heads = [_head(pairs, epoch) for pairs in iterators]
+
+    if span_start is None:
+        firsts = [head[0] for head in heads if head is not None]
+        if not firsts:
+            return
+        span_start = locate(min(firsts))[0]
+
+    stop = None if end is None else locate(epoch(end))[1]
+
+    while span_start < stop if stop is not None else any(heads):
+        span_end = locate(span_start)[1]
+        row = []
+
+        for index, pairs in enumerate(iterators):
+            head = heads[index]
+            values = []
+
+            while head is not None and head[0] < span_end:
+                previous = head[0]
+                if previous >= span_start:
+                    values.append(head[1])
+
+                head = _head(pairs, epoch)
+                if head is not None and head[0] < previous:
+                    raise ValueError("The series must be sorted by timestamp.")
+
+            heads[index] = head
+            row.append(how(values) if values else fill)
+
+        if names is None:
+            yield grid.floor(span_start), row[0]
+        else:
+            yield grid.floor(span_start), dict(zip(names, row))
+
+        span_start = span_end
+
+
+def _head(
+    pairs: Iterator[Tuple[MOMENT, Any]], epoch: Callable[[MOMENT], int]
+) -> Optional[Tuple[int, Any]]:
+    pair = next(pairs, None)
+
+    if pair is None:
+        return None
+
+    return epoch(pair[0]), pair[1]
+
+
+def _gap(grid: _Grid, start: int, end: int) -> Tuple[Arrow, Arrow]:
+    return (
+        Arrow.from_epoch_us(start, grid.tzinfo),
+        Arrow.from_epoch_us(end - 1, grid.tzinfo),
+    )
@@ -0,0 +1,144 @@
+"""Opt-in counters and timers for arrow's hot paths.
+
+Collection is off by default, and while it is off every instrumented call site costs a
+single flag check. The counters are process wide and include activity from every thread.
+
+=========================== ===================================================
+Key                         Counts
+=========================== ===================================================
+``pattern_compiles``        format patterns generated and compiled
+``pattern_compile_seconds`` time spent generating and compiling format patterns
+``pattern_cache_hits``      patterns found in a parser's cache
+``pattern_cache_misses``    patterns missing from a parser's cache
+``tz_parses_utc``           timezone expressions parsed as UTC
+``tz_parses_offset``        timezone expressions parsed as a fixed offset
+``tz_parses_named``         timezone expressions looked up in the tz database
+``tz_parses_local``         timezone expressions parsed as the local timezone
+``locale_constructions``    locale objects constructed
+``iso_parses``              strings parsed without a format
+``format_fallbacks``        candidate formats that failed before one matched
+=========================== ===================================================
+
+Usage::
+
+    >>> from arrow import stats
+    >>> with stats.collect() as counts:
+    ...     arrow.get('2013-05-05 12:30:45')
+    ...
+    >>> counts['iso_parses']
+    1
+
+"""
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator, Tuple, TypeVar, Union
+
+_T = TypeVar("_T")
+
+_KEYS: Tuple[str, ...] = (
+    "pattern_compiles",
+    "pattern_compile_seconds",
+    "pattern_cache_hits",
+    "pattern_cache_misses",
+    "tz_parses_utc",
+    "tz_parses_offset",
+    "tz_parses_named",
+    "tz_parses_local",
+    "locale_constructions",
+    "iso_parses",
+    "format_fallbacks",
+)
+
+# read without the lock by the instrumented call sites
+_enabled = False
+
+_lock = threading.Lock()
+_counters: Dict[str, Union[int, float]] = dict.fromkeys(_KEYS, 0)
+
+
+def enable() -> None:
+    """Starts collecting statistics."""
+
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stops collecting statistics.  The values collected so far are kept."""
+
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Returns whether statistics are being collected."""
+
+    return _enabled
+
+
+def reset() -> None:
+    """Sets every counter and timer back to zero."""
+
+    with _lock:
+        for key in _KEYS:
+            _counters[key] = 0
+
+
+def snapshot() -> Dict[str, Union[int, float]]:
+    """Returns a copy of the current counters and timers."""
+
+    with _lock:
+        return dict(_counters)
+
+
+@contextmanager
+def collect() -> Iterator[Dict[str, Union[int, float]]]:
+    """Collects statistics for the duration of a ``with`` block.
+
+    Yields a ``dict`` that is filled in on exit with the activity during the block.
+    Collection is restored to its previous state afterwards, so blocks can be nested.
+
+    Usage::
+
+        >>> with stats.collect() as counts:
+        ...     arrow.get('2013-05-05', 'YYYY-MM-DD', tzinfo='US/Pacific')
+        ...
+        >>> counts['tz_parses_named']
+        1
+
+    """
+
+    global _enabled
+
+    was_enabled = _enabled
+    before = snapshot()
+    result: Dict[str, Union[int, float]] = {}
+    _enabled = True
+
+    try:
+        yield result
+    finally:
+        _enabled = was_enabled
+        after = snapshot()
+        result.update((key, after[key] - before[key]) for key in _KEYS)
+
+
+def _count(key: str, value: Union[int, float] = 1) -> None:
+    with _lock:
+        _counters[key] += value
+
+
+def _timed(key: str, fn: Callable[..., _T], *args: object) -> _T:
+    """Calls ``fn(*args)``, counting the call under ``key`` and its duration under
+    ``<key>_seconds``."""
+
+    start = perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        elapsed = perf_counter() - start
+        with _lock:
+            _counters[f"{key}s"] += 1
+            _counters[f"{key}_seconds"] += elapsed
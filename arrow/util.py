@@ -1,10 +1,9 @@
 """Helpful functions used internally within arrow."""
 
 import datetime
-from typing import Any, Optional, cast
-
-from dateutil.rrule import WEEKLY, rrule
+from typing import Any, Iterable, List, Optional
 
+from arrow import zones
 from arrow.constants import (
     MAX_ORDINAL,
     MAX_TIMESTAMP,
@@ -13,6 +12,16 @@ from arrow.constants import (
     MIN_ORDINAL,
 )
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+# subtracting datetimes sharing a tzinfo object skips both utcoffset() calls
+_EPOCH_ZONES_UTC = _EPOCH.replace(tzinfo=zones.UTC)
+
+# the number of days in each month of common and of leap years, indexed by month
+_MONTH_LENGTHS = (
+    (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
+
 
 def next_weekday(
     start_date: Optional[datetime.date], weekday: int
@@ -39,10 +48,50 @@ def next_weekday(
     """
     if weekday < 0 or weekday > 6:
         raise ValueError("Weekday must be between 0 (Monday) and 6 (Sunday).")
-    return cast(
-        datetime.datetime,
-        rrule(freq=WEEKLY, dtstart=start_date, byweekday=weekday, count=1)[0],
-    )
+
+    return _next_weekday(start_date, weekday)
+
+
+def next_weekdays(
+    start_dates: Iterable[Optional[datetime.date]], weekday: int
+) -> List[datetime.datetime]:
+    """Get the next weekday from each of the specified start dates.
+
+    Batch variant of :func:`next_weekday`; the weekday is validated once.
+
+    :param start_dates: Iterable of datetime objects representing the start dates.
+    :param weekday: Next weekday to obtain. Can be a value between 0 (Monday) and 6 (Sunday).
+    :return: List of datetime objects corresponding to the next weekday after each start date.
+
+    Usage::
+
+        >>> next_weekdays([datetime(1970, 1, 1), datetime(1970, 1, 6)], 0)
+        [datetime.datetime(1970, 1, 5, 0, 0), datetime.datetime(1970, 1, 12, 0, 0)]
+    """
+    if weekday < 0 or weekday > 6:
+        raise ValueError("Weekday must be between 0 (Monday) and 6 (Sunday).")
+
+    return [_next_weekday(start_date, weekday) for start_date in start_dates]
+
+
+def _next_weekday(
+    start_date: Optional[datetime.date], weekday: int
+) -> datetime.datetime:
+    # Same results as the first occurrence of
+    # rrule(freq=WEEKLY, dtstart=start_date, byweekday=weekday): dates start at
+    # midnight, no start date means now, and microseconds are dropped.
+    if start_date is None:
+        start = datetime.datetime.now().replace(microsecond=0)
+    elif isinstance(start_date, datetime.datetime):
+        start = start_date
+        if start.microsecond or start.fold:
+            start = start.replace(microsecond=0, fold=0)
+    else:
+        start = datetime.datetime(start_date.year, start_date.month, start_date.day)
+
+    days = (weekday - start.weekday()) % 7
+
+    return start + datetime.timedelta(days) if days else start
 
 
 def is_timestamp(value: Any) -> bool:
@@ -82,6 +131,37 @@ def normalize_timestamp(timestamp: float) -> float:
     return timestamp
 
 
+def epoch_us(dt: datetime.datetime) -> int:
+    """Returns the exact number of microseconds between the Unix epoch and a datetime.
+
+    Unlike ``dt.timestamp()``, no precision is lost to float rounding. Naive datetimes are
+    in local time, as with ``dt.timestamp()``.
+
+    :param dt: the ``datetime``.
+
+    """
+    tzinfo = dt.tzinfo
+
+    if tzinfo is None:
+        dt = dt.astimezone(datetime.timezone.utc)
+
+    delta = dt - (_EPOCH_ZONES_UTC if tzinfo is zones.UTC else _EPOCH)
+
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def month_length(year: int, month: int) -> int:
+    """Returns the number of days in a month, as ``calendar.monthrange(year, month)[1]``
+    does, from a table.
+
+    :param year: the year.
+    :param month: the month, from 1 to 12.
+
+    """
+
+    return _MONTH_LENGTHS[year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)][month]
+
+
 # Credit to https://stackoverflow.com/a/1700069
 def iso_to_gregorian(iso_year: int, iso_week: int, iso_day: int) -> datetime.date:
     """Converts an ISO week date into a datetime object.
@@ -114,4 +194,11 @@ def validate_bounds(bounds: str) -> None:
         )
 
 
-__all__ = ["next_weekday", "is_timestamp", "validate_ordinal", "iso_to_gregorian"]
+__all__ = [
+    "next_weekday",
+    "is_timestamp",
+    "validate_ordinal",
+    "iso_to_gregorian",
+    "epoch_us",
+    "month_length",
+]
@@ -0,0 +1,307 @@
+"""Assigns timestamped events to event-time windows, emitting each window once it closes.
+
+Windows are spans of ``count`` frames whose starts are ``step`` frames apart, aligned to
+the frame boundaries of a timezone as with :meth:`Arrow.span <arrow.arrow.Arrow.span>`.
+The watermark trails the latest timestamp seen by the allowed lateness; a window closes
+once the watermark reaches its end, and events arriving after all of their windows have
+closed are dropped and counted.
+
+Usage::
+
+    >>> from arrow import windows
+    >>> events = [arrow.Arrow(2013, 5, 5, 12, m) for m in (1, 3, 7, 12)]
+    >>> for start, end, count in windows.SlidingWindows('minute', 10, step=5, aggregate=len).process(events):
+    ...     print(start, count)
+    ...
+    2013-05-05T11:55:00+00:00 2
+    2013-05-05T12:00:00+00:00 3
+    2013-05-05T12:05:00+00:00 2
+    2013-05-05T12:10:00+00:00 1
+
+"""
+
+from datetime import timedelta
+from heapq import heappop, heappush
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from arrow import zones
+from arrow.arrow import _T_FRAMES, TZ_EXPR, Arrow
+from arrow.series import MOMENT, _Grid
+
+WINDOW = Tuple[Arrow, Arrow, Any]
+
+_MICROSECOND = timedelta(microseconds=1)
+_NO_LATENESS = timedelta(0)
+
+
+class SlidingWindows:
+    """Sliding event-time windows of ``count`` frames, starting every ``step`` frames.
+
+    An event belongs to every window holding its timestamp, found with integer arithmetic
+    on epoch microseconds.  Only open windows are kept, and as the watermark moves forward
+    they are closed in order of their start.
+
+    :param frame: the timeframe, from ``microsecond`` to ``week``.
+    :param count: (optional) the length of the windows in frames.  Defaults to 1.
+    :param step: (optional) the number of frames between the starts of windows.  Defaults
+        to ``count``, which gives tumbling windows.
+    :param lateness: (optional) a ``timedelta`` by which the watermark trails the latest
+        timestamp seen.  Defaults to zero.
+    :param tz: (optional) a :ref:`timezone expression <tz-expr>` with a fixed offset whose
+        frame boundaries the windows are aligned to.  Defaults to UTC.
+    :param week_start: (optional) only used in combination with the week timeframe.
+        Follows isoweekday() where Monday is 1 and Sunday is 7.
+    :param key: (optional) a function returning the :class:`Arrow <arrow.arrow.Arrow>`
+        object or ``datetime`` of an event.  By default the events are the timestamps.
+        Naive datetimes are in UTC.
+    :param aggregate: (optional) a function reducing the ``list`` of events of a window.
+        By default the lists are returned.
+
+    Closed windows are returned as ``(start, end, events)`` tuples, where ``end`` is the
+    last microsecond of the window, as with :meth:`Arrow.span <arrow.arrow.Arrow.span>`.
+
+    """
+
+    __slots__ = (
+        "late",
+        "_length",
+        "_step",
+        "_origin",
+        "_lateness",
+        "_tzinfo",
+        "_key",
+        "_aggregate",
+        "_windows",
+        "_starts",
+        "_latest",
+    )
+
+    #: The number of events dropped because all of their windows had closed.
+    late: int
+
+    # the length of windows, the distance between their starts and the start of one
+    _length: int
+    _step: int
+    _origin: int
+    _lateness: int
+    _tzinfo: Any
+    _key: Optional[Callable[[Any], MOMENT]]
+    _aggregate: Optional[Callable[[List[Any]], Any]]
+    # the events of the open windows by start, and a heap of their starts
+    _windows: Dict[int, List[Any]]
+    _starts: List[int]
+    # the latest timestamp seen, in epoch microseconds
+    _latest: Optional[int]
+
+    def __init__(
+        self,
+        frame: _T_FRAMES,
+        count: int = 1,
+        step: Optional[int] = None,
+        lateness: timedelta = _NO_LATENESS,
+        tz: Optional[TZ_EXPR] = None,
+        week_start: int = 1,
+        key: Optional[Callable[[Any], MOMENT]] = None,
+        aggregate: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> None:
+        if step is None:
+            step = count
+
+        if count < 1 or step < 1:
+            raise ValueError("The count and step must be positive integers.")
+
+        if lateness < _NO_LATENESS:
+            raise ValueError("The lateness must not be negative.")
+
+        grid = _Grid(frame, week_start, zones.UTC if tz is None else tz)
+
+        if grid._length is None:
+            raise ValueError(
+                "Windows need a frame of fixed length, from microsecond to week, in a "
+                "timezone with a fixed offset."
+            )
+
+        self.late = 0
+        self._length = count * grid._length
+        self._step = step * grid._length
+        self._origin = grid._origin
+        self._lateness = lateness // _MICROSECOND
+        self._tzinfo = grid.tzinfo
+        self._key = key
+        self._aggregate = aggregate
+        self._windows = {}
+        self._starts = []
+        self._latest = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{len(self._windows)} open]>"
+
+    @property
+    def watermark(self) -> Optional[Arrow]:
+        """The moment before which no more events are expected, or ``None`` before the
+        first event."""
+
+        if self._latest is None:
+            return None
+
+        return Arrow.from_epoch_us(self._latest - self._lateness, self._tzinfo)
+
+    def add(self, event: Any) -> List[WINDOW]:
+        """Adds an event, returning the windows its timestamp closed.
+
+        :param event: an event.
+
+        """
+
+        key = self._key
+        us = Arrow._epoch_us(event if key is None else key(event), "timestamp")
+
+        self._assign(us, event)
+        return self._advance(us)
+
+    def advance(self, moment: MOMENT) -> List[WINDOW]:
+        """Moves the watermark forward to a moment without an event, returning the windows
+        it closed.  Use it to close windows while no events arrive.
+
+        :param moment: an :class:`Arrow <arrow.arrow.Arrow>` object or ``datetime``.  Naive
+            datetimes are in UTC.
+
+        """
+
+        return self._advance(Arrow._epoch_us(moment, "moment") + self._lateness)
+
+    def flush(self) -> List[WINDOW]:
+        """Closes and returns every open window, such as at the end of a stream."""
+
+        closed = []
+        while self._starts:
+            closed.append(self._close(heappop(self._starts)))
+
+        return closed
+
+    def process(self, events: Iterable[Any]) -> Iterator[WINDOW]:
+        """Lazily adds a stream of events, yielding windows as they close and the remaining
+        open windows once the stream ends.
+
+        :param events: an iterable of events.
+
+        """
+
+        key = self._key
+        epoch_us = Arrow._epoch_us
+        assign, advance = self._assign, self._advance
+        starts = self._starts
+        horizon = self._lateness + self._length
+
+        # the timestamps from slot up to slot_end share the windows whose event lists are
+        # targets, until one of them closes
+        slot = slot_end = 0
+        targets: List[List[Any]] = []
+
+        for event in events:
+            us = epoch_us(event if key is None else key(event), "timestamp")
+
+            if slot <= us < slot_end:
+                for target in targets:
+                    target.append(event)
+            else:
+                slot, slot_end, targets = assign(us, event)
+
+            if starts and starts[0] <= us - horizon:
+                slot_end = slot
+                yield from advance(us)
+            elif self._latest is None or us > self._latest:
+                self._latest = us
+
+        yield from self.flush()
+
+    def _assign(self, us: int, event: Any) -> Tuple[int, int, List[List[Any]]]:
+        """Adds an event to its open windows, returning the range of timestamps that would
+        be added to the same windows, and their event lists."""
+
+        length, step = self._length, self._step
+        windows = self._windows
+
+        limit = None if self._latest is None else self._latest - self._lateness
+        slot = start = us - (us - self._origin) % step
+        targets = []
+        contained = 0
+
+        # every window starting after us - length holds the timestamp
+        while start > us - length:
+            contained += 1
+
+            if limit is None or start + length > limit:
+                events = windows.get(start)
+                if events is None:
+                    events = windows[start] = []
+                    heappush(self._starts, start)
+                events.append(event)
+                targets.append(events)
+
+            start -= step
+
+        if contained and not targets:
+            self.late += 1
+
+        # the windows only stay the same across the slot if each holds all of it
+        if length % step or len(targets) < contained:
+            return slot, slot, targets
+
+        return slot, slot + step, targets
+
+    def _advance(self, latest: int) -> List[WINDOW]:
+        if self._latest is not None and latest <= self._latest:
+            return []
+
+        self._latest = latest
+        limit = latest - self._lateness - self._length
+        starts = self._starts
+
+        closed = []
+        while starts and starts[0] <= limit:
+            closed.append(self._close(heappop(starts)))
+
+        return closed
+
+    def _close(self, start: int) -> WINDOW:
+        events = self._windows.pop(start)
+
+        return (
+            Arrow.from_epoch_us(start, self._tzinfo),
+            Arrow.from_epoch_us(start + self._length - 1, self._tzinfo),
+            events if self._aggregate is None else self._aggregate(events),
+        )
+
+
+class TumblingWindows(SlidingWindows):
+    """Non-overlapping event-time windows of ``count`` frames.
+
+    The same as :class:`SlidingWindows` with ``step`` equal to ``count``, so every event
+    belongs to exactly one window, the one :meth:`Arrow.span <arrow.arrow.Arrow.span>`
+    gives for single frames.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        frame: _T_FRAMES,
+        count: int = 1,
+        lateness: timedelta = _NO_LATENESS,
+        tz: Optional[TZ_EXPR] = None,
+        week_start: int = 1,
+        key: Optional[Callable[[Any], MOMENT]] = None,
+        aggregate: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> None:
+        super().__init__(
+            frame,
+            count,
+            count,
+            lateness=lateness,
+            tz=tz,
+            week_start=week_start,
+            key=key,
+            aggregate=aggregate,
+        )
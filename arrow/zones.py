@@ -0,0 +1,300 @@
+"""Shared timezone instances for arrow's hot paths, and the backends finding named
+timezones and the wall times their offset changes skip or repeat.
+
+The default ``dateutil`` backend uses ``dateutil.tz``, and on Python 3.9 and later the
+``zoneinfo`` backend finds named timezones with the standard library's ``zoneinfo``
+instead, see :func:`set_backend`.
+
+"""
+
+import os
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from datetime import tzinfo as dt_tzinfo
+from typing import Dict, Iterator, Optional, Tuple, Type
+
+from dateutil import tz as dateutil_tz
+
+try:
+    import zoneinfo
+except ImportError:  # pragma: no cover
+    zoneinfo = None  # type: ignore[assignment]
+
+#: The UTC timezone given to every :class:`Arrow <arrow.arrow.Arrow>` created without one.
+UTC: dt_tzinfo = dateutil_tz.tzutc()
+
+#: The types of timezones whose offset never changes.
+FIXED_OFFSET_TYPES = (dateutil_tz.tzutc, dateutil_tz.tzoffset, timezone)
+
+# the classification of other timezones by id, holding them so that ids stay unique
+_fixed_offsets: Dict[int, Tuple[dt_tzinfo, bool]] = {}
+_FIXED_OFFSETS_SIZE = 256
+
+# wall times further than a day from the offset transitions of a timezone all exist
+_TRANSITION_MARGIN = 86400
+_WALL_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+#: The least number of seconds between checks of :func:`local` for changes of the
+#: local timezone.
+LOCAL_CHECK_INTERVAL = 1.0
+
+_LOCALTIME = "/etc/localtime"
+
+_local: Optional[dt_tzinfo] = None
+_local_checked = 0.0
+_local_source_key: Tuple[Optional[str], Optional[Tuple[int, int, int]]] = (None, None)
+
+
+class DateutilBackend:
+    """Finds named timezones with ``dateutil.tz.gettz``, and handles skipped and repeated
+    wall times with the functions of ``dateutil.tz``, which work with any timezone.  This
+    is the default backend."""
+
+    name = "dateutil"
+
+    def gettz(self, name: str) -> Optional[dt_tzinfo]:
+        """Returns the timezone of a name, or ``None`` if there is none."""
+
+        return dateutil_tz.gettz(name)
+
+    def datetime_exists(self, dt: datetime) -> bool:
+        """Returns whether the wall time of an aware ``datetime`` exists in its timezone."""
+
+        return dateutil_tz.datetime_exists(dt)
+
+    def datetime_ambiguous(self, dt: datetime) -> bool:
+        """Returns whether the wall time of an aware ``datetime`` occurs twice in its
+        timezone."""
+
+        return dateutil_tz.datetime_ambiguous(dt)
+
+    def resolve_imaginary(self, dt: datetime) -> datetime:
+        """Returns an aware ``datetime`` moved forward past its wall time if that was
+        skipped by an offset change, or the same ``datetime`` otherwise."""
+
+        return dateutil_tz.resolve_imaginary(dt)
+
+
+class ZoneInfoBackend(DateutilBackend):
+    """Finds named timezones with the standard library's ``zoneinfo``, falling back to
+    ``dateutil.tz.gettz`` for names it does not know, such as POSIX TZ strings and file
+    paths.
+
+    The skipped and repeated wall times of ``ZoneInfo`` zones are found by comparing the
+    offsets of both folds of a wall time, as defined by PEP 495, and other timezones are
+    handled as by :class:`DateutilBackend`.
+
+    """
+
+    name = "zoneinfo"
+
+    def gettz(self, name: str) -> Optional[dt_tzinfo]:
+        try:
+            return zoneinfo.ZoneInfo(name)
+        except (KeyError, ValueError):
+            return dateutil_tz.gettz(name)
+
+    def datetime_exists(self, dt: datetime) -> bool:
+        if not isinstance(dt.tzinfo, zoneinfo.ZoneInfo):
+            return dateutil_tz.datetime_exists(dt)
+
+        # a skipped wall time has the smaller offset from before the change in fold 0
+        return dt.replace(fold=0).utcoffset() >= dt.replace(fold=1).utcoffset()  # type: ignore[operator]
+
+    def datetime_ambiguous(self, dt: datetime) -> bool:
+        if not isinstance(dt.tzinfo, zoneinfo.ZoneInfo):
+            return dateutil_tz.datetime_ambiguous(dt)
+
+        return dt.replace(fold=0).utcoffset() > dt.replace(fold=1).utcoffset()  # type: ignore[operator]
+
+    def resolve_imaginary(self, dt: datetime) -> datetime:
+        if not isinstance(dt.tzinfo, zoneinfo.ZoneInfo):
+            return dateutil_tz.resolve_imaginary(dt)
+
+        before = dt.replace(fold=0).utcoffset()
+        after = dt.replace(fold=1).utcoffset()
+
+        if before < after:  # type: ignore[operator]
+            return dt + (after - before)  # type: ignore[operator]
+
+        return dt
+
+
+_BACKENDS: Dict[str, Type[DateutilBackend]] = {
+    "dateutil": DateutilBackend,
+    "zoneinfo": ZoneInfoBackend,
+}
+
+_backend: DateutilBackend = DateutilBackend()
+
+
+def set_backend(name: str) -> None:
+    """Sets the timezone backend used from then on to find named timezones and to handle
+    skipped and repeated wall times.  UTC, fixed offsets and the local timezone are the
+    same with every backend.
+
+    :param name: ``dateutil``, the default, or ``zoneinfo``, which needs Python 3.9 or
+        later.
+
+    """
+
+    global _backend
+
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unsupported timezone backend {name!r}. Supported backends are: "
+            f"{', '.join(_BACKENDS)}."
+        )
+
+    if name == "zoneinfo" and zoneinfo is None:  # pragma: no cover
+        raise ValueError("The zoneinfo timezone backend needs Python 3.9 or later.")
+
+    _backend = _BACKENDS[name]()
+
+
+def get_backend() -> str:
+    """Returns the name of the timezone backend in use."""
+
+    return _backend.name
+
+
+def gettz(name: str) -> Optional[dt_tzinfo]:
+    """Returns the timezone of a name from the backend, or ``None`` if there is none."""
+
+    return _backend.gettz(name)
+
+
+def datetime_exists(dt: datetime) -> bool:
+    """Returns whether the wall time of an aware ``datetime`` exists in its timezone."""
+
+    return _backend.datetime_exists(dt)
+
+
+def datetime_ambiguous(dt: datetime) -> bool:
+    """Returns whether the wall time of an aware ``datetime`` occurs twice in its
+    timezone."""
+
+    return _backend.datetime_ambiguous(dt)
+
+
+def resolve_imaginary(dt: datetime) -> datetime:
+    """Returns an aware ``datetime`` moved forward past its wall time if that was skipped
+    by an offset change, or the same ``datetime`` otherwise."""
+
+    return _backend.resolve_imaginary(dt)
+
+
+def _local_source() -> Tuple[Optional[str], Optional[Tuple[int, int, int]]]:
+    # the TZ variable and the file behind /etc/localtime, which may be relinked
+    try:
+        stat = os.stat(_LOCALTIME)
+    except OSError:
+        return os.environ.get("TZ"), None
+
+    return os.environ.get("TZ"), (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def local() -> dt_tzinfo:
+    """Returns the local timezone.
+
+    A single ``tzlocal()`` instance is created on first use and shared afterwards, as
+    building one reads the system timezone settings.  At most once every
+    :data:`LOCAL_CHECK_INTERVAL` seconds, the ``TZ`` environment variable and
+    ``/etc/localtime`` are checked, and a new instance is created if either changed,
+    after resetting the time conversion rules of the process with ``time.tzset()``
+    where available.  Threads racing on first use or on a change may each build one,
+    which is harmless as they are equal.
+
+    """
+
+    global _local, _local_checked, _local_source_key
+
+    now = time.monotonic()
+
+    if _local is not None and now - _local_checked < LOCAL_CHECK_INTERVAL:
+        return _local
+
+    source = _local_source()
+
+    if _local is None or source != _local_source_key:
+        if _local is not None and hasattr(time, "tzset"):
+            time.tzset()
+
+        _local = dateutil_tz.tzlocal()
+        _local_source_key = source
+
+    _local_checked = now
+
+    return _local
+
+
+def has_fixed_offset(tzinfo: dt_tzinfo) -> bool:
+    """Returns whether the offset of a timezone never changes, so that every wall time
+    exists in it exactly once.
+
+    Besides the types of :data:`FIXED_OFFSET_TYPES`, zones giving an offset without a
+    ``datetime``, as fixed offset zones do, and dateutil ``tzfile`` zones without
+    transitions have a fixed offset.  Results are cached per timezone object.
+
+    :param tzinfo: the timezone.
+
+    """
+
+    if isinstance(tzinfo, FIXED_OFFSET_TYPES):
+        return True
+
+    entry = _fixed_offsets.get(id(tzinfo))
+
+    if entry is not None and entry[0] is tzinfo:
+        return entry[1]
+
+    if isinstance(tzinfo, dateutil_tz.tzfile):
+        fixed = not tzinfo._trans_list  # type: ignore[attr-defined]
+    else:
+        fixed = tzinfo.utcoffset(None) is not None
+
+    # threads racing here at worst classify a timezone twice
+    if len(_fixed_offsets) >= _FIXED_OFFSETS_SIZE:
+        _fixed_offsets.clear()
+    _fixed_offsets[id(tzinfo)] = (tzinfo, fixed)
+
+    return fixed
+
+
+def transition_windows(
+    tzinfo: dt_tzinfo, start: datetime
+) -> Iterator[Tuple[datetime, datetime]]:
+    """Yields the windows of wall times around the offset transitions of a timezone from
+    a wall time on, in order.  Every wall time outside of them exists.
+
+    Zones with a fixed offset have none, and the transitions of dateutil ``tzfile`` zones
+    are read from their tables.  Any other zone gets a single window holding every wall
+    time, as its transitions are unknown.
+
+    :param tzinfo: the timezone.
+    :param start: the ``datetime`` from which on windows are needed, in ``tzinfo``.
+
+    """
+
+    if has_fixed_offset(tzinfo):
+        return
+
+    if not isinstance(tzinfo, dateutil_tz.tzfile):
+        yield datetime.min.replace(tzinfo=tzinfo), datetime.max.replace(tzinfo=tzinfo)
+        return
+
+    # a transition at a UTC time moves wall times between its offsets before and after it
+    offsets = [ttinfo.offset for ttinfo in tzinfo._ttinfo_list]  # type: ignore[attr-defined]
+    low = min(offsets, default=0) - _TRANSITION_MARGIN
+    high = max(offsets, default=0) + _TRANSITION_MARGIN
+
+    transitions = tzinfo._trans_list_utc  # type: ignore[attr-defined]
+    wall = (start.replace(tzinfo=None) - _WALL_EPOCH) // _SECOND
+
+    for transition in transitions[bisect_left(transitions, wall - high) :]:
+        yield (
+            (_WALL_EPOCH + timedelta(seconds=transition + low)).replace(tzinfo=tzinfo),
+            (_WALL_EPOCH + timedelta(seconds=transition + high)).replace(tzinfo=tzinfo),
+        )
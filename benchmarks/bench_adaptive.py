@@ -0,0 +1,54 @@
+"""Compares :class:`AdaptiveDateTimeParser <arrow.parser.AdaptiveDateTimeParser>` with
+:class:`DateTimeParser <arrow.parser.DateTimeParser>` on format lists where most inputs
+match a format late in the list.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_adaptive.py -o adaptive.json
+"""
+
+from typing import List
+
+import pyperf
+
+from arrow.parser import AdaptiveDateTimeParser, DateTimeParser
+
+FORMATS = [
+    "MM/DD/YYYY HH:mm:ss",
+    "DD.MM.YYYY HH:mm:ss",
+    "YYYY/MM/DD HH:mm:ss",
+    "ddd, DD MMM YYYY HH:mm:ss Z",
+    "YYYY-MM-DD HH:mm:ss",
+    "YYYY-MM-DDTHH:mm:ssZZ",
+]
+
+CASES = [
+    (
+        "last format",
+        [f"2021-{month:02d}-12T14:{month:02d}:00+01:00" for month in range(1, 13)],
+    ),
+    ("mostly one format", ["2021-10-12 14:30:00"] * 9 + ["10/12/2021 14:30:00"]),
+]
+
+
+def parse_all(parser: DateTimeParser, strings: List[str]) -> None:
+    for string in strings:
+        parser.parse(string, FORMATS)
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+
+    for name, strings in CASES:
+        for parser in [
+            DateTimeParser(cache_size=64),
+            AdaptiveDateTimeParser(cache_size=64),
+        ]:
+            runner.bench_func(
+                f"{type(parser).__name__} {name}", parse_all, parser, strings
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Measures :meth:`Arrow.format <arrow.arrow.Arrow.format>` with the standard format
+constants and with localized tokens.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_format.py -o format.json
+"""
+
+import pyperf
+
+import arrow
+
+CONSTANTS = [
+    "FORMAT_ATOM",
+    "FORMAT_COOKIE",
+    "FORMAT_RFC822",
+    "FORMAT_RFC2822",
+    "FORMAT_RFC3339",
+    "FORMAT_RSS",
+]
+
+LOCALIZED = [
+    ("en-us", "dddd, MMMM Do YYYY h:mm a"),
+    ("fr-fr", "dddd D MMMM YYYY HH:mm"),
+    ("ja-jp", "YYYY年M月D日 dddd HH:mm"),
+    ("ru-ru", "dddd, D MMMM YYYY HH:mm"),
+]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    dt = arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456, tzinfo="Europe/Paris")
+
+    runner.bench_func("format default", dt.format)
+    runner.bench_func("isoformat", dt.isoformat)
+
+    for name in CONSTANTS:
+        runner.bench_func(f"format {name}", dt.format, getattr(arrow, name))
+
+    for locale, fmt in LOCALIZED:
+        runner.bench_func(f"format {locale}", dt.format, fmt, locale)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Measures :func:`arrow.get` for the most common kinds of input.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_get.py -o get.json
+"""
+
+from datetime import datetime, timezone
+
+import pyperf
+
+import arrow
+
+CASES = [
+    ("ISO 8601 date", ("2013-05-05",)),
+    ("ISO 8601 datetime", ("2013-05-05T12:30:45.123456+01:00",)),
+    ("ISO 8601 week date", ("2013-W18-7",)),
+    ("format", ("2013-05-05 12:30:45", "YYYY-MM-DD HH:mm:ss")),
+    ("format with names", ("Sunday, May 5 2013 12:30 pm", "dddd, MMMM D YYYY h:mm a")),
+    ("format list", ("05/05/2013", ["YYYY-MM-DD", "MM/DD/YYYY"])),
+    ("timestamp", (1367757045.123456,)),
+    ("timestamp string", ("1367757045.123456", "X")),
+    ("datetime", (datetime(2013, 5, 5, 12, 30, 45, tzinfo=timezone.utc),)),
+    ("naive datetime", (datetime(2013, 5, 5, 12, 30, 45),)),
+]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+
+    for name, args in CASES:
+        runner.bench_func(f"get {name}", arrow.get, *args)
+
+    runner.bench_func(
+        "get format with tzinfo",
+        lambda: arrow.get(
+            "2013-05-05 12:30:45", "YYYY-MM-DD HH:mm:ss", tzinfo="US/Pacific"
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measures :meth:`Arrow.shift <arrow.arrow.Arrow.shift>`,
+:meth:`Arrow.to <arrow.arrow.Arrow.to>`,
+:meth:`Arrow.humanize <arrow.arrow.Arrow.humanize>` and
+:meth:`Arrow.dehumanize <arrow.arrow.Arrow.dehumanize>`.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_humanize.py -o humanize.json
+"""
+
+import pyperf
+
+import arrow
+
+SHIFTS = [
+    ("seconds", {"seconds": 90}),
+    ("days", {"days": 3}),
+    ("months", {"months": 14}),
+    ("mixed", {"years": 1, "weeks": -2, "hours": 5}),
+    ("weekday", {"weekday": 4}),
+]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    dt = arrow.Arrow(2013, 5, 5, 12, 30, 45, tzinfo="US/Pacific")
+    other = dt.shift(days=-3, hours=-2)
+
+    for name, kwargs in SHIFTS:
+        runner.bench_func(f"shift {name}", lambda kwargs=kwargs: dt.shift(**kwargs))
+
+    runner.bench_func("shift across DST", dt.shift, hours=24 * 180)
+    runner.bench_func("to UTC", dt.to, "UTC")
+    runner.bench_func("to named zone", dt.to, "Asia/Tokyo")
+
+    runner.bench_func("humanize", dt.humanize, other)
+    runner.bench_func("humanize fr", dt.humanize, other, "fr")
+    runner.bench_func(
+        "humanize granularity", dt.humanize, other, granularity=["day", "hour"]
+    )
+    runner.bench_func("dehumanize", dt.dehumanize, "in 3 days")
+    runner.bench_func("dehumanize compound", dt.dehumanize, "2 hours and 3 minutes ago")
+    runner.bench_func("dehumanize fr", dt.dehumanize, "il y a 3 jours", "fr")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Measures how long ``import arrow`` takes in a fresh interpreter.
+
+The start up of a bare interpreter is measured as well, as a baseline.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_import.py -o import.json
+"""
+
+import sys
+
+import pyperf
+
+
+def main() -> None:
+    runner = pyperf.Runner(values=5, processes=10)
+
+    runner.bench_command("python startup", [sys.executable, "-c", "pass"])
+    runner.bench_command("import arrow", [sys.executable, "-c", "import arrow"])
+
+
+if __name__ == "__main__":
+    main()
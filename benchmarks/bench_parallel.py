@@ -0,0 +1,45 @@
+"""Measures how :func:`arrow.parallel.parse_many` scales with the number of workers.
+
+Each run parses 200,000 strings, including the start up of the worker processes.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_parallel.py -o parallel.json
+"""
+
+import os
+
+import pyperf
+
+from arrow import parallel
+
+FMT = "YYYY-MM-DD HH:mm:ss"
+
+STRINGS = [
+    f"2021-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:00"
+    for month in range(1, 13)
+    for day in range(1, 29)
+    for hour in range(0, 24, 2)
+    for minute in range(0, 60, 1)
+][:200_000]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    cpus = os.cpu_count() or 1
+
+    workers = 1
+    while workers < cpus:
+        runner.bench_func(
+            f"parse_many workers={workers}", parallel.parse_many, STRINGS, FMT, workers
+        )
+        workers *= 2
+
+    runner.bench_func(
+        f"parse_many workers={cpus}", parallel.parse_many, STRINGS, FMT, cpus
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measures :meth:`Arrow.range <arrow.arrow.Arrow.range>`,
+:meth:`Arrow.span_range <arrow.arrow.Arrow.span_range>` and
+:meth:`Arrow.interval <arrow.arrow.Arrow.interval>` at several frames.
+
+Each benchmark builds the complete list of about a thousand values.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_range.py -o range.json
+"""
+
+from datetime import timedelta
+from typing import Any, Callable, Iterator
+
+import pyperf
+
+import arrow
+
+START = arrow.Arrow(2013, 5, 5, 12, 30, 45, tzinfo="US/Pacific")
+
+FRAMES = [
+    ("minute", timedelta(minutes=1000)),
+    ("hour", timedelta(hours=1000)),
+    ("day", timedelta(days=1000)),
+    ("week", timedelta(weeks=1000)),
+    ("month", timedelta(days=30 * 1000)),
+    ("year", timedelta(days=365 * 1000)),
+]
+
+
+def consume(fn: Callable[..., Iterator[Any]], *args: Any) -> None:
+    list(fn(*args))
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+
+    for frame, length in FRAMES:
+        end = START + length
+
+        runner.bench_func(
+            f"range {frame}", consume, arrow.Arrow.range, frame, START, end
+        )
+        runner.bench_func(
+            f"span_range {frame}", consume, arrow.Arrow.span_range, frame, START, end
+        )
+        runner.bench_func(
+            f"interval {frame}", consume, arrow.Arrow.interval, frame, START, end, 7
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compares the ``dateutil`` and ``zoneinfo`` timezone backends of :mod:`arrow.zones` on
+conversion-heavy workloads: converting to a named timezone, getting in one, shifting and
+ranging over a daylight saving time change.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_tz.py -o tz.json
+"""
+
+from typing import Callable
+
+import pyperf
+
+import arrow
+from arrow import zones
+
+BACKENDS = ["dateutil", "zoneinfo"]
+TZ = "US/Pacific"
+
+
+def bench_backend(
+    loops: int, backend: str, setup: Callable[[], Callable[[], object]]
+) -> float:
+    zones.set_backend(backend)
+    func = setup()
+
+    start = pyperf.perf_counter()
+
+    for _ in range(loops):
+        func()
+
+    return pyperf.perf_counter() - start
+
+
+def to_named() -> Callable[[], object]:
+    dt = arrow.Arrow(2013, 3, 10, 9, 30)
+
+    return lambda: dt.to(TZ)
+
+
+def get_named() -> Callable[[], object]:
+    return lambda: arrow.get("2013-03-10T01:30:00", tzinfo=TZ)
+
+
+def shift_named() -> Callable[[], object]:
+    dt = arrow.Arrow(2013, 3, 10, 1, 30, tzinfo=TZ)
+
+    return lambda: dt.shift(hours=1)
+
+
+def range_named() -> Callable[[], object]:
+    start = arrow.Arrow(2013, 3, 7, tzinfo=TZ)
+    end = arrow.Arrow(2013, 3, 14, tzinfo=TZ)
+
+    return lambda: list(arrow.Arrow.range("hour", start, end))
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+
+    for backend in BACKENDS:
+        for name, setup in [
+            ("to", to_named),
+            ("get", get_named),
+            ("shift", shift_named),
+            ("range hour", range_named),
+        ]:
+            runner.bench_time_func(
+                f"{name} {TZ} {backend}", bench_backend, backend, setup
+            )
+
+
+if __name__ == "__main__":
+    main()
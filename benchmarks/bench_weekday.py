@@ -0,0 +1,41 @@
+"""Compares parsing weekday-only formats with parsing full dates.
+
+Weekday-only formats such as ``"dddd HH:mm"`` resolve the date with
+:func:`arrow.util.next_weekday` and should parse about as fast as a full date.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_weekday.py -o weekday.json
+"""
+
+import pyperf
+
+from arrow.parser import DateTimeParser
+from arrow.util import next_weekdays
+
+CASES = [
+    ("full date", "2021-10-11 10:00", "YYYY-MM-DD HH:mm"),
+    ("weekday", "Monday 10:00", "dddd HH:mm"),
+    ("weekday abbreviation", "Mon 10:00", "ddd HH:mm"),
+    ("weekday and month", "Monday October 2021", "dddd MMMM YYYY"),
+]
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    parser = DateTimeParser(cache_size=len(CASES))
+
+    for name, string, fmt in CASES:
+        runner.bench_func(f"parse {name}", parser.parse, string, fmt)
+
+    runner.bench_func(
+        "next_weekdays x1000",
+        next_weekdays,
+        [parser.parse(f"{year}-01-01", "YYYY-MM-DD") for year in range(1000, 2000)],
+        0,
+    )
+
+
+if __name__ == "__main__":
+    main()
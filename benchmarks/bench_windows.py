@@ -0,0 +1,60 @@
+"""Measures the event throughput of :mod:`arrow.windows`.
+
+Each benchmark streams a hundred thousand events, one per millisecond, through tumbling
+and sliding windows. Timings are per event.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/bench_windows.py -o windows.json
+"""
+
+from datetime import timedelta
+from typing import Any, List
+
+import pyperf
+
+import arrow
+from arrow.windows import SlidingWindows, TumblingWindows
+
+START = arrow.Arrow(2013, 5, 5, 12, 30, 45)
+
+EVENTS = [START.shift(microseconds=1000 * i) for i in range(100_000)]
+
+
+def consume(windows: SlidingWindows, events: List[Any]) -> None:
+    for _ in windows.process(events):
+        pass
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    loops = len(EVENTS)
+
+    runner.bench_func(
+        "tumbling second",
+        lambda: consume(TumblingWindows("second", aggregate=len), EVENTS),
+        inner_loops=loops,
+    )
+    runner.bench_func(
+        "tumbling second lateness",
+        lambda: consume(
+            TumblingWindows("second", lateness=timedelta(seconds=5), aggregate=len),
+            EVENTS,
+        ),
+        inner_loops=loops,
+    )
+    runner.bench_func(
+        "sliding 10 seconds every second",
+        lambda: consume(SlidingWindows("second", 10, step=1, aggregate=len), EVENTS),
+        inner_loops=loops,
+    )
+    runner.bench_func(
+        "sliding 3 seconds every 2 seconds",
+        lambda: consume(SlidingWindows("second", 3, step=2, aggregate=len), EVENTS),
+        inner_loops=loops,
+    )
+
+
+if __name__ == "__main__":
+    main()
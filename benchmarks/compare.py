@@ -0,0 +1,161 @@
+"""Compares the benchmarks of two git revisions.
+
+Each revision is checked out into a temporary git worktree, and the benchmark scripts of
+the current checkout are run against it, so revisions from before a benchmark was added
+can still be measured. Results are written to the output directory as
+``<revision>-<benchmark>.json`` and compared with ``pyperf compare_to``.
+
+Benchmarks that fail on a revision, for example because it lacks the API they measure,
+are reported and left out of the comparison. Arguments after ``--`` are passed on to
+every benchmark script.
+
+Usage::
+
+    pip install -r requirements/requirements-bench.txt
+    python benchmarks/compare.py 1.3.0 HEAD
+    python benchmarks/compare.py main HEAD -b bench_get.py bench_format.py -- --fast
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCHMARKS_DIR.parent
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args, extra = _parse_args(argv)
+
+    benchmarks = args.benchmarks or sorted(
+        path.name for path in BENCHMARKS_DIR.glob("bench_*.py")
+    )
+    # benchmarks run from the temporary worktrees, so a relative path would land there
+    output = Path(args.output).resolve()
+    output.mkdir(parents=True, exist_ok=True)
+
+    results: Dict[str, Dict[str, Path]] = {}
+
+    for revision in (args.base, args.head):
+        results[revision] = _run_revision(revision, benchmarks, output, extra)
+
+    base, head = results[args.base], results[args.head]
+    status = 0
+
+    for benchmark in benchmarks:
+        if benchmark not in base or benchmark not in head:
+            print(f"Skipping {benchmark}: it did not run on both revisions.")
+            status = 1
+            continue
+
+        print(f"\n### {benchmark}\n", flush=True)
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pyperf",
+                "compare_to",
+                "--table",
+                str(base[benchmark]),
+                str(head[benchmark]),
+            ],
+            check=True,
+        )
+
+    return status
+
+
+def _parse_args(argv: Optional[List[str]]) -> Tuple[argparse.Namespace, List[str]]:
+    parser = argparse.ArgumentParser(
+        description="Compare arrow benchmarks between two git revisions."
+    )
+    parser.add_argument("base", help="the git revision to compare against")
+    parser.add_argument(
+        "head", nargs="?", default="HEAD", help="the git revision to compare"
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmarks",
+        nargs="+",
+        metavar="SCRIPT",
+        help="the benchmark scripts to run (default: every bench_*.py)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="bench_results",
+        help="the directory for the JSON results (default: bench_results)",
+    )
+
+    argv = sys.argv[1:] if argv is None else argv
+    extra: List[str] = []
+    if "--" in argv:
+        index = argv.index("--")
+        argv, extra = argv[:index], argv[index + 1 :]
+
+    return parser.parse_args(argv), extra
+
+
+def _run_revision(
+    revision: str, benchmarks: List[str], output: Path, extra: List[str]
+) -> Dict[str, Path]:
+    commit = _git("rev-parse", "--verify", f"{revision}^{{commit}}")
+    slug = re.sub(r"[^\w.-]+", "_", revision)
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="arrow-bench-") as tmp:
+        worktree = Path(tmp, "arrow")
+        _git("worktree", "add", "--detach", str(worktree), commit)
+
+        try:
+            env = dict(os.environ)
+            env["PYTHONPATH"] = str(worktree)
+
+            for benchmark in benchmarks:
+                result = output / f"{slug}-{Path(benchmark).stem}.json"
+                if result.exists():
+                    result.unlink()
+
+                print(f"Running {benchmark} on {revision} ({commit[:10]})", flush=True)
+                completed = subprocess.run(
+                    [
+                        sys.executable,
+                        str(BENCHMARKS_DIR / benchmark),
+                        "-o",
+                        str(result),
+                        # pyperf workers only see the worktree through PYTHONPATH
+                        "--inherit-environ=PYTHONPATH",
+                        *extra,
+                    ],
+                    env=env,
+                    cwd=tmp,
+                )
+
+                if completed.returncode == 0:
+                    results[benchmark] = result
+                else:
+                    print(f"{benchmark} failed on {revision}.", file=sys.stderr)
+
+        finally:
+            _git("worktree", "remove", "--force", str(worktree))
+
+    return results
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args],
+        cwd=REPO_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,16 @@ class TestModule:
 
         assert arrow.api.get() == "result"
 
+    def test_try_get(self, mocker):
+        mocker.patch("arrow.api._factory.try_get", return_value="result")
+
+        assert arrow.api.try_get() == "result"
+
+    def test_scan(self, mocker):
+        mocker.patch("arrow.api._factory.scan", return_value="result")
+
+        assert arrow.api.scan("log", "YYYY") == "result"
+
     def test_utcnow(self, mocker):
         mocker.patch("arrow.api._factory.utcnow", return_value="utcnow")
 
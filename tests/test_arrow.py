@@ -1,17 +1,20 @@
+import calendar
 import pickle
+import random
 import sys
 import time
+from array import array
 from datetime import date, datetime, timedelta, timezone
-from typing import List
+from typing import Any, List
 
 import dateutil
 import pytest
 import pytz
 import simplejson as json
 from dateutil import tz
-from dateutil.relativedelta import FR, MO, SA, SU, TH, TU, WE
+from dateutil.relativedelta import FR, MO, SA, SU, TH, TU, WE, relativedelta
 
-from arrow import arrow, locales
+from arrow import arrow, locales, zones
 
 from .utils import assert_datetime_equality
 
@@ -95,6 +98,31 @@ class TestTestArrowFactory:
         )
 
         assert result.fold == 0
+        assert result.tzinfo is zones.UTC
+
+    def test_now_shares_zones(self):
+        assert arrow.Arrow.now().tzinfo is zones.local()
+        assert arrow.Arrow.fromtimestamp(0).tzinfo is zones.local()
+
+    def test_now_pytz_timezone(self):
+        result = arrow.Arrow.now(pytz.timezone("Europe/Paris"))
+
+        assert isinstance(result.tzinfo, tz.tzfile)
+        assert_datetime_equality(
+            result._datetime, datetime.now(tz.gettz("Europe/Paris"))
+        )
+
+    def test_now_subclass(self):
+        class LabelledArrow(arrow.Arrow):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                self.label = "now"
+
+        result = LabelledArrow.utcnow()
+
+        assert isinstance(result, LabelledArrow)
+        assert result.label == "now"
+        assert_datetime_equality(result._datetime, datetime.now(tz.tzutc()))
 
     def test_fromtimestamp(self):
         timestamp = time.time()
@@ -130,6 +158,84 @@ class TestTestArrowFactory:
         with pytest.raises(ValueError):
             arrow.Arrow.utcfromtimestamp("invalid timestamp")
 
+    def test_from_epoch_ms(self):
+        result = arrow.Arrow.from_epoch_ms(1367757045123)
+
+        assert result._datetime == datetime(
+            2013, 5, 5, 12, 30, 45, 123000, tzinfo=tz.tzutc()
+        )
+        assert result.tzinfo is zones.UTC
+
+        assert arrow.Arrow.from_epoch_ms(-1) == arrow.Arrow(
+            1969, 12, 31, 23, 59, 59, 999000
+        )
+
+    def test_from_epoch_us(self):
+        # 2 ** 53 + 1 cannot be represented exactly as a float
+        result = arrow.Arrow.from_epoch_us(2**53 + 1)
+
+        assert result == arrow.Arrow(1970, 1, 1) + timedelta(microseconds=2**53 + 1)
+        assert result.microsecond == 740993
+
+    def test_from_epoch_ns(self):
+        result = arrow.Arrow.from_epoch_ns(1367757045123456789)
+
+        assert result == arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456)
+
+        # truncated towards the past
+        assert arrow.Arrow.from_epoch_ns(-1) == arrow.Arrow(
+            1969, 12, 31, 23, 59, 59, 999999
+        )
+
+    def test_from_epoch_tzinfo(self):
+        result = arrow.Arrow.from_epoch_ms(1367757045123, "US/Pacific")
+
+        assert result._datetime == datetime(
+            2013, 5, 5, 5, 30, 45, 123000, tzinfo=tz.gettz("US/Pacific")
+        )
+
+        result = arrow.Arrow.from_epoch_us(0, tz.tzoffset(None, 3600))
+        assert result._datetime == datetime(
+            1970, 1, 1, 1, tzinfo=tz.tzoffset(None, 3600)
+        )
+
+        result = arrow.Arrow.from_epoch_ns(0, pytz.timezone("Europe/Paris"))
+        assert result.tzinfo == tz.gettz("Europe/Paris")
+        assert result.hour == 1
+
+    def test_from_epoch_out_of_range(self):
+        with pytest.raises(OverflowError):
+            arrow.Arrow.from_epoch_ms(2**62)
+
+    def test_from_epochs(self):
+        values = [1367757045123, -1, 0]
+        expected = [arrow.Arrow.from_epoch_ms(value) for value in values]
+
+        assert arrow.Arrow.from_epochs(values) == expected
+        assert arrow.Arrow.from_epochs(array("q", values)) == expected
+        assert arrow.Arrow.from_epochs(memoryview(array("q", values))) == expected
+        assert arrow.Arrow.from_epochs(array("q", values).tobytes()) == expected
+        assert arrow.Arrow.from_epochs(bytearray(array("q", values))) == expected
+        assert arrow.Arrow.from_epochs(iter(values)) == expected
+        assert arrow.Arrow.from_epochs([]) == []
+
+    def test_from_epochs_units(self):
+        values = [1367757045123456789, -1]
+
+        for unit in ["ms", "us", "ns"]:
+            from_epoch = getattr(arrow.Arrow, f"from_epoch_{unit}")
+            assert arrow.Arrow.from_epochs(values[1:], unit) == [from_epoch(values[1])]
+
+        assert arrow.Arrow.from_epochs(values, "ns", "Europe/Paris") == [
+            arrow.Arrow.from_epoch_ns(value, "Europe/Paris") for value in values
+        ]
+        assert arrow.Arrow.from_epochs(values, unit="ns", tzinfo=tz.tzlocal()) == [
+            arrow.Arrow.from_epoch_ns(value, tz.tzlocal()) for value in values
+        ]
+
+        with pytest.raises(ValueError, match="Unsupported epoch unit 's'"):
+            arrow.Arrow.from_epochs(values, "s")
+
     def test_fromdatetime(self):
         dt = datetime(2013, 2, 3, 12, 30, 45, 1)
 
@@ -276,6 +382,49 @@ class TestArrowAttribute:
     def test_float_timestamp(self):
         assert self.arrow.float_timestamp == self.arrow._datetime.timestamp()
 
+    def test_int_timestamp_units(self):
+        dt = arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456, tzinfo="US/Pacific")
+
+        assert dt.int_timestamp_ms == 1367782245123
+        assert dt.int_timestamp_us == 1367782245123456
+        assert dt.int_timestamp_ns == 1367782245123456000
+
+        before = arrow.Arrow(1969, 12, 31, 23, 59, 59, 999999)
+        assert before.int_timestamp_ms == -1
+        assert before.int_timestamp_us == -1
+
+        far = arrow.Arrow.max
+        assert far.int_timestamp_us == 253402300799999999
+        assert arrow.Arrow.from_epoch_us(far.int_timestamp_us) == far
+        assert arrow.Arrow.from_epoch_ns(far.int_timestamp_ns) == far
+
+    def test_to_epochs(self):
+        values = [
+            arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456, tzinfo="US/Pacific"),
+            datetime(1969, 12, 31, 23, 59, 59, 999999),
+            datetime(1970, 1, 1, 1, tzinfo=tz.tzoffset(None, 3600)),
+        ]
+
+        result = arrow.Arrow.to_epochs(values)
+
+        assert isinstance(result, array)
+        assert result.typecode == "q"
+        assert list(result) == [1367782245123, -1, 0]
+        assert list(arrow.Arrow.to_epochs(values, "us")) == [1367782245123456, -1, 0]
+        assert list(arrow.Arrow.to_epochs(iter(values), unit="ns")) == [
+            1367782245123456000,
+            -1000,
+            0,
+        ]
+        assert arrow.Arrow.to_epochs([]) == array("q")
+
+        assert arrow.Arrow.from_epochs(
+            arrow.Arrow.to_epochs(values[:1], "us"), "us"
+        ) == [values[0].to("UTC")]
+
+        with pytest.raises(ValueError, match="Unsupported epoch unit 's'"):
+            arrow.Arrow.to_epochs(values, "s")
+
     def test_getattr_fold(self):
         # UTC is always unambiguous
         assert self.now.fold == 0
@@ -868,6 +1017,41 @@ class TestArrowShift:
             1995, 1, 1, 12, 30, tzinfo="Pacific/Kiritimati"
         )
 
+    def test_shift_fixed_offset_skips_imaginary_check(self, mocker):
+        datetime_exists = mocker.spy(arrow.dateutil_tz, "datetime_exists")
+
+        arrow.Arrow(2013, 5, 5, tzinfo="+05:30").shift(hours=1, months=1)
+        arrow.Arrow(2013, 5, 5, tzinfo="Etc/GMT+5").shift(days=1)
+        assert datetime_exists.call_count == 0
+
+        arrow.Arrow(2013, 5, 5, tzinfo="US/Pacific").shift(days=1)
+        assert datetime_exists.call_count == 1
+
+    @pytest.mark.parametrize("tzinfo", ["UTC", "US/Pacific", "Australia/Lord_Howe"])
+    def test_shift_matches_relativedelta(self, tzinfo):
+        rng = random.Random(tzinfo)
+        units = ["weeks", "days", "hours", "minutes", "seconds", "microseconds"]
+
+        for _ in range(500):
+            start = arrow.Arrow(
+                2019, rng.randrange(1, 13), rng.randrange(1, 29), tzinfo=tzinfo
+            ).shift(minutes=rng.randrange(1440))
+            kwargs = {unit: rng.randrange(-100, 100) for unit in rng.sample(units, 2)}
+
+            expected = start.datetime + relativedelta(**kwargs)
+            if not tz.datetime_exists(expected):
+                expected = tz.resolve_imaginary(expected)
+
+            assert start.shift(**kwargs).datetime == expected
+
+    def test_shift_fractional_units(self):
+        now = arrow.Arrow(2013, 5, 5, 12, 30)
+
+        assert now.shift(days=0.5) == now.shift(hours=12)
+        assert now.shift(weeks=1.5, hours=-0.25) == now.shift(
+            days=10, hours=11, minutes=45
+        )
+
     def shift_imaginary_seconds(self):
         # offset has a seconds component
         monrovia = arrow.Arrow(1972, 1, 6, 23, tzinfo="Africa/Monrovia")
@@ -1120,6 +1304,111 @@ class TestArrowRange:
             arrow.Arrow(2016, 2, 29),
         ]
 
+    def test_range_over_plural_months_keeps_clipped_day(self):
+        result = list(arrow.Arrow.range("months", datetime(2015, 1, 31), limit=3))
+        assert result == [
+            arrow.Arrow(2015, 1, 31),
+            arrow.Arrow(2015, 2, 28),
+            arrow.Arrow(2015, 3, 28),
+        ]
+
+    def test_range_over_months_from_imaginary_midnight(self):
+        # 1982-04-01T00:00 was skipped in Tripoli
+        result = list(
+            arrow.Arrow.range(
+                "month", datetime(1982, 3, 1), limit=3, tz="Africa/Tripoli"
+            )
+        )
+        assert result == [
+            arrow.Arrow(1982, 3, 1, tzinfo="Africa/Tripoli"),
+            arrow.Arrow(1982, 4, 1, 1, tzinfo="Africa/Tripoli"),
+            arrow.Arrow(1982, 5, 1, 1, tzinfo="Africa/Tripoli"),
+        ]
+
+    def test_range_over_skipped_day(self):
+        # Kiritimati skipped 1994-12-31 moving across the date line
+        result = list(
+            arrow.Arrow.range(
+                "hour",
+                datetime(1994, 12, 30, 22),
+                datetime(1995, 1, 1, 1),
+                tz="Pacific/Kiritimati",
+            )
+        )
+        assert result == [
+            arrow.Arrow(1994, 12, 30, 22, tzinfo="Pacific/Kiritimati"),
+            arrow.Arrow(1994, 12, 30, 23, tzinfo="Pacific/Kiritimati"),
+            arrow.Arrow(1995, 1, 1, 0, tzinfo="Pacific/Kiritimati"),
+            arrow.Arrow(1995, 1, 1, 1, tzinfo="Pacific/Kiritimati"),
+        ]
+
+    def test_range_over_half_hour_dst_change(self):
+        result = list(
+            arrow.Arrow.range(
+                "minute",
+                datetime(2019, 10, 6, 1, 58),
+                limit=4,
+                tz="Australia/Lord_Howe",
+            )
+        )
+        assert [r.format("HH:mm") for r in result] == [
+            "01:58",
+            "01:59",
+            "02:30",
+            "02:31",
+        ]
+
+    @pytest.mark.parametrize(
+        "tzinfo", ["US/Pacific", "Europe/London", tz.tzstr("EST5EDT,M3.2.0,M11.1.0")]
+    )
+    @pytest.mark.parametrize("frame", ["minute", "hour", "hours", "day", "week"])
+    def test_frames_match_shift(self, frame, tzinfo):
+        rng = random.Random(frame)
+        steps = {arrow.Arrow._get_frames(frame)[1]: 1}
+        # the DST changes of 2019 in the United States and in Europe
+        changes = [(2019, 3, 10), (2019, 3, 31), (2019, 10, 27), (2019, 11, 3)]
+
+        for _ in range(10):
+            start = arrow.Arrow(*rng.choice(changes), 1, 30, tzinfo=tzinfo).shift(
+                **{unit: -rng.randrange(100) for unit in steps}
+            )
+
+            expected = [start]
+            while len(expected) < 200:
+                expected.append(expected[-1].shift(**steps))
+
+            assert list(arrow.Arrow.range(frame, start, limit=200)) == expected
+
+    @pytest.mark.parametrize("frame", ["month", "months", "quarter", "year"])
+    def test_calendar_frames_match_shift(self, frame):
+        rng = random.Random(frame)
+        steps = {"quarter": {"months": 3}, "year": {"years": 1}}.get(
+            frame, {"months": 1}
+        )
+
+        for _ in range(50):
+            tzinfo = rng.choice(["UTC", "US/Pacific", "Africa/Tripoli"])
+            start = arrow.Arrow(
+                rng.randrange(1980, 2030),
+                rng.randrange(1, 13),
+                rng.randrange(1, 29) if rng.random() < 0.5 else 28,
+                rng.choice([0, 2, 23]),
+                tzinfo=tzinfo,
+            ).shift(days=rng.choice([0, 1, 2, 3]))
+
+            expected = [start]
+            clipped = False
+            while len(expected) < 40:
+                current = expected[-1].shift(**steps)
+                if frame != "months" and current.day < start.day:
+                    clipped = True
+                last_day = calendar.monthrange(current.year, current.month)[1]
+                if clipped and current.day != last_day:
+                    current = current.replace(day=start.day)
+                expected.append(current)
+
+            assert list(arrow.Arrow.range(frame, start, limit=40)) == expected
+
 
 class TestArrowSpanRange:
     def test_year(self):
@@ -1534,6 +1823,22 @@ class TestArrowSpanRange:
 
         assert result == expected
 
+    @pytest.mark.parametrize("frame", ["month", "quarters", "year"])
+    @pytest.mark.parametrize("bounds", ["[)", "()", "(]", "[]"])
+    def test_calendar_frames_match_span(self, frame, bounds):
+        for tzinfo in ["UTC", "US/Pacific", "Africa/Tripoli", "Africa/Casablanca"]:
+            start = arrow.Arrow(1975, 2, 14, tzinfo=tzinfo)
+            end = arrow.Arrow(1990, 11, 3, tzinfo=tzinfo)
+
+            expected = [
+                r.span(frame, bounds=bounds)
+                for r in arrow.Arrow.range(frame, start.span(frame)[0], end)
+            ]
+
+            assert list(arrow.Arrow.span_range(frame, start, end, bounds=bounds)) == (
+                expected
+            )
+
 
 class TestArrowInterval:
     def test_incorrect_input(self):
@@ -2864,18 +3169,36 @@ class TestArrowIsBetween:
         end = arrow.Arrow.fromdatetime(datetime(2020, 12, 26))
         assert not target.is_between(start, end, "[]")
 
+    def test_datetime_bounds(self):
+        target = arrow.Arrow.fromdatetime(datetime(2013, 5, 7))
+
+        assert target.is_between(datetime(2013, 5, 5), arrow.Arrow(2013, 5, 8))
+        assert target.is_between(arrow.Arrow(2013, 5, 5), datetime(2013, 5, 8))
+        assert target.is_between(datetime(2013, 5, 7), datetime(2013, 5, 7), "[]")
+        assert not target.is_between(
+            datetime(2013, 5, 7, 1, tzinfo=tz.tzoffset(None, 3600)),
+            datetime(2013, 5, 8),
+            "()",
+        )
+
+    def test_ambiguous_bounds(self):
+        # the same wall time twice, an hour apart
+        first = arrow.Arrow(2017, 10, 29, 2, 30, tzinfo="Europe/Stockholm")
+        second = arrow.Arrow(2017, 10, 29, 2, 30, tzinfo="Europe/Stockholm", fold=1)
+        middle = first.to("UTC").shift(minutes=30)
+
+        assert middle.is_between(first, second)
+        assert not first.is_between(first, second)
+        assert first.is_between(first, second, "[)")
+
     def test_type_error_exception(self):
-        with pytest.raises(TypeError):
-            target = arrow.Arrow.fromdatetime(datetime(2013, 5, 7))
-            start = datetime(2013, 5, 5)
-            end = arrow.Arrow.fromdatetime(datetime(2013, 5, 8))
-            target.is_between(start, end)
+        target = arrow.Arrow.fromdatetime(datetime(2013, 5, 7))
 
-        with pytest.raises(TypeError):
-            target = arrow.Arrow.fromdatetime(datetime(2013, 5, 7))
-            start = arrow.Arrow.fromdatetime(datetime(2013, 5, 5))
-            end = datetime(2013, 5, 8)
-            target.is_between(start, end)
+        with pytest.raises(TypeError, match="start date argument type"):
+            target.is_between(date(2013, 5, 5), arrow.Arrow(2013, 5, 8))
+
+        with pytest.raises(TypeError, match="end date argument type of <class 'int'>"):
+            target.is_between(arrow.Arrow(2013, 5, 5), 1367971200)
 
         with pytest.raises(TypeError):
             target.is_between(None, None)
@@ -2898,6 +3221,108 @@ class TestArrowIsBetween:
             target.span("week", week_start=55)
 
 
+class TestArrowBetweenMask:
+    START = arrow.Arrow(2013, 5, 5)
+    END = arrow.Arrow(2013, 5, 6)
+
+    def test_epochs(self):
+        values = array(
+            "q", [1367711999999, 1367712000000, 1367798399999, 1367798400000]
+        )
+
+        assert arrow.Arrow.between_mask(values, self.START, self.END) == [
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert arrow.Arrow.between_mask(values, self.START, self.END, "[]") == [
+            False,
+            True,
+            True,
+            True,
+        ]
+        assert arrow.Arrow.between_mask(list(values), self.START, self.END, "[)") == [
+            False,
+            True,
+            True,
+            False,
+        ]
+        assert arrow.Arrow.between_mask(values, self.START, self.END, "(]") == [
+            False,
+            False,
+            True,
+            True,
+        ]
+
+    def test_units(self):
+        start = arrow.Arrow(2013, 5, 5, 0, 0, 0, 500)
+        end = 1367712000001
+
+        # whole milliseconds around a start with a fraction of one
+        assert arrow.Arrow.between_mask(
+            [1367712000000, 1367712000001], start, end, "[]"
+        ) == [False, True]
+        assert arrow.Arrow.between_mask(
+            [1367712000000499, 1367712000000500], start, end * 1000, "[)", "us"
+        ) == [False, True]
+        assert arrow.Arrow.between_mask(
+            [1367712000000500000, 1367712000000500001], start, end * 10**6, "()", "ns"
+        ) == [False, True]
+
+    def test_mixed_values(self):
+        target = arrow.Arrow(2013, 5, 5, 12, tzinfo="US/Pacific")
+        values = [
+            target,
+            target.datetime,
+            datetime(2013, 5, 5, 12),
+            datetime(2013, 5, 6),
+            1367712000000,
+        ]
+
+        assert arrow.Arrow.between_mask(values, self.START, self.END.datetime) == [
+            True,
+            True,
+            True,
+            False,
+            False,
+        ]
+        assert arrow.Arrow.between_mask(
+            iter(values), 1367712000000, self.END, "[)"
+        ) == [
+            True,
+            True,
+            True,
+            False,
+            True,
+        ]
+        assert arrow.Arrow.between_mask([], self.START, self.END) == []
+
+    def test_matches_is_between(self):
+        values = [self.START.shift(hours=hours) for hours in range(-5, 30, 3)]
+
+        for bounds in ["()", "(]", "[)", "[]"]:
+            assert arrow.Arrow.between_mask(values, self.START, self.END, bounds) == [
+                value.is_between(self.START, self.END, bounds) for value in values
+            ]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.between_mask([], self.START, self.END, "][")
+
+        with pytest.raises(ValueError, match="Unsupported epoch unit 's'"):
+            arrow.Arrow.between_mask([], self.START, self.END, unit="s")
+
+        with pytest.raises(TypeError, match="start date argument type"):
+            arrow.Arrow.between_mask([], "2013-05-05", self.END)
+
+        with pytest.raises(TypeError, match="value date argument type"):
+            arrow.Arrow.between_mask([1.5], self.START, self.END)
+
+        with pytest.raises(TypeError, match="value date argument type"):
+            arrow.Arrow.between_mask([True], self.START, self.END)
+
+
 class TestArrowUtil:
     def test_get_datetime(self):
         get_datetime = arrow.Arrow._get_datetime
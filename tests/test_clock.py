@@ -0,0 +1,83 @@
+from datetime import datetime
+
+import pytest
+from dateutil import tz
+
+from arrow import Arrow, zones
+from arrow.clock import CoarseClock
+
+# 2013-05-05T12:30:45.123456Z
+NS = 1367757045_123456_789
+
+
+class TestCoarseClock:
+    def test_defaults(self):
+        clock = CoarseClock()
+
+        assert clock.granularity == 1
+        assert clock.tzinfo is zones.UTC
+        assert repr(clock) == "CoarseClock(granularity=1, tzinfo=tzutc())"
+
+    def test_invalid_granularity(self):
+        with pytest.raises(ValueError):
+            CoarseClock(granularity=0)
+
+    def test_now(self, mocker):
+        time_ns = mocker.patch("arrow.clock.time.time_ns", return_value=NS)
+        clock = CoarseClock(granularity=10)
+
+        first = clock.now()
+
+        assert first == Arrow(2013, 5, 5, 12, 30, 45, 120000)
+        assert first.tzinfo is zones.UTC
+
+        # reused within the period
+        time_ns.return_value = NS + 6_000_000
+        assert clock.now() is first
+
+        time_ns.return_value = NS + 7_000_000
+        second = clock.now()
+        assert second == Arrow(2013, 5, 5, 12, 30, 45, 130000)
+
+    def test_never_goes_back(self, mocker):
+        time_ns = mocker.patch("arrow.clock.time.time_ns", return_value=NS)
+        clock = CoarseClock(granularity=10)
+        first = clock.now()
+
+        time_ns.return_value = NS - 60_000_000_000
+        assert clock.now() is first
+
+    def test_concurrent_refresh(self, mocker):
+        clock = CoarseClock(granularity=10)
+        newer = Arrow(2013, 5, 5, 12, 30, 46)
+
+        def time_ns():
+            # another thread publishes a newer reading while this one reads the time
+            clock._reading = (NS + 1_000_000_000, newer)
+            return NS
+
+        mocker.patch("arrow.clock.time.time_ns", side_effect=time_ns)
+
+        assert clock.now() is newer
+
+    def test_tzinfo(self, mocker):
+        mocker.patch("arrow.clock.time.time_ns", return_value=NS)
+
+        result = CoarseClock(granularity=1000, tzinfo="US/Pacific").now()
+
+        assert result == Arrow(2013, 5, 5, 12, 30, 45)
+        assert result.datetime == datetime(
+            2013, 5, 5, 5, 30, 45, tzinfo=tz.gettz("US/Pacific")
+        )
+
+        result = CoarseClock(tzinfo=tz.gettz("Europe/Paris")).now()
+        assert result.hour == 14
+
+    def test_real_clock(self):
+        clock = CoarseClock()
+
+        before = Arrow.utcnow()
+        result = clock.now()
+        after = Arrow.utcnow()
+
+        assert before.floor("second").shift(seconds=-1) <= result <= after
@@ -369,6 +369,109 @@ class TestGet:
         assert res.tzinfo == tz.gettz("Asia/Tokyo")
 
 
+@pytest.mark.usefixtures("arrow_factory")
+class TestTryGet:
+    def test_iso_str(self):
+        assert self.factory.try_get("2013-05-05T12:30:45") == datetime(
+            2013, 5, 5, 12, 30, 45, tzinfo=tz.tzutc()
+        )
+        assert self.factory.try_get("not a date") is None
+        assert self.factory.try_get("2013-02-30") is None
+
+    def test_str_format(self):
+        assert self.factory.try_get(
+            "2013-05-05 12:30:45", "YYYY-MM-DD HH:mm:ss"
+        ) == datetime(2013, 5, 5, 12, 30, 45, tzinfo=tz.tzutc())
+        assert self.factory.try_get(
+            "2013-05-05 12:30:45", ["MM/DD/YYYY", "YYYY-MM-DD HH:mm:ss"]
+        ) == datetime(2013, 5, 5, 12, 30, 45, tzinfo=tz.tzutc())
+        assert self.factory.try_get("junk", "YYYY-MM-DD HH:mm:ss") is None
+
+    def test_kwargs(self):
+        result = self.factory.try_get(
+            "05  mai  2013",
+            "DD MMMM YYYY",
+            locale="fr",
+            tzinfo="US/Pacific",
+            normalize_whitespace=True,
+        )
+
+        assert result == datetime(2013, 5, 5, tzinfo=tz.gettz("US/Pacific"))
+
+    def test_non_str_inputs(self):
+        assert self.factory.try_get(1367992474) == datetime(
+            2013, 5, 8, 5, 54, 34, tzinfo=tz.tzutc()
+        )
+        assert self.factory.try_get(2013, 5, 5) == datetime(
+            2013, 5, 5, tzinfo=tz.tzutc()
+        )
+
+        with pytest.raises(TypeError):
+            self.factory.try_get(None)
+
+        with pytest.raises(TypeError):
+            self.factory.try_get("2013-05-05", 5)
+
+    @pytest.mark.parametrize(
+        "args, kwargs",
+        [
+            (("2013-05-05T12:30:45",), {"tzinfo": None}),
+            (("2013-05-05 12:30", "YYYY-MM-DD HH:mm"), {"tzinfo": None}),
+            (
+                ("2013-05-05 12:30", "YYYY-MM-DD HH:mm"),
+                {"tzinfo": None, "locale": "fr"},
+            ),
+            (("2013-05-05 12:30", "YYYY-MM-DD HH:mm"), {"tzinfo": "US/Pacific"}),
+            (("2013-05-05 12:30", "YYYY-MM-DD HH:mm"), {"locale": "fr"}),
+        ],
+    )
+    def test_matches_get(self, args, kwargs):
+        def outcome(method):
+            try:
+                return method(*args, **dict(kwargs))
+            except Exception as e:
+                return type(e)
+
+        assert outcome(self.factory.try_get) == outcome(self.factory.get)
+
+
+@pytest.mark.usefixtures("arrow_factory")
+class TestScan:
+    def test_scan(self):
+        log = "2013-05-05 12:30:45 start\nretry at 2013-05-05 12:31:02 +02:00\n"
+
+        result = list(self.factory.scan(log.encode(), "YYYY-MM-DD HH:mm:ss"))
+
+        assert result == [
+            (0, datetime(2013, 5, 5, 12, 30, 45, tzinfo=tz.tzutc())),
+            (35, datetime(2013, 5, 5, 12, 31, 2, tzinfo=tz.tzutc())),
+        ]
+        assert all(isinstance(arw, Arrow) for _, arw in result)
+
+        result = list(self.factory.scan(log, "YYYY-MM-DD HH:mm:ss ZZ", chunk_size=8))
+
+        assert result == [
+            (35, datetime(2013, 5, 5, 12, 31, 2, tzinfo=tz.tzoffset(None, 7200)))
+        ]
+
+    def test_tzinfo(self):
+        log = ["2013-05-05 12:30:45\n"]
+
+        result = list(
+            self.factory.scan(log, "YYYY-MM-DD HH:mm:ss", tzinfo="US/Pacific")
+        )
+        assert result[0][1].tzinfo == tz.gettz("US/Pacific")
+
+        result = list(
+            self.factory.scan(log, "YYYY-MM-DD HH:mm:ss", tzinfo=tz.tzlocal())
+        )
+        assert result[0][1].tzinfo == tz.tzlocal()
+
+    def test_invalid_format(self):
+        with pytest.raises(ParserError):
+            self.factory.scan("2013", "YYY")
+
+
 @pytest.mark.usefixtures("arrow_factory")
 class TestUtcNow:
     def test_utcnow(self):
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 import pytz
@@ -107,11 +107,19 @@ class TestFormatterFormatToken:
         expected = str(dt.timestamp())
         assert self.formatter._format_token(dt, "X") == expected
 
-        # Must round because time.time() may return a float with greater
-        # than 6 digits of precision
-        expected = str(int(dt.timestamp() * 1000000))
+        expected = str(
+            (dt - datetime(1970, 1, 1, tzinfo=timezone.utc))
+            // timedelta(microseconds=1)
+        )
         assert self.formatter._format_token(dt, "x") == expected
 
+    def test_timestamp_exact(self):
+        dt = datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=dateutil_tz.UTC)
+        assert self.formatter._format_token(dt, "x") == "253402300799999999"
+
+        dt = datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=dateutil_tz.UTC)
+        assert self.formatter._format_token(dt, "x") == "-1"
+
     def test_timezone(self):
         dt = datetime.now(timezone.utc).replace(tzinfo=dateutil_tz.gettz("US/Pacific"))
 
@@ -0,0 +1,382 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from dateutil import tz
+
+from arrow import Arrow, IntervalIndex, IntervalSet
+
+START = Arrow(2013, 5, 5, 12)
+
+
+def hours(start, end, label=None):
+    span = (START.shift(hours=start), START.shift(hours=end))
+    return span if label is None else span + (label,)
+
+
+class TestIntervalIndex:
+    def test_empty(self):
+        index = IntervalIndex()
+
+        assert len(index) == 0
+        assert list(index) == []
+        assert index.at(START) == []
+        assert index.overlapping(START, START.shift(days=1)) == []
+        assert repr(index) == "<IntervalIndex [0 spans, '[]']>"
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            IntervalIndex(bounds="[[")
+
+        with pytest.raises(ValueError):
+            IntervalIndex().overlapping(START, START, bounds="][")
+
+    def test_span_range(self):
+        spans = list(Arrow.span_range("hour", START, START.shift(hours=3)))
+        index = IntervalIndex(spans)
+
+        assert len(index) == 4
+        assert list(index) == spans
+        assert index.at(Arrow(2013, 5, 5, 13, 30)) == [spans[1]]
+        assert index.at(Arrow(2013, 5, 5, 13, 59, 59, 999999)) == [spans[1]]
+        assert index.at(Arrow(2013, 5, 5, 14)) == [spans[2]]
+        assert index.at(Arrow(2013, 5, 5, 11, 59, 59, 999999)) == []
+
+    @pytest.mark.parametrize(
+        "bounds, start, end",
+        [
+            ("[]", True, True),
+            ("[)", True, False),
+            ("(]", False, True),
+            ("()", False, False),
+        ],
+    )
+    def test_bounds(self, bounds, start, end):
+        span = hours(0, 1)
+        index = IntervalIndex([span], bounds=bounds)
+
+        assert index.at(span[0]) == ([span] if start else [])
+        assert index.at(span[1]) == ([span] if end else [])
+        assert index.at(START.shift(minutes=30)) == [span]
+
+    def test_labels_and_order(self):
+        office = hours(-3, 5, "office")
+        lunch = hours(0, 1, "lunch")
+        call = hours(0, 2, "call")
+        index = IntervalIndex([call, lunch, office], bounds="[)")
+
+        assert index.at(START.shift(minutes=30)) == [office, call, lunch]
+        assert index.at(START.shift(hours=1)) == [office, call]
+        assert list(index) == [office, call, lunch]
+
+    def test_datetimes(self):
+        span = (datetime(2013, 5, 5, 12), datetime(2013, 5, 5, 13))
+        index = IntervalIndex([span])
+
+        assert index.at(datetime(2013, 5, 5, 12, 30)) == [span]
+        assert index.at(Arrow(2013, 5, 5, 14, 30, tzinfo=tz.tzoffset(None, 7200))) == [
+            span
+        ]
+
+    def test_invalid_moment(self):
+        with pytest.raises(TypeError):
+            IntervalIndex([hours(0, 1)]).at("2013-05-05")
+
+    def test_empty_spans(self):
+        backwards = hours(1, 0)
+        instant = hours(0, 0)
+        index = IntervalIndex([backwards, instant], bounds="[)")
+
+        assert len(index) == 2
+        assert index.at(START) == []
+        assert index.overlapping(START.shift(hours=-1), START.shift(hours=2)) == []
+
+        index.add(hours(2, 1))
+        assert index.overlapping(START.shift(hours=-1), START.shift(hours=3)) == []
+
+    def test_overlapping(self):
+        spans = [hours(0, 1, "a"), hours(1, 2, "b"), hours(3, 4, "c")]
+        index = IntervalIndex(spans, bounds="[)")
+
+        assert index.overlapping(START.shift(hours=1), START.shift(hours=3)) == [
+            spans[1],
+            spans[2],
+        ]
+        assert index.overlapping(
+            START.shift(hours=1), START.shift(hours=3), bounds="()"
+        ) == [spans[1]]
+        assert index.overlapping(START.shift(hours=2), START.shift(hours=3), "()") == []
+        assert index.overlapping(START, START, "[)") == []
+
+    def test_at_many(self):
+        spans = [hours(0, 2), hours(1, 3)]
+        index = IntervalIndex(spans, bounds="[)")
+        moments = [
+            START.shift(minutes=30),
+            START.shift(minutes=90),
+            START.shift(hours=5),
+        ]
+
+        assert index.at_many(moments) == [[spans[0]], spans, []]
+        assert index.at_many(iter([])) == []
+
+    def test_add_remove(self):
+        first = hours(0, 2, "first")
+        index = IntervalIndex([first])
+
+        second = hours(1, 3, "second")
+        index.add(second)
+        assert len(index) == 2
+        assert index.at(START.shift(minutes=90)) == [first, second]
+
+        # removing a pending span
+        index.remove(second)
+        assert index.at(START.shift(minutes=90)) == [first]
+
+        # removing a built span
+        index.remove(first)
+        assert len(index) == 0
+        assert index.at(START.shift(minutes=90)) == []
+
+    def test_remove_duplicates(self):
+        span = hours(0, 1)
+        index = IntervalIndex([span, span])
+
+        index.remove(span)
+        assert index.at(START) == [span]
+
+        index.remove(span)
+        with pytest.raises(ValueError):
+            index.remove(span)
+
+    def test_remove_missing(self):
+        index = IntervalIndex([hours(0, 1, "a")])
+
+        with pytest.raises(ValueError):
+            index.remove(hours(0, 1, "b"))
+
+        with pytest.raises(ValueError):
+            index.remove(hours(0, 2))
+
+    def test_rebuild(self, mocker):
+        index = IntervalIndex([hours(0, 1)])
+        build = mocker.spy(IntervalIndex, "_build")
+
+        for i in range(33):
+            index.add(hours(i, i + 1, i))
+
+        assert build.call_count == 1
+        assert len(index._pending) == 0
+        assert len(index._ids) == 34
+
+        for i in range(33):
+            index.remove(hours(i, i + 1, i))
+
+        assert build.call_count == 2
+        assert len(index._ids) == 1
+        assert index.at(START.shift(minutes=30)) == [hours(0, 1)]
+
+    @pytest.mark.parametrize("bounds", ["()", "(]", "[)", "[]"])
+    def test_matches_brute_force(self, bounds):
+        rng = random.Random(bounds)
+        us = timedelta(microseconds=1)
+
+        def random_span(label):
+            low = rng.randrange(1000)
+            return (
+                START + low * us,
+                START + (low + rng.randrange(-5, 100)) * us,
+                label,
+            )
+
+        spans = [random_span(i) for i in range(500)]
+        index = IntervalIndex(spans, bounds=bounds)
+
+        def brute_force(low, high):
+            def closed(span):
+                start = (span[0] - START) // us + (bounds[0] == "(")
+                end = (span[1] - START) // us - (bounds[1] == ")")
+                return start, end
+
+            return sorted(
+                (
+                    span
+                    for span in spans
+                    if closed(span)[0] <= min(high, closed(span)[1])
+                    and closed(span)[1] >= low
+                ),
+                key=lambda span: (closed(span)[0], span[2]),
+            )
+
+        for step in range(300):
+            if step % 3 == 0:
+                span = random_span(500 + step)
+                index.add(span)
+                spans.append(span)
+            elif step % 3 == 1:
+                span = rng.choice(spans)
+                index.remove(span)
+                spans.remove(span)
+
+            point = rng.randrange(-10, 1200)
+            assert index.at(START + point * us) == brute_force(point, point)
+
+            low = rng.randrange(-10, 1200)
+            high = low + rng.randrange(50)
+            assert index.overlapping(START + low * us, START + high * us) == (
+                brute_force(low, high)
+            )
+
+
+class TestIntervalSet:
+    def test_empty(self):
+        empty = IntervalSet()
+
+        assert len(empty) == 0
+        assert list(empty) == []
+        assert START not in empty
+        assert empty.duration() == timedelta(0)
+        assert repr(empty) == "<IntervalSet [0 spans]>"
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            IntervalSet(bounds="[[")
+
+        with pytest.raises(ValueError):
+            list(IntervalSet().spans(bounds="]["))
+
+        with pytest.raises(ValueError):
+            IntervalSet().complement(START, START, bounds="][")
+
+    def test_normalizes(self):
+        spans = IntervalSet(
+            [hours(3, 4), hours(0, 2, "label"), hours(1, 2), hours(5, 4)], bounds="[)"
+        )
+
+        assert len(spans) == 2
+        assert list(spans.spans("[)")) == [hours(0, 2), hours(3, 4)]
+
+    def test_merges_touching_spans(self):
+        spans = IntervalSet(Arrow.span_range("hour", START, START.shift(hours=3)))
+
+        assert list(spans) == [
+            (START, Arrow(2013, 5, 5, 15, 59, 59, 999999)),
+        ]
+        assert spans.duration() == timedelta(hours=4)
+
+    @pytest.mark.parametrize(
+        "bounds, start, end",
+        [
+            ("[]", START, START.shift(hours=1)),
+            ("[)", START, START.shift(hours=1, microseconds=1)),
+            ("(]", START.shift(microseconds=-1), START.shift(hours=1)),
+            ("()", START.shift(microseconds=-1), START.shift(hours=1, microseconds=1)),
+        ],
+    )
+    def test_spans_bounds(self, bounds, start, end):
+        spans = IntervalSet([hours(0, 1)])
+
+        assert list(spans.spans(bounds)) == [(start, end)]
+        assert IntervalSet(spans.spans(bounds), bounds=bounds) == spans
+
+    def test_spans_tzinfo(self):
+        spans = IntervalSet([hours(0, 1)], bounds="[)")
+
+        ((start, end),) = spans.spans("[)", tzinfo="US/Pacific")
+        assert start == START
+        assert start.tzinfo == tz.gettz("US/Pacific")
+        assert end == START.shift(hours=1)
+
+        ((start, end),) = spans.spans("[)", tzinfo=tz.tzoffset(None, 3600))
+        assert start.utcoffset() == timedelta(hours=1)
+
+    def test_contains(self):
+        spans = IntervalSet([hours(0, 1), hours(2, 3)], bounds="[)")
+
+        assert START in spans
+        assert START.shift(hours=1) not in spans
+        assert START.shift(hours=-1) not in spans
+        assert datetime(2013, 5, 5, 14, 30) in spans
+        assert START.shift(hours=3) not in spans
+
+    def test_equality(self):
+        spans = IntervalSet([hours(0, 2)], bounds="[)")
+
+        assert spans == IntervalSet([hours(0, 1), hours(1, 2)], bounds="[)")
+        assert spans != IntervalSet([hours(0, 2)])
+        assert spans != [hours(0, 2)]
+        assert len({spans, IntervalSet([hours(0, 2)], bounds="[)")}) == 1
+
+    def test_algebra(self):
+        on_call = IntervalSet([hours(0, 4), hours(6, 8)], bounds="[)")
+        away = IntervalSet([hours(3, 7)], bounds="[)")
+
+        assert on_call | away == IntervalSet([hours(0, 8)], bounds="[)")
+        assert on_call & away == IntervalSet([hours(3, 4), hours(6, 7)], bounds="[)")
+        assert on_call - away == IntervalSet([hours(0, 3), hours(7, 8)], bounds="[)")
+        assert away - on_call == IntervalSet([hours(4, 6)], bounds="[)")
+
+        assert on_call.union(away) == on_call | away
+        assert on_call.intersection(away) == on_call & away
+        assert on_call.difference(away) == on_call - away
+
+    def test_operators_unsupported(self):
+        spans = IntervalSet([hours(0, 1)])
+
+        for op in ("__or__", "__and__", "__sub__"):
+            assert getattr(spans, op)([hours(0, 1)]) is NotImplemented
+
+        with pytest.raises(TypeError):
+            spans | [hours(0, 1)]
+
+    def test_complement(self):
+        on_call = IntervalSet([hours(1, 2), hours(3, 4)], bounds="[)")
+
+        gaps = on_call.complement(START, START.shift(hours=5), "[)")
+        assert gaps == IntervalSet([hours(0, 1), hours(2, 3), hours(4, 5)], bounds="[)")
+        assert gaps.duration() == timedelta(hours=3)
+
+        assert len(on_call.complement(START.shift(hours=1), START, "[)")) == 0
+
+    def test_duration(self):
+        spans = IntervalSet([hours(0, 1), hours(2, 4)], bounds="[)")
+
+        assert spans.duration() == timedelta(hours=3)
+        assert IntervalSet([hours(0, 1)]).duration() == timedelta(
+            hours=1, microseconds=1
+        )
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        us = timedelta(microseconds=1)
+
+        def random_spans():
+            spans = []
+            for _ in range(rng.randrange(15)):
+                low = rng.randrange(300)
+                spans.append(
+                    (START + low * us, START + (low + rng.randrange(-3, 30)) * us)
+                )
+            return spans
+
+        def moments(spans):
+            result = set()
+            for start, end in spans:
+                result.update(range((start - START) // us, (end - START) // us + 1))
+            return result
+
+        for _ in range(200):
+            first, second = random_spans(), random_spans()
+            ours, theirs = IntervalSet(first), IntervalSet(second)
+
+            assert moments(ours) == moments(first)
+            assert moments(ours | theirs) == moments(first) | moments(second)
+            assert moments(ours & theirs) == moments(first) & moments(second)
+            assert moments(ours - theirs) == moments(first) - moments(second)
+            assert ours.duration() == len(moments(first)) * us
+
+            low = rng.randrange(-10, 320)
+            window = (START + low * us, START + (low + rng.randrange(100)) * us)
+            assert moments(ours.complement(*window)) == (
+                moments([window]) - moments(first)
+            )
@@ -0,0 +1,294 @@
+import io
+import mmap
+from datetime import datetime
+
+import pytest
+from dateutil import tz
+
+from arrow import arrow, logs, parser
+from arrow.parser import ParserError, ParserMatchError
+
+LOG = (
+    "2021-10-12 14:30:00 INFO started\n"
+    "2021-10-12 14:30:05 WARN slow request, retried at 2021-10-12 14:30:07\n"
+    "2021-02-30 14:31:00 INFO not a date\n"
+    "2021-10-12 14:35:00 INFO stopped\n"
+)
+
+EXPECTED = [
+    (0, datetime(2021, 10, 12, 14, 30)),
+    (33, datetime(2021, 10, 12, 14, 30, 5)),
+    (83, datetime(2021, 10, 12, 14, 30, 7)),
+    (139, datetime(2021, 10, 12, 14, 35)),
+]
+
+
+class TestScan:
+    def test_str(self):
+        assert list(logs.scan(LOG, "YYYY-MM-DD HH:mm:ss")) == EXPECTED
+
+    def test_bytes_and_bytearray(self):
+        assert list(logs.scan(LOG.encode(), "YYYY-MM-DD HH:mm:ss")) == EXPECTED
+        assert list(logs.scan(bytearray(LOG.encode()), "YYYY-MM-DD HH:mm:ss")) == (
+            EXPECTED
+        )
+
+    def test_mmap(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(LOG.encode())
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            assert list(logs.scan(buffer, "YYYY-MM-DD HH:mm:ss")) == EXPECTED
+
+    def test_files(self):
+        assert list(logs.scan(io.StringIO(LOG), "YYYY-MM-DD HH:mm:ss")) == EXPECTED
+        assert (
+            list(logs.scan(io.BytesIO(LOG.encode()), "YYYY-MM-DD HH:mm:ss")) == EXPECTED
+        )
+
+    def test_lines(self):
+        assert list(logs.scan(LOG.splitlines(True), "YYYY-MM-DD HH:mm:ss")) == EXPECTED
+        assert (
+            list(logs.scan(LOG.encode().splitlines(True), "YYYY-MM-DD HH:mm:ss"))
+            == EXPECTED
+        )
+        assert list(logs.scan([], "YYYY-MM-DD HH:mm:ss")) == []
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 20, 33, 34, 64, 1000])
+    def test_chunk_boundaries(self, chunk_size):
+        for source in (LOG, LOG.encode(), io.StringIO(LOG), LOG.splitlines(True)):
+            assert (
+                list(logs.scan(source, "YYYY-MM-DD HH:mm:ss", chunk_size=chunk_size))
+                == EXPECTED
+            )
+
+    def test_unterminated_last_line(self):
+        assert list(
+            logs.scan("done at 2021-10-12 14:30", "YYYY-MM-DD HH:mm", chunk_size=4)
+        ) == [(8, datetime(2021, 10, 12, 14, 30))]
+
+    def test_byte_offsets(self):
+        data = "é 2021-10-12 ü 2021-10-13\nnaïve 2021-10-14\n".encode()
+
+        result = list(logs.scan(data, "YYYY-MM-DD", chunk_size=8))
+
+        assert [offset for offset, _ in result] == [3, 17, 35]
+        for offset, dt in result:
+            assert data[offset : offset + 10].decode() == dt.strftime("%Y-%m-%d")
+
+        assert [offset for offset, _ in logs.scan(data.decode(), "YYYY-MM-DD")] == [
+            2,
+            15,
+            32,
+        ]
+
+    def test_encoding(self):
+        data = "\xe9t\xe9 2021-10-12\n".encode("latin-1")
+
+        assert list(logs.scan(data, "YYYY-MM-DD", encoding="latin-1")) == [
+            (4, datetime(2021, 10, 12))
+        ]
+
+        # undecodable bytes are kept without shifting offsets
+        assert list(logs.scan(b"\xff\xfe 2021-10-12\n", "YYYY-MM-DD")) == [
+            (3, datetime(2021, 10, 12))
+        ]
+
+    def test_word_boundaries(self):
+        assert list(logs.scan("id=2021-10-12 (2021-10-13)\n", "YYYY-MM-DD")) == [
+            (15, datetime(2021, 10, 13))
+        ]
+
+    def test_tz_and_locale(self):
+        assert list(
+            logs.scan("1 mai 2021 12:00 +02:00\n", "D MMMM YYYY HH:mm ZZ", locale="fr")
+        ) == [(0, datetime(2021, 5, 1, 12, tzinfo=tz.tzoffset(None, 7200)))]
+
+    def test_lazy(self):
+        def lines():
+            yield "2021-10-12\n"
+            raise AssertionError("read too far")
+
+        assert next(logs.scan(lines(), "YYYY-MM-DD", chunk_size=1)) == (
+            0,
+            datetime(2021, 10, 12),
+        )
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            logs.scan(LOG, "YYYY-MM-DD", chunk_size=0)
+
+        with pytest.raises(ParserError):
+            logs.scan(LOG, "YYY")
+
+        with pytest.raises(ParserMatchError):
+            logs.scan(LOG, "YYYY [(]")
+
+
+SORTED_LOG = (
+    "header without a timestamp\n"
+    "2021-10-12 13:59:59 INFO before\n"
+    "2021-10-12 14:00:00 INFO start\n"
+    "Traceback (most recent call last):\n"
+    "  ValueError\n"
+    "2021-10-12 14:02:00 INFO middle\n"
+    "2021-10-12 14:05:00 INFO end\n"
+    "2021-10-12 14:05:01 INFO after\n"
+).encode()
+
+
+def lines_between(source, start, end, bounds="[)", tzinfo=None):
+    begin, stop = logs.seek_range(
+        source, "YYYY-MM-DD HH:mm:ss", start, end, bounds, tzinfo
+    )
+    return [line.split()[-1] for line in SORTED_LOG[begin:stop].splitlines()]
+
+
+class TestSeekRange:
+    start = arrow.Arrow(2021, 10, 12, 14)
+    end = arrow.Arrow(2021, 10, 12, 14, 5)
+
+    def test_bounds(self):
+        assert lines_between(SORTED_LOG, self.start, self.end, "[)") == [
+            b"start",
+            b"last):",
+            b"ValueError",
+            b"middle",
+        ]
+        assert lines_between(SORTED_LOG, self.start, self.end, "()") == [b"middle"]
+        assert lines_between(SORTED_LOG, self.start, self.end, "(]") == [
+            b"middle",
+            b"end",
+        ]
+        assert lines_between(SORTED_LOG, self.start, self.end, "[]") == [
+            b"start",
+            b"last):",
+            b"ValueError",
+            b"middle",
+            b"end",
+        ]
+
+    def test_sources(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(SORTED_LOG)
+
+        expected = logs.seek_range(
+            SORTED_LOG, "YYYY-MM-DD HH:mm:ss", self.start, self.end
+        )
+
+        assert expected == (59, 170)
+        assert (
+            logs.seek_range(path, "YYYY-MM-DD HH:mm:ss", self.start, self.end)
+            == expected
+        )
+        assert (
+            logs.seek_range(str(path), "YYYY-MM-DD HH:mm:ss", self.start, self.end)
+            == expected
+        )
+        assert (
+            logs.seek_range(
+                bytearray(SORTED_LOG), "YYYY-MM-DD HH:mm:ss", self.start, self.end
+            )
+            == expected
+        )
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            assert (
+                logs.seek_range(buffer, "YYYY-MM-DD HH:mm:ss", self.start, self.end)
+                == expected
+            )
+
+    def test_out_of_range(self):
+        assert (
+            lines_between(
+                SORTED_LOG, self.start.shift(hours=-2), self.start.shift(hours=-1)
+            )
+            == []
+        )
+        assert (
+            lines_between(SORTED_LOG, self.end.shift(hours=1), self.end.shift(hours=2))
+            == []
+        )
+        assert lines_between(SORTED_LOG, self.end, self.start) == []
+
+    def test_empty_and_untimestamped(self, tmp_path):
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+
+        assert logs.seek_range(path, "YYYY", self.start, self.end) == (0, 0)
+        assert logs.seek_range(b"", "YYYY", self.start, self.end) == (0, 0)
+        assert logs.seek_range(b"no\ntimestamps\n", "YYYY", self.start, self.end) == (
+            14,
+            14,
+        )
+
+        # invalid dates are not timestamps either
+        data = b"2021-10-12 14:01:00 a\n2021-02-30 14:02:00 b\n2021-10-12 14:03:00 c\n"
+        assert logs.seek_range(
+            data,
+            "YYYY-MM-DD HH:mm:ss",
+            self.start.shift(minutes=2),
+            self.end,
+        ) == (44, 66)
+
+    def test_datetimes_and_tzinfo(self):
+        assert lines_between(
+            SORTED_LOG, datetime(2021, 10, 12, 14, 2), datetime(2021, 10, 12, 14, 5)
+        ) == [b"middle"]
+
+        # the log is in UTC+02:00, so 12:05 UTC is 14:05 in the log
+        assert lines_between(
+            SORTED_LOG,
+            datetime(2021, 10, 12, 12, 5, tzinfo=tz.tzutc()),
+            datetime(2021, 10, 12, 13, tzinfo=tz.tzutc()),
+            tzinfo="+02:00",
+        ) == [b"end", b"after"]
+
+        with pytest.raises(TypeError):
+            logs.seek_range(SORTED_LOG, "YYYY", "2021-10-12", self.end)
+
+    def test_long_lines(self):
+        data = (
+            b"2021-10-12 14:00:00 "
+            + b"x" * 5000
+            + b"\n"
+            + b"y" * (logs.PROBE_SIZE + 10)
+            + b"\n2021-10-12 14:05:00 last"
+        )
+
+        assert logs.seek_range(
+            data, "YYYY-MM-DD HH:mm:ss", self.start.shift(seconds=1), self.end, "[]"
+        ) == (5021 + logs.PROBE_SIZE + 11, len(data))
+
+    def test_logarithmic_parses(self, mocker):
+        data = "".join(
+            f"{arrow.Arrow(2021, 1, 1).shift(seconds=i):YYYY-MM-DD HH:mm:ss} {i}\n"
+            for i in range(20000)
+        ).encode()
+        spy = mocker.spy(parser.DateTimeParser, "_build_from_match")
+
+        begin, stop = logs.seek_range(
+            data,
+            "YYYY-MM-DD HH:mm:ss",
+            arrow.Arrow(2021, 1, 1, 1),
+            arrow.Arrow(2021, 1, 1, 1, 0, 10),
+        )
+
+        assert data[begin:stop].split()[2::3] == [
+            str(i).encode() for i in range(3600, 3610)
+        ]
+        assert spy.call_count < 80
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            logs.seek_range(SORTED_LOG, "YYYY", self.start, self.end, "[[")
+
+        with pytest.raises(ParserError):
+            logs.seek_range(SORTED_LOG, "YYY", self.start, self.end)
+
+        with pytest.raises(ParserMatchError):
+            logs.seek_range(SORTED_LOG, "YYYY [(]", self.start, self.end)
@@ -0,0 +1,251 @@
+import sys
+import threading
+from array import array
+
+import pytest
+from dateutil import tz
+
+import arrow
+from arrow import parallel
+from arrow.parser import ParserError
+
+STRINGS = [
+    "2021-10-12 14:30:00.5",
+    "1969-12-31 23:59:59.999999",
+    "2038-01-19 03:14:08.0",
+    "0001-01-01 00:00:00.000001",
+]
+
+
+def epoch_us(arw):
+    return (arw - arrow.Arrow(1970, 1, 1)) // arrow.arrow.timedelta(microseconds=1)
+
+
+class TestParseMany:
+    def test_in_process(self):
+        result = parallel.parse_many(STRINGS, "YYYY-MM-DD HH:mm:ss.S", workers=1)
+
+        assert isinstance(result, array)
+        assert result.typecode == "q"
+        assert list(result) == [
+            epoch_us(arrow.get(s, "YYYY-MM-DD HH:mm:ss.S")) for s in STRINGS
+        ]
+        assert result[1] == -1
+
+    def test_workers(self):
+        strings = STRINGS * 50
+
+        result = parallel.parse_many(
+            strings, "YYYY-MM-DD HH:mm:ss.S", workers=2, chunk_size=7
+        )
+
+        assert result == parallel.parse_many(
+            iter(strings), "YYYY-MM-DD HH:mm:ss.S", workers=1
+        )
+
+    def test_formats_and_tzinfo(self):
+        strings = ["2021-10-12 14:30 +02:00", "12/10/2021 14:30"]
+        formats = ["YYYY-MM-DD HH:mm ZZ", "DD/MM/YYYY HH:mm"]
+
+        assert list(parallel.parse_many(strings, formats, workers=1)) == [
+            1634041800000000,
+            1634049000000000,
+        ]
+        assert list(
+            parallel.parse_many(strings, formats, workers=1, tzinfo="US/Pacific")
+        ) == [1634041800000000, 1634074200000000]
+        for workers in (1, 2):
+            assert list(
+                parallel.parse_many(
+                    strings, formats, workers=workers, tzinfo=tz.tzoffset(None, 3600)
+                )
+            ) == [1634041800000000, 1634045400000000]
+
+    def test_locale(self):
+        assert list(
+            parallel.parse_many(
+                ["12 octobre 2021"], "DD MMMM YYYY", locale="fr", workers=1
+            )
+        ) == [1633996800000000]
+
+    def test_default(self):
+        strings = ["2021-10-12", "junk", "2021-02-30"]
+
+        assert list(
+            parallel.parse_many(strings, "YYYY-MM-DD", workers=1, default=-(2**63))
+        ) == [1633996800000000, -(2**63), -(2**63)]
+
+        with pytest.raises(ParserError):
+            parallel.parse_many(strings, "YYYY-MM-DD", workers=1)
+
+        with pytest.raises(ParserError):
+            parallel.parse_many(strings, "YYYY-MM-DD", workers=2)
+
+        for workers in [1, 2]:
+            with pytest.raises(ValueError, match="day is out of range for month"):
+                parallel.parse_many(strings[2:], "YYYY-MM-DD", workers=workers)
+
+    def test_empty(self):
+        assert parallel.parse_many([], "YYYY", workers=1) == array("q")
+        assert parallel.parse_many([], "YYYY", workers=2) == array("q")
+
+    @pytest.mark.usefixtures("switch_often")
+    def test_in_process_threads(self):
+        barrier = threading.Barrier(8)
+        results = {}
+
+        def parse(offset):
+            barrier.wait()
+            results[offset] = [
+                parallel.parse_many(
+                    STRINGS * 10,
+                    "YYYY-MM-DD HH:mm:ss.S",
+                    workers=1,
+                    tzinfo=offset,
+                    chunk_size=1,
+                )
+                for _ in range(10)
+            ]
+
+        offsets = [f"+0{hours}:00" for hours in range(8)]
+        threads = [threading.Thread(target=parse, args=(o,)) for o in offsets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for offset in offsets:
+            expected = [
+                epoch_us(arrow.get(s, "YYYY-MM-DD HH:mm:ss.S", tzinfo=offset))
+                for s in STRINGS * 10
+            ]
+            assert [list(result) for result in results[offset]] == [expected] * 10
+
+    def test_worker(self, mocker):
+        mocker.patch("arrow.parallel._parser")
+        mocker.patch("arrow.parallel._tzinfo")
+
+        parallel._init_worker("en-us", "+01:00")
+
+        assert list(parallel._parse_chunk(["2021"], "YYYY", None)) == [1609455600000000]
+
+    def test_default_workers(self, mocker):
+        mocker.patch("arrow.parallel.os.cpu_count", return_value=None)
+
+        assert list(parallel.parse_many(["2021"], "YYYY")) == [1609459200000000]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            parallel.parse_many(STRINGS, "YYYY", workers=0)
+
+        with pytest.raises(ValueError):
+            parallel.parse_many(STRINGS, "YYYY", chunk_size=0)
+
+
+@pytest.fixture
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.usefixtures("switch_often")
+class TestThreaded:
+    def test_threaded_parse_many(self):
+        strings = STRINGS * 100
+        expected = parallel.parse_many(strings, "YYYY-MM-DD HH:mm:ss.S", workers=1)
+
+        for _ in range(5):
+            assert (
+                parallel.threaded_parse_many(
+                    strings, "YYYY-MM-DD HH:mm:ss.S", workers=8, chunk_size=3
+                )
+                == expected
+            )
+
+    def test_threaded_parse_many_options(self):
+        result = parallel.threaded_parse_many(
+            ["2021-10-12 14:30", "nope", "2021-10-12 14:30 +01:00"],
+            ["YYYY-MM-DD HH:mm ZZ", "YYYY-MM-DD HH:mm"],
+            workers=2,
+            tzinfo="US/Pacific",
+            default=0,
+            chunk_size=1,
+        )
+
+        assert list(result) == [
+            epoch_us(arrow.Arrow(2021, 10, 12, 14, 30, tzinfo="US/Pacific")),
+            0,
+            epoch_us(arrow.Arrow(2021, 10, 12, 13, 30)),
+        ]
+
+    def test_threaded_parse_many_error(self):
+        with pytest.raises(ParserError):
+            parallel.threaded_parse_many(["nope"], "YYYY", workers=2)
+
+        with pytest.raises(ValueError):
+            parallel.threaded_parse_many([], "YYYY", workers=0)
+
+    def test_threaded_format_many(self):
+        start = arrow.Arrow(2021, 1, 1, tzinfo="Europe/Paris")
+        values = [start.shift(hours=7 * i) for i in range(500)]
+        values[1] = values[1].datetime
+        fmt = "dddd D MMMM YYYY h:mm a ZZ"
+
+        expected = [arrow.get(v).format(fmt, "fr") for v in values]
+
+        for _ in range(5):
+            assert (
+                parallel.threaded_format_many(
+                    values, fmt, "fr", workers=8, chunk_size=3
+                )
+                == expected
+            )
+
+    def test_threaded_format_many_defaults(self):
+        assert parallel.threaded_format_many([arrow.Arrow(2021, 10, 12)]) == [
+            "2021-10-12 00:00:00+00:00"
+        ]
+
+        with pytest.raises(ValueError):
+            parallel.threaded_format_many([], chunk_size=0)
+
+    def test_shared_locale(self):
+        class FreshLocale(arrow.locales.EnglishLocale):
+            names = []
+
+        locale = FreshLocale()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            results.append(
+                [locale.month_number(name.lower()) for name in locale.month_names]
+            )
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [[None] + list(range(1, 13))] * 8
+
+    def test_shared_adaptive_parser(self):
+        dt_parser = arrow.parser.AdaptiveDateTimeParser()
+        barrier = threading.Barrier(8)
+
+        def parse():
+            barrier.wait()
+            for string in STRINGS * 50:
+                dt_parser.parse(string, ["YYYY-MM-DD", "YYYY-MM-DD HH:mm:ss.S"])
+
+        threads = [threading.Thread(target=parse) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(dt_parser.stats()["hits"].values()) == 8 * 50 * len(STRINGS)
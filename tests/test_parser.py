@@ -1,5 +1,6 @@
 import calendar
 import os
+import random
 import time
 from datetime import datetime, timezone
 
@@ -18,10 +19,10 @@ from .utils import make_full_tz_list
 class TestDateTimeParser:
     def test_parse_multiformat(self, mocker):
         mocker.patch(
-            "arrow.parser.DateTimeParser.parse",
+            "arrow.parser.DateTimeParser._try_parse",
             string="str",
             fmt="fmt_a",
-            side_effect=parser.ParserError,
+            return_value=None,
         )
 
         with pytest.raises(parser.ParserError):
@@ -29,7 +30,7 @@ class TestDateTimeParser:
 
         mock_datetime = mocker.Mock()
         mocker.patch(
-            "arrow.parser.DateTimeParser.parse",
+            "arrow.parser.DateTimeParser._try_parse",
             string="str",
             fmt="fmt_b",
             return_value=mock_datetime,
@@ -40,17 +41,17 @@ class TestDateTimeParser:
 
     def test_parse_multiformat_all_fail(self, mocker):
         mocker.patch(
-            "arrow.parser.DateTimeParser.parse",
+            "arrow.parser.DateTimeParser._try_parse",
             string="str",
             fmt="fmt_a",
-            side_effect=parser.ParserError,
+            return_value=None,
         )
 
         mocker.patch(
-            "arrow.parser.DateTimeParser.parse",
+            "arrow.parser.DateTimeParser._try_parse",
             string="str",
             fmt="fmt_b",
-            side_effect=parser.ParserError,
+            return_value=None,
         )
 
         with pytest.raises(parser.ParserError):
@@ -61,7 +62,7 @@ class TestDateTimeParser:
             pass
 
         mocker.patch(
-            "arrow.parser.DateTimeParser.parse",
+            "arrow.parser.DateTimeParser._try_parse",
             string="str",
             fmt="fmt_a",
             side_effect=UnselfExpectedError,
@@ -70,17 +71,42 @@ class TestDateTimeParser:
         with pytest.raises(UnselfExpectedError):
             self.parser._parse_multiformat("str", ["fmt_a", "fmt_b"])
 
-    def test_parse_token_nonsense(self):
-        parts = {}
-        self.parser._parse_token("NONSENSE", "1900", parts)
-        assert parts == {}
+    def test_parse_multiformat_does_not_raise_per_format(self, mocker):
+        spy = mocker.spy(parser.DateTimeParser, "parse")
 
-    def test_parse_token_invalid_meridians(self):
-        parts = {}
-        self.parser._parse_token("A", "a..m", parts)
-        assert parts == {}
-        self.parser._parse_token("a", "p..m", parts)
-        assert parts == {}
+        assert self.parser._parse_multiformat(
+            "2021-10-12", ["MM/DD/YYYY", "X", "YYYY-MM-DD"]
+        ) == datetime(2021, 10, 12)
+        assert spy.call_count == 0
+
+    def test_parse_multiformat_propagates_build_errors(self):
+        # errors raised after a successful match are not swallowed
+        with pytest.raises(ParserError) as exc:
+            self.parser._parse_multiformat("2021-400", ["YYYY-DDDD", "YYYY-MM"])
+
+        assert str(exc.value) == "The provided day of year 400 is invalid."
+
+    def test_parse_ignored_token(self):
+        # the isoweekday token is matched but does not set a field
+        assert self.parser.parse("2021 3", "YYYY d") == datetime(2021, 1, 1)
+
+    def test_parse_invalid_meridians(self):
+        assert self.parser._parse_meridian("a..m") is None
+        assert self.parser._parse_meridian("p..m") is None
+        # the pattern is case insensitive, but only listed meridians are converted
+        assert self.parser.parse("5 Pm", "h a") == datetime(1, 1, 1, 5)
+
+    def test_generate_pattern_re_extractor(self):
+        pattern, extractor = self.parser._generate_pattern_re("h:mm a W Do")
+
+        assert pattern.search("5:30 am 2011-W05-4 3rd") is not None
+        assert [step[0] for step in extractor.steps] == ["h", "mm", "a", "W", "Do"]
+        assert extractor.steps[3][1] == ("year", "week", "day")
+        assert extractor.steps[4][1] == ("value",)
+        assert extractor.meridian_token == "a"
+
+        _, extractor = self.parser._generate_pattern_re("a h")
+        assert extractor.meridian_token is None
 
     def test_parser_no_caching(self, mocker):
         mocked_parser = mocker.patch(
@@ -540,6 +566,13 @@ class TestDateTimeParserParse:
         with pytest.raises(ParserError):
             self.parser.parse("1998-456", "YYYY-DDDD")
 
+        assert self.parser.parse("0099-005", "YYYY-DDDD") == datetime(99, 1, 5)
+
+        with pytest.raises(ParserError) as exc:
+            self.parser.parse("9999-366", "YYYY-DDDD")
+
+        assert str(exc.value) == "The provided day of year 366 is invalid."
+
     def test_parse_YYYY_DDD(self):
         assert self.parser.parse("1998-6", "YYYY-DDD") == datetime(1998, 1, 6)
 
@@ -747,6 +780,11 @@ class TestDateTimeParserParse:
             with pytest.raises(ParserError):
                 self.parser.parse(fmt, "W")
 
+        with pytest.raises(ParserError) as exc:
+            self.parser.parse("9999-W53-1", "W")
+
+        assert str(exc.value) == "The provided week date 9999-W53-1 is out of range."
+
     def test_parse_normalize_whitespace(self):
         assert self.parser.parse(
             "Jun 1 2005  1:33PM", "MMM D YYYY H:mmA", normalize_whitespace=True
@@ -775,6 +813,61 @@ class TestDateTimeParserParse:
             self.parser.parse("  \n Jun   1\t 2005\n ", "MMM D YYYY")
 
 
+@pytest.mark.usefixtures("dt_parser")
+class TestDateTimeParserTryParse:
+    def test_try_parse(self):
+        assert self.parser.try_parse(
+            "2021-10-12 14:30", "YYYY-MM-DD HH:mm"
+        ) == datetime(2021, 10, 12, 14, 30)
+        assert self.parser.try_parse("2021-10-12", "MM/DD/YYYY") is None
+
+    def test_try_parse_list(self):
+        assert self.parser.try_parse(
+            "2021-10-12", ["MM/DD/YYYY", "YYYY-MM-DD"]
+        ) == datetime(2021, 10, 12)
+        assert self.parser.try_parse("junk", ["MM/DD/YYYY", "YYYY-MM-DD"]) is None
+        assert self.parser.try_parse("junk", []) is None
+
+    def test_try_parse_normalize_whitespace(self):
+        assert self.parser.try_parse("2021-10-12  14:30", "YYYY-MM-DD HH:mm") is None
+        assert self.parser.try_parse(
+            "2021-10-12  14:30", "YYYY-MM-DD HH:mm", normalize_whitespace=True
+        ) == datetime(2021, 10, 12, 14, 30)
+
+    def test_try_parse_invalid_values(self):
+        # values that match the pattern but do not form a valid datetime
+        assert self.parser.try_parse("2021-13-12", "YYYY-MM-DD") is None
+        assert self.parser.try_parse("2021-400", "YYYY-DDDD") is None
+        assert self.parser.try_parse("99999999999999999999", "x") is None
+        assert self.parser.try_parse("13:00 am", "H:mm a") is None
+
+    def test_try_parse_invalid_formats(self):
+        assert self.parser.try_parse("2021-10-12", "YYY") is None
+        assert self.parser.try_parse("", str(b"struct n[X+,N-M)MMXdMM]<")) is None
+
+    def test_try_parse_iso(self):
+        assert self.parser.try_parse_iso("2021-10-12T14:30:00") == datetime(
+            2021, 10, 12, 14, 30
+        )
+        assert self.parser.try_parse_iso("2021-10-12T14:30:00+01:00") == datetime(
+            2021, 10, 12, 14, 30, tzinfo=tz.tzoffset(None, 3600)
+        )
+        assert self.parser.try_parse_iso("2021-10-12") == datetime(2021, 10, 12)
+
+    def test_try_parse_iso_invalid(self):
+        assert self.parser.try_parse_iso("not a date") is None
+        assert self.parser.try_parse_iso("2021-10-12 14:30 extra") is None
+        assert self.parser.try_parse_iso("2021-10-12Tjunk") is None
+        assert self.parser.try_parse_iso("2021-02-30") is None
+        assert self.parser.try_parse_iso("junk") is None
+
+    def test_try_parse_iso_normalize_whitespace(self):
+        assert self.parser.try_parse_iso(" 2021-10-12 \t 14:30 ") is None
+        assert self.parser.try_parse_iso(
+            " 2021-10-12 \t 14:30 ", normalize_whitespace=True
+        ) == datetime(2021, 10, 12, 14, 30)
+
+
 @pytest.mark.usefixtures("dt_parser_regex")
 class TestDateTimeParserRegex:
     def test_format_year(self):
@@ -1596,3 +1689,182 @@ class TestFuzzInput:
 
         with pytest.raises(parser.ParserMatchError):
             self.parser.parse(payload, fmt_str)
+
+
+class TestAdaptiveDateTimeParser:
+    def test_parse_single_format(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+
+        assert adaptive.parse("2021-10-12", "YYYY-MM-DD") == datetime(2021, 10, 12)
+        assert adaptive.stats() == {"hits": {}, "fallbacks": 0, "misses": 0}
+
+    def test_hot_format_tried_first(self, mocker):
+        adaptive = parser.AdaptiveDateTimeParser()
+        formats = ["MM/DD/YYYY", "YYYY-MM-DD HH:mm", "YYYY-MM-DD"]
+
+        for _ in range(3):
+            assert adaptive.parse("2021-10-12 14:30", formats) == datetime(
+                2021, 10, 12, 14, 30
+            )
+
+        assert adaptive._plan(tuple(formats)).hot == 1
+
+        spy = mocker.spy(adaptive, "_build_from_match")
+        adaptive._parse_multiformat("2021-10-12 14:30", formats)
+        assert spy.call_count == 1
+
+        assert adaptive.stats() == {
+            "hits": {"YYYY-MM-DD HH:mm": 4},
+            "fallbacks": 0,
+            "misses": 0,
+        }
+
+    def test_result_matches_caller_order(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+        formats = ["MM/DD/YYYY", "D/M/YYYY"]
+
+        # train on inputs only the second format can match
+        for day in range(3, 10):
+            adaptive.parse(f"{day}/2/2020", formats)
+
+        # ambiguous input: the caller's order decides, not the hit counts
+        assert adaptive.parse("01/02/2020", formats) == datetime(2020, 1, 2)
+        assert adaptive.parse("01/02/2020", formats) == parser.DateTimeParser().parse(
+            "01/02/2020", formats
+        )
+
+        stats = adaptive.stats()
+        assert stats["hits"] == {"D/M/YYYY": 7, "MM/DD/YYYY": 2}
+        assert stats["fallbacks"] == 2
+
+    def test_tie_break_uses_caller_order(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+
+        assert adaptive.parse("2021-10-12", ["YYYY-MM-DD", "YYYY-M-D"]) == datetime(
+            2021, 10, 12
+        )
+        assert adaptive.stats()["hits"] == {"YYYY-MM-DD": 1}
+
+    def test_no_match(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+
+        with pytest.raises(ParserError) as exc:
+            adaptive.parse("junk", ["YYYY-MM-DD", "MM/DD/YYYY"])
+
+        assert str(exc.value) == (
+            "Could not match input 'junk' to any of the following formats: "
+            "YYYY-MM-DD, MM/DD/YYYY."
+        )
+        assert adaptive.stats() == {"hits": {}, "fallbacks": 0, "misses": 1}
+
+    def test_match_error_after_search(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+
+        with pytest.raises(ParserError):
+            adaptive.parse("13:00 am", ["H:mm a"])
+
+        assert adaptive.stats() == {"hits": {}, "fallbacks": 1, "misses": 1}
+
+        for _ in range(2):
+            assert adaptive.parse("14:00", ["H:mm a", "H:mm"]) == datetime(1, 1, 1, 14)
+
+        # "H:mm a" matches the pattern but fails on the meridian check
+        assert adaptive.parse("13:00 am", ["H:mm a", "H:mm"]) == datetime(1, 1, 1, 13)
+        assert adaptive.stats()["hits"] == {"H:mm": 3}
+
+    def test_invalid_formats_fall_back(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+
+        # unrecognized tokens raise exactly as they would in the caller's order
+        with pytest.raises(ParserError):
+            adaptive.parse("2021-10-12", ["YYY", "YYYY-MM-DD"])
+
+        assert adaptive.parse("2021-10-12", ["YYYY-MM-DD", "YYY"]) == datetime(
+            2021, 10, 12
+        )
+
+        # formats that are not valid regular expressions are skipped
+        for _ in range(2):
+            assert adaptive.parse(
+                "2021-10-12", ["struct n[X+,N-M)MMXdMM]<", "YYYY-MM-DD"]
+            ) == datetime(2021, 10, 12)
+
+    def test_separators(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+        formats = ["MM/DD/YYYY", "[at] h.mm a", "ddd, D MMM", "YYYY-MM-DD"]
+
+        assert [entry[2] for entry in adaptive._plan(tuple(formats)).entries] == [
+            "/",
+            " .",
+            " ,",
+            "-",
+        ]
+
+    def test_ties_go_to_the_earlier_format(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+        formats = ["MM/DD/YYYY", "YYYY-MM-DD"]
+
+        adaptive.parse("2021-10-12", formats)
+        assert adaptive._plan(tuple(formats)).hot == 1
+
+        adaptive.parse("10/12/2021", formats)
+        assert adaptive._plan(tuple(formats)).hot == 0
+
+    def test_plans_cache(self, mocker):
+        mocker.patch.object(parser.AdaptiveDateTimeParser, "_PLANS_SIZE", 2)
+        adaptive = parser.AdaptiveDateTimeParser()
+
+        for formats in [["YYYY", "MM"], ["YYYY", "DD"], ["YYYY", "MM"]]:
+            adaptive.parse("2021", formats)
+        assert list(adaptive._plans) == [("YYYY", "MM"), ("YYYY", "DD")]
+
+        adaptive.parse("2021", ["YYYY", "HH"])
+        assert list(adaptive._plans) == [("YYYY", "HH")]
+
+    def test_matches_caller_order(self):
+        rng = random.Random(0)
+        formats = [
+            "MM/DD/YYYY",
+            "D/M/YYYY",
+            "YYYY-MM-DD",
+            "YYYY-MM-DD HH:mm",
+            "DD.MM.YYYY HH:mm",
+            "ddd, D MMM YYYY",
+            "H:mm a",
+            "H:mm",
+        ]
+        strings = [
+            "01/02/2020",
+            "3/2/2020",
+            "13/2/2020",
+            "2020-02-03",
+            "2020-02-03 14:30",
+            "03.02.2020 14:30",
+            "Mon, 3 Feb 2020",
+            "13:00 am",
+            "1:00 pm",
+            "14:00",
+            "junk",
+        ]
+        adaptive = parser.AdaptiveDateTimeParser()
+        plain = parser.DateTimeParser()
+
+        for _ in range(500):
+            string = rng.choice(strings)
+            fmts = rng.sample(formats, rng.randint(1, len(formats)))
+
+            try:
+                expected = plain.parse(string, fmts)
+            except ParserError:
+                with pytest.raises(ParserError):
+                    adaptive.parse(string, fmts)
+            else:
+                assert adaptive.parse(string, fmts) == expected
+
+    def test_reset_stats(self):
+        adaptive = parser.AdaptiveDateTimeParser()
+        adaptive.parse("2021-10-12", ["YYYY-MM-DD"])
+
+        adaptive.reset_stats()
+
+        assert adaptive.stats() == {"hits": {}, "fallbacks": 0, "misses": 0}
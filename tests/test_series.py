@@ -0,0 +1,499 @@
+import random
+from datetime import datetime, timezone
+from operator import itemgetter
+
+import pytest
+from dateutil import tz
+
+from arrow import Arrow, bucketize, find_gaps, resample
+from arrow.series import _Grid
+
+START = Arrow(2013, 5, 5, 12, 30)
+
+
+def spans(values, frame, tzinfo, week_start=1, key=None):
+    result = {}
+    for value in values:
+        timestamp = value if key is None else key(value)
+        floor = timestamp.to(tzinfo).span(frame, week_start=week_start)[0]
+        result.setdefault(floor, []).append(value)
+    return sorted(result.items())
+
+
+class TestBucketize:
+    def test_hours(self):
+        events = [START, START.shift(minutes=15), START.shift(hours=2)]
+
+        assert list(bucketize(events, "hour")) == [
+            (Arrow(2013, 5, 5, 12), events[:2]),
+            (Arrow(2013, 5, 5, 14), events[2:]),
+        ]
+
+    def test_empty(self):
+        assert list(bucketize([], "day")) == []
+        assert list(bucketize([], "day", ordered=False)) == []
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            bucketize([], "fortnight")
+
+        with pytest.raises(ValueError):
+            bucketize([], "week", week_start=0)
+
+        with pytest.raises(ValueError):
+            bucketize([], "day", tz="Not/A_Zone")
+
+        with pytest.raises(TypeError):
+            list(bucketize(["2013-05-05"], "day"))
+
+    def test_key_and_aggregate(self):
+        events = [(START, 1), (START.shift(minutes=5), 2), (START.shift(days=1), 3)]
+
+        result = bucketize(
+            events,
+            "day",
+            key=lambda event: event[0],
+            aggregate=lambda items: sum(value for _, value in items),
+        )
+
+        assert list(result) == [(Arrow(2013, 5, 5), 3), (Arrow(2013, 5, 6), 3)]
+
+    def test_unsorted(self):
+        events = [START.shift(hours=3), START, START.shift(hours=3, minutes=5)]
+
+        with pytest.raises(ValueError):
+            list(bucketize(events, "hour"))
+
+        assert list(bucketize(events, "hour", ordered=False, aggregate=len)) == [
+            (Arrow(2013, 5, 5, 12), 1),
+            (Arrow(2013, 5, 5, 15), 2),
+        ]
+
+    def test_streams(self):
+        def events():
+            yield START
+            yield START.shift(days=1)
+            raise RuntimeError()
+
+        buckets = bucketize(events(), "day")
+
+        assert next(buckets) == (Arrow(2013, 5, 5), [START])
+        with pytest.raises(RuntimeError):
+            next(buckets)
+
+    def test_tz_defaults_to_first_timestamp(self):
+        events = [
+            Arrow(2013, 5, 5, 23, tzinfo="US/Pacific"),
+            Arrow(2013, 5, 6, 6, 30),
+        ]
+
+        ((floor, items),) = bucketize(events, "day")
+
+        assert floor == Arrow(2013, 5, 5, tzinfo="US/Pacific")
+        assert floor.tzinfo == tz.gettz("US/Pacific")
+        assert items == events
+
+    def test_naive_datetimes(self):
+        events = [datetime(2013, 5, 5, 23), datetime(2013, 5, 6, 1)]
+
+        assert list(bucketize(events, "day", aggregate=len)) == [
+            (Arrow(2013, 5, 5), 1),
+            (Arrow(2013, 5, 6), 1),
+        ]
+        assert list(bucketize(events, "day", tz="+02:00", aggregate=len)) == [
+            (Arrow(2013, 5, 6, tzinfo="+02:00"), 2),
+        ]
+
+    @pytest.mark.parametrize(
+        "tzinfo",
+        [
+            "UTC",
+            "+05:30",
+            timezone.utc,
+            "US/Pacific",
+            "Europe/London",
+            "Australia/Lord_Howe",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "frame, step",
+        [
+            ("microsecond", {"microseconds": 3}),
+            ("seconds", {"microseconds": 700_000}),
+            ("minute", {"seconds": 41}),
+            ("hour", {"minutes": 37}),
+            ("day", {"hours": 5}),
+            ("week", {"hours": 31}),
+            ("month", {"days": 9}),
+            ("quarter", {"days": 29}),
+            ("year", {"days": 97}),
+        ],
+    )
+    def test_matches_span(self, frame, step, tzinfo):
+        # crosses the 2020-11-01 DST change in US/Pacific
+        start = Arrow(2020, 11, 1, 7)
+        events = [start]
+        for _ in range(40):
+            events.append(events[-1].shift(**step))
+
+        for week_start in (1, 4, 7):
+            expected = spans(events, frame, tzinfo, week_start)
+
+            result = bucketize(events, frame, week_start=week_start, tz=tzinfo)
+            assert list(result) == expected
+
+            result = bucketize(
+                events[::-1], frame, week_start=week_start, tz=tzinfo, ordered=False
+            )
+            assert [(floor, items[::-1]) for floor, items in result] == expected
+
+    def test_ambiguous_hour(self):
+        # 01:30 occurs twice in US/Pacific; both belong to the span of the first 01:00
+        first = Arrow(2020, 11, 1, 8, 30)
+        second = Arrow(2020, 11, 1, 9, 30)
+        after = Arrow(2020, 11, 1, 10, 30)
+
+        result = list(bucketize([first, second, after], "hour", tz="US/Pacific"))
+
+        assert result == spans([first, second, after], "hour", "US/Pacific")
+        assert [len(items) for _, items in result] == [2, 1]
+
+
+class TestFindGaps:
+    def test_gaps(self):
+        readings = [START.shift(minutes=m) for m in (0, 1, 4, 5, 9)]
+
+        assert list(find_gaps(readings, "minute")) == [
+            (START.shift(minutes=2), START.shift(minutes=4, microseconds=-1)),
+            (START.shift(minutes=6), START.shift(minutes=9, microseconds=-1)),
+        ]
+
+    def test_no_gaps(self):
+        readings = [START, START.shift(seconds=30), START.shift(minutes=1, seconds=5)]
+
+        assert list(find_gaps(readings, "minute")) == []
+        assert list(find_gaps([], "minute")) == []
+        assert list(find_gaps([], "minute", start=START)) == []
+        assert list(find_gaps([], "minute", end=START)) == []
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            find_gaps([], "fortnight")
+
+        with pytest.raises(ValueError):
+            list(find_gaps([START, START.shift(hours=-2)], "hour"))
+
+    def test_start_and_end(self):
+        readings = [START.shift(hours=h) for h in (1, 2, 5)]
+
+        result = find_gaps(
+            readings,
+            "hour",
+            start=START.shift(hours=-1, minutes=10),
+            end=START.shift(hours=6, minutes=59),
+        )
+
+        assert list(result) == [
+            (Arrow(2013, 5, 5, 11), Arrow(2013, 5, 5, 12, 59, 59, 999999)),
+            (Arrow(2013, 5, 5, 15), Arrow(2013, 5, 5, 16, 59, 59, 999999)),
+            (Arrow(2013, 5, 5, 18), Arrow(2013, 5, 5, 19, 59, 59, 999999)),
+        ]
+
+    def test_window_without_timestamps(self):
+        result = find_gaps([], "quarter", start=START, end=Arrow(2014, 1, 1))
+
+        assert list(result) == [
+            (Arrow(2013, 4, 1), Arrow(2014, 3, 31, 23, 59, 59, 999999))
+        ]
+
+    def test_timestamps_outside_window(self):
+        readings = [START.shift(days=d) for d in (-3, 0, 2, 5, 9)]
+
+        result = find_gaps(
+            readings, "day", start=START.shift(days=-1), end=START.shift(days=3)
+        )
+
+        assert list(result) == [
+            (Arrow(2013, 5, 4), Arrow(2013, 5, 4, 23, 59, 59, 999999)),
+            (Arrow(2013, 5, 6), Arrow(2013, 5, 6, 23, 59, 59, 999999)),
+            (Arrow(2013, 5, 8), Arrow(2013, 5, 8, 23, 59, 59, 999999)),
+        ]
+
+    def test_streams(self):
+        def readings():
+            yield START
+            yield START.shift(hours=3)
+            raise RuntimeError()
+
+        gaps = find_gaps(readings(), "hour")
+
+        assert next(gaps) == (
+            Arrow(2013, 5, 5, 13),
+            Arrow(2013, 5, 5, 14, 59, 59, 999999),
+        )
+        with pytest.raises(RuntimeError):
+            next(gaps)
+
+    def test_weeks(self):
+        readings = [
+            Arrow(2013, 5, 1, tzinfo="US/Pacific"),
+            Arrow(2013, 5, 22, tzinfo="US/Pacific"),
+        ]
+
+        assert list(find_gaps(readings, "weeks", week_start=3, tz="US/Pacific")) == [
+            (
+                Arrow(2013, 5, 8, tzinfo="US/Pacific"),
+                Arrow(2013, 5, 21, 23, 59, 59, 999999, tzinfo="US/Pacific"),
+            )
+        ]
+
+    @pytest.mark.parametrize("tzinfo", ["UTC", "US/Pacific", "Europe/London"])
+    @pytest.mark.parametrize("frame", ["hour", "day", "month"])
+    def test_matches_range(self, frame, tzinfo):
+        # crosses the DST changes of March 2020, or of the whole year
+        start = Arrow(2020, 3, 1, tzinfo=tzinfo)
+        end = Arrow(2020, 4, 5 if frame == "hour" else 11, tzinfo=tzinfo)
+        expected = list(Arrow.span_range(frame, start, end, tz=tzinfo))
+
+        rng = random.Random(frame)
+        present = set(rng.sample(range(len(expected)), len(expected) // 2))
+        readings = [
+            expected[i][0].shift(microseconds=rng.randrange(1000))
+            for i in sorted(present)
+        ]
+
+        gaps = find_gaps(readings, frame, start=start, end=end)
+
+        assert [
+            span for gap in gaps for span in Arrow.span_range(frame, *gap, tz=tzinfo)
+        ] == [span for i, span in enumerate(expected) if i not in present]
+
+
+class TestResample:
+    def test_mean(self):
+        readings = [(START, 3), (START.shift(minutes=10), 5), (START.shift(hours=2), 4)]
+
+        assert list(resample(readings, "hour")) == [
+            (Arrow(2013, 5, 5, 12), 4),
+            (Arrow(2013, 5, 5, 13), None),
+            (Arrow(2013, 5, 5, 14), 4),
+        ]
+
+    @pytest.mark.parametrize(
+        "how, expected",
+        [
+            ("first", [3, 0, 4]),
+            ("last", [5, 0, 4]),
+            ("count", [2, 0, 1]),
+            ("sum", [8, 0, 4]),
+            ("min", [3, 0, 4]),
+            ("max", [5, 0, 4]),
+            (sorted, [[3, 5], 0, [4]]),
+        ],
+    )
+    def test_how(self, how, expected):
+        readings = [(START, 3), (START.shift(minutes=10), 5), (START.shift(hours=2), 4)]
+
+        assert [
+            value for _, value in resample(readings, "hour", how, fill=0)
+        ] == expected
+
+    def test_empty(self):
+        assert list(resample([], "day")) == []
+        assert list(resample({"a": [], "b": []}, "day")) == []
+        assert list(resample({}, "day", start=START, end=START)) == [
+            (Arrow(2013, 5, 5), {})
+        ]
+        assert list(resample([], "day", end=START)) == []
+        assert list(resample([], "day", start=START, end=START)) == [
+            (Arrow(2013, 5, 5), None)
+        ]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            resample([], "hour", how="median")
+
+        with pytest.raises(ValueError):
+            resample([], "fortnight")
+
+        with pytest.raises(ValueError):
+            list(resample([(START, 1), (START.shift(seconds=-1), 2)], "hour"))
+
+    def test_start_and_end(self):
+        readings = [(START.shift(days=d), d) for d in (-3, -1, 0, 2, 5)]
+
+        result = resample(
+            readings,
+            "day",
+            how="sum",
+            start=START.shift(days=-1),
+            end=START.shift(days=2),
+        )
+
+        assert list(result) == [
+            (Arrow(2013, 5, 4), -1),
+            (Arrow(2013, 5, 5), 0),
+            (Arrow(2013, 5, 6), None),
+            (Arrow(2013, 5, 7), 2),
+        ]
+
+    def test_several_series(self):
+        temperature = [(START, 20.0), (START.shift(minutes=20), 21.0)]
+        humidity = [(START.shift(hours=-1), 50), (START.shift(hours=1), 60)]
+
+        result = resample(
+            {"temperature": temperature, "humidity": humidity}, "hour", how="last"
+        )
+
+        assert list(result) == [
+            (Arrow(2013, 5, 5, 11), {"temperature": None, "humidity": 50}),
+            (Arrow(2013, 5, 5, 12), {"temperature": 21.0, "humidity": None}),
+            (Arrow(2013, 5, 5, 13), {"temperature": None, "humidity": 60}),
+        ]
+
+    def test_timezone(self):
+        readings = [
+            (datetime(2013, 5, 5, 6, 30), 1),
+            (datetime(2013, 5, 5, 7, 30), 2),
+        ]
+
+        assert list(resample(readings, "day", how="count", tz="US/Pacific")) == [
+            (Arrow(2013, 5, 4, tzinfo="US/Pacific"), 1),
+            (Arrow(2013, 5, 5, tzinfo="US/Pacific"), 1),
+        ]
+        assert list(resample(readings, "day", how="count", start=START.to("+09:00")))[
+            0
+        ] == (Arrow(2013, 5, 5, tzinfo="+09:00"), 2)
+
+    def test_streams(self):
+        def readings():
+            yield START, 1
+            yield START.shift(hours=2), 2
+            raise RuntimeError()
+
+        result = resample(readings(), "hour", how="first")
+
+        assert next(result) == (Arrow(2013, 5, 5, 12), 1)
+        assert next(result) == (Arrow(2013, 5, 5, 13), None)
+        with pytest.raises(RuntimeError):
+            next(result)
+
+    @pytest.mark.parametrize("tzinfo", ["UTC", "US/Pacific", "Europe/London"])
+    @pytest.mark.parametrize("frame", ["hour", "day", "month"])
+    def test_matches_span(self, frame, tzinfo):
+        # crosses the DST changes of March 2020, or of the whole year
+        start = Arrow(2020, 3, 1, tzinfo=tzinfo)
+        end = Arrow(2020, 4, 5 if frame == "hour" else 11, tzinfo=tzinfo)
+        seconds = int((end - start).total_seconds())
+
+        rng = random.Random(frame)
+        series = {
+            name: sorted(
+                (start.to("UTC").shift(seconds=rng.randrange(seconds)), rng.random())
+                for _ in range(300)
+            )
+            for name in "ab"
+        }
+
+        result = list(resample(series, frame, how=list, start=start, end=end))
+
+        assert [floor for floor, _ in result] == [
+            floor for floor, _ in Arrow.span_range(frame, start, end, tz=tzinfo)
+        ]
+        for name, pairs in series.items():
+            expected = {
+                floor: [value for _, value in group]
+                for floor, group in spans(pairs, frame, tzinfo, key=itemgetter(0))
+            }
+            assert {
+                floor: row[name] for floor, row in result if row[name] is not None
+            } == expected
+
+    def test_dst_change_at_midnight(self):
+        # DST started at midnight on Sunday 2001-04-01 in Havana, so that week starts
+        # at 01:00 but the next one at midnight again
+        start = Arrow(2001, 3, 31, 23, tzinfo="America/Havana")
+        series = [(start.to("UTC").shift(hours=hours), hours) for hours in range(200)]
+
+        result = list(
+            resample(series, "week", "first", week_start=7, tz="America/Havana")
+        )
+
+        assert [(floor.isoformat(), value) for floor, value in result] == [
+            ("2001-03-25T00:00:00-05:00", 0),
+            ("2001-04-01T01:00:00-04:00", 1),
+            ("2001-04-08T00:00:00-04:00", 168),
+        ]
+        assert [floor for floor, _ in result] == [
+            floor.span("week", week_start=7)[0] for floor, _ in result
+        ]
+
+
+class TestGrid:
+    def test_reuses_span(self, mocker):
+        grid = _Grid("month", 1, "US/Pacific")
+        span = mocker.spy(Arrow, "span")
+
+        # the span and the next one, whose floor is then reused
+        start, end = grid.locate(START.int_timestamp_us)
+        assert grid.locate(START.int_timestamp_us + 1) == (start, end)
+        assert grid.locate(end - 1) == (start, end)
+        assert span.call_count == 2
+
+        assert grid.floor(start) == Arrow(2013, 5, 1, tzinfo="US/Pacific")
+        assert grid.floor(start) is grid.floor(start)
+
+        assert grid.locate(end)[0] == end
+        assert grid.floor(end) == Arrow(2013, 6, 1, tzinfo="US/Pacific")
+        assert span.call_count == 3
+
+    def test_skips_ahead(self):
+        grid = _Grid("day", 1, "US/Pacific")
+        grid.locate(START.int_timestamp_us)
+
+        later = START.shift(days=3)
+        start, end = grid.locate(later.int_timestamp_us)
+
+        assert grid.floor(start) == later.to("US/Pacific").floor("day")
+        assert end - start == 86_400_000_000
+
+    def test_fixed_frames(self, mocker):
+        grid = _Grid("week", 7, tz.tzoffset(None, -3600))
+        span = mocker.spy(Arrow, "span")
+
+        start, end = grid.locate(START.int_timestamp_us)
+
+        assert span.call_count == 0
+        assert end - start == 7 * 86_400_000_000
+        assert grid.floor(start) == Arrow(2013, 5, 5, tzinfo=tz.tzoffset(None, -3600))
+
+        grid = _Grid("hour", 1, "Etc/GMT+5")
+        start, end = grid.locate(START.int_timestamp_us)
+
+        assert span.call_count == 0
+        assert grid.floor(start) == Arrow(2013, 5, 5, 7, tzinfo="Etc/GMT+5")
+
+    @pytest.mark.parametrize(
+        "tzinfo, change",
+        [
+            ("US/Pacific", Arrow(2020, 3, 8, 10)),
+            ("US/Pacific", Arrow(2020, 11, 1, 9)),
+            ("Australia/Lord_Howe", Arrow(2020, 10, 3, 15, 30)),
+            ("Australia/Lord_Howe", Arrow(2020, 4, 4, 14, 30)),
+            ("America/Sao_Paulo", Arrow(2018, 11, 4, 3)),
+        ],
+    )
+    @pytest.mark.parametrize("frame", ["hour", "day"])
+    def test_tiles_dst_changes(self, frame, tzinfo, change):
+        grid = _Grid(frame, 1, tzinfo)
+        moment = change.shift(hours=-30)
+
+        while moment < change.shift(hours=30):
+            us = moment.int_timestamp_us
+            start, end = grid.locate(us)
+
+            assert start <= us < end
+            assert grid.floor(start) == moment.to(tzinfo).span(frame)[0]
+            assert grid.locate(end)[0] == end
+
+            moment = moment.shift(minutes=10)
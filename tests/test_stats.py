@@ -0,0 +1,137 @@
+import pytest
+
+import arrow
+from arrow import locales, parser, stats
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    stats.disable()
+    stats.reset()
+    yield
+    stats.disable()
+    stats.reset()
+
+
+class TestStats:
+    def test_disabled_by_default(self):
+        assert not stats.is_enabled()
+
+        arrow.get("2013-05-05T12:30:45", tzinfo="US/Pacific")
+
+        assert set(stats.snapshot().values()) == {0}
+
+    def test_enable_disable_reset(self):
+        stats.enable()
+        assert stats.is_enabled()
+        arrow.get("2013-05-05")
+
+        stats.disable()
+        arrow.get("2013-05-05")
+
+        assert stats.snapshot()["iso_parses"] == 1
+
+        stats.reset()
+        assert stats.snapshot()["iso_parses"] == 0
+
+    def test_snapshot_is_copy(self):
+        snapshot = stats.snapshot()
+        snapshot["iso_parses"] = 10
+
+        assert stats.snapshot()["iso_parses"] == 0
+
+    def test_collect(self):
+        with stats.collect() as counts:
+            assert stats.is_enabled()
+            assert counts == {}
+
+            arrow.get("2013-05-05 12:30")
+
+        assert not stats.is_enabled()
+        assert counts["iso_parses"] == 1
+        assert counts["locale_constructions"] == 1
+        assert counts["pattern_compiles"] == 1
+        assert counts["pattern_compile_seconds"] > 0
+
+    def test_collect_nested(self):
+        stats.enable()
+        arrow.get("2013-05-05")
+
+        with stats.collect() as outer:
+            arrow.get("2013-05-05")
+
+            with stats.collect() as inner:
+                arrow.get("2013-05-05")
+
+            assert stats.is_enabled()
+
+        assert stats.is_enabled()
+        assert inner["iso_parses"] == 1
+        assert outer["iso_parses"] == 2
+        assert stats.snapshot()["iso_parses"] == 3
+
+    def test_collect_error(self):
+        with pytest.raises(parser.ParserError):
+            with stats.collect() as counts:
+                arrow.get("nope", "YYYY")
+
+        assert not stats.is_enabled()
+        assert counts["pattern_compiles"] == 1
+
+    def test_pattern_cache(self):
+        dt_parser = parser.DateTimeParser(cache_size=1)
+
+        with stats.collect() as counts:
+            for fmt in ["YYYY", "YYYY", "YYYY", "MM", "YYYY"]:
+                dt_parser.parse("2013 05", fmt)
+
+        assert counts["pattern_cache_hits"] == 2
+        assert counts["pattern_cache_misses"] == 3
+        assert counts["pattern_compiles"] == 3
+
+    def test_pattern_cache_disabled(self):
+        dt_parser = parser.DateTimeParser(cache_size=1)
+        dt_parser.parse("2013", "YYYY")
+
+        assert dt_parser._generate_pattern_re("YYYY") is dt_parser._generate_pattern_re(
+            fmt="YYYY"
+        )
+        assert stats.snapshot()["pattern_cache_hits"] == 0
+
+    def test_tz_parses(self):
+        with stats.collect() as counts:
+            for expr in ["local", "utc", "Z", "+01:00", "-0830", "US/Pacific"]:
+                parser.TzinfoParser.parse(expr)
+
+            with pytest.raises(parser.ParserError):
+                parser.TzinfoParser.parse("Not/A_Zone")
+
+        assert counts["tz_parses_local"] == 1
+        assert counts["tz_parses_utc"] == 2
+        assert counts["tz_parses_offset"] == 2
+        assert counts["tz_parses_named"] == 1
+
+    def test_locale_constructions(self):
+        with stats.collect() as counts:
+            locales.get_locale("fr")
+            locales.get_locale_by_class_name("GermanLocale")
+
+            with pytest.raises(ValueError):
+                locales.get_locale("xx")
+
+        assert counts["locale_constructions"] == 2
+
+    def test_format_fallbacks(self):
+        dt_parser = parser.DateTimeParser()
+
+        with stats.collect() as counts:
+            dt_parser.parse_iso("2013-05-05")
+            dt_parser.parse_iso("20130505")
+            dt_parser.try_parse_iso("2013.05.05")
+            dt_parser.try_parse_iso("2013 05 05")
+            dt_parser.parse("05/05/2013", ["YYYY-MM-DD", "MM/DD/YYYY"])
+            dt_parser.try_parse("05/05/2013", ["YYYY-MM-DD", "MM/DD/YYYY"])
+            assert dt_parser.try_parse("nope", ["YYYY-MM-DD", "MM/DD/YYYY"]) is None
+
+        assert counts["iso_parses"] == 4
+        assert counts["format_fallbacks"] == 9 + 6 + 1 + 1
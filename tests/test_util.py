@@ -1,7 +1,9 @@
+import calendar
 import time
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 import pytest
+from dateutil import tz
 
 from arrow import util
 
@@ -36,6 +38,30 @@ class TestUtil:
         with pytest.raises(ValueError):
             util.next_weekday(datetime(1970, 1, 1), -1)
 
+    def test_next_weekday_start_date_types(self):
+        # dates start at midnight
+        assert util.next_weekday(date(1970, 1, 1), 0) == datetime(1970, 1, 5)
+
+        # the time and tzinfo are kept, microseconds are dropped
+        start = datetime(1970, 1, 1, 10, 30, 15, 999999, tzinfo=tz.tzutc(), fold=1)
+        result = util.next_weekday(start, 4)
+        assert result == datetime(1970, 1, 2, 10, 30, 15, tzinfo=tz.tzutc())
+        assert result.fold == 0
+
+        # no start date means now
+        now = datetime.now().replace(microsecond=0)
+        assert util.next_weekday(None, now.weekday()) >= now
+
+    def test_next_weekdays(self):
+        assert util.next_weekdays(
+            [datetime(1970, 1, 1), date(1970, 1, 6), datetime(1970, 1, 12)], 0
+        ) == [datetime(1970, 1, 5), datetime(1970, 1, 12), datetime(1970, 1, 12)]
+
+        assert util.next_weekdays([], 6) == []
+
+        with pytest.raises(ValueError):
+            util.next_weekdays([datetime(1970, 1, 1)], 7)
+
     def test_is_timestamp(self):
         timestamp_float = time.time()
         timestamp_int = int(timestamp_float)
@@ -113,6 +139,40 @@ class TestUtil:
         with pytest.raises(TypeError):
             util.validate_ordinal(full_datetime)
 
+    def test_epoch_us(self):
+        assert util.epoch_us(datetime(1970, 1, 1, tzinfo=timezone.utc)) == 0
+        assert (
+            util.epoch_us(datetime(2013, 5, 5, 12, 30, 45, 123456, tzinfo=tz.tzutc()))
+            == 1367757045123456
+        )
+        assert (
+            util.epoch_us(
+                datetime(2013, 5, 5, 5, 30, 45, tzinfo=tz.gettz("US/Pacific"))
+            )
+            == 1367757045000000
+        )
+        assert (
+            util.epoch_us(datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=tz.tzutc()))
+            == -1
+        )
+
+        # exact where a float timestamp is not
+        far = datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)
+        assert util.epoch_us(far) == 253402300799999999
+        assert int(far.timestamp() * 1_000_000) != 253402300799999999
+
+    def test_epoch_us_naive(self):
+        dt = datetime(2013, 5, 5, 12, 30, 45, 123456)
+
+        assert util.epoch_us(dt) == round(dt.timestamp() * 1_000_000)
+
+    def test_month_length(self):
+        for year in range(1600, 2401):
+            for month in range(1, 13):
+                assert util.month_length(year, month) == (
+                    calendar.monthrange(year, month)[1]
+                )
+
     def test_normalize_timestamp(self):
         timestamp = 1591161115.194556
         millisecond_timestamp = 1591161115194
@@ -0,0 +1,194 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from arrow import Arrow
+from arrow.windows import SlidingWindows, TumblingWindows
+
+START = Arrow(2013, 5, 5, 12)
+
+
+def minutes(*values: int):
+    return [START.shift(minutes=value) for value in values]
+
+
+class TestSlidingWindows:
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            SlidingWindows("minute", 0)
+
+        with pytest.raises(ValueError):
+            SlidingWindows("minute", 5, step=0)
+
+        with pytest.raises(ValueError):
+            SlidingWindows("minute", lateness=timedelta(seconds=-1))
+
+        with pytest.raises(ValueError):
+            SlidingWindows("month")
+
+        with pytest.raises(ValueError):
+            SlidingWindows("day", tz="US/Pacific")
+
+        with pytest.raises(ValueError):
+            SlidingWindows("fortnight")
+
+    def test_sliding(self):
+        windows = SlidingWindows("minute", 10, step=5, aggregate=len)
+
+        assert list(windows.process(minutes(1, 3, 7, 12))) == [
+            (START.shift(minutes=-5), START.shift(minutes=5, microseconds=-1), 2),
+            (START, START.shift(minutes=10, microseconds=-1), 3),
+            (START.shift(minutes=5), START.shift(minutes=15, microseconds=-1), 2),
+            (START.shift(minutes=10), START.shift(minutes=20, microseconds=-1), 1),
+        ]
+
+    def test_uneven_step(self):
+        windows = SlidingWindows("minute", 3, step=2, aggregate=len)
+
+        result = [
+            (start.minute, count)
+            for start, _, count in windows.process(minutes(0, 1, 2, 3, 4))
+        ]
+
+        # windows start at 58, 0, 2 and 4 and hold [58, 61), [0, 3), [2, 5) and [4, 7)
+        assert result == [(58, 1), (0, 3), (2, 3), (4, 1)]
+
+    def test_hopping(self):
+        windows = SlidingWindows("minute", 1, step=2)
+
+        assert [events for _, _, events in windows.process(minutes(0, 1, 2))] == [
+            minutes(0),
+            minutes(2),
+        ]
+        assert windows.late == 0
+
+    def test_emits_as_windows_close(self):
+        windows = SlidingWindows("minute", 5)
+
+        assert windows.add(START) == []
+        assert windows.add(START.shift(minutes=4)) == []
+        assert windows.add(START.shift(minutes=5)) == [
+            (START, START.shift(minutes=5, microseconds=-1), minutes(0, 4))
+        ]
+        assert repr(windows) == "<SlidingWindows [1 open]>"
+        assert windows.flush() == [
+            (
+                START.shift(minutes=5),
+                START.shift(minutes=10, microseconds=-1),
+                minutes(5),
+            )
+        ]
+        assert windows.flush() == []
+
+    def test_process_streams(self):
+        def events():
+            yield from minutes(0, 1, 6)
+            raise RuntimeError()
+
+        windows = TumblingWindows("minute", 5, aggregate=len)
+        closed = windows.process(events())
+
+        assert next(closed) == (START, START.shift(minutes=5, microseconds=-1), 2)
+        with pytest.raises(RuntimeError):
+            next(closed)
+
+    def test_lateness(self):
+        windows = TumblingWindows("minute", 5, lateness=timedelta(minutes=2))
+
+        assert windows.add(START.shift(minutes=6)) == []
+        assert windows.watermark == START.shift(minutes=4)
+
+        # late, but its window is still open
+        assert windows.add(START.shift(minutes=3)) == []
+        assert windows.watermark == START.shift(minutes=4)
+
+        closed = windows.add(START.shift(minutes=7))
+        assert closed == [(START, START.shift(minutes=5, microseconds=-1), minutes(3))]
+
+        # its window has closed
+        assert windows.add(START.shift(minutes=4)) == []
+        assert windows.late == 1
+
+    def test_late_events_in_process(self):
+        windows = TumblingWindows("minute", 5, aggregate=len)
+
+        result = list(windows.process(minutes(1, 6, 2, 7, 11, 8)))
+
+        # 2 and 8 arrive after their windows closed
+        assert [(start.minute, count) for start, _, count in result] == [
+            (0, 1),
+            (5, 2),
+            (10, 1),
+        ]
+        assert windows.late == 2
+
+    def test_late_for_some_windows(self):
+        windows = SlidingWindows("minute", 10, step=5, aggregate=len)
+
+        result = list(windows.process(minutes(1, 6, 4)))
+
+        # 4 is too late for the window starting at 55, but not for the one at 0
+        assert [(start.minute, count) for start, _, count in result] == [
+            (55, 1),
+            (0, 3),
+            (5, 1),
+        ]
+        assert windows.late == 0
+
+    def test_advance(self):
+        windows = TumblingWindows("minute", 5, lateness=timedelta(minutes=1))
+
+        windows.add(START)
+
+        assert windows.advance(START.shift(minutes=4)) == []
+        assert windows.watermark == START.shift(minutes=4)
+        assert windows.advance(START.shift(minutes=2)) == []
+        assert windows.watermark == START.shift(minutes=4)
+        assert windows.advance(datetime(2013, 5, 5, 12, 5)) == [
+            (START, START.shift(minutes=5, microseconds=-1), [START])
+        ]
+
+    def test_watermark(self):
+        windows = TumblingWindows("hour", tz="+02:00")
+
+        assert windows.watermark is None
+
+        windows.add(datetime(2013, 5, 5, 12))
+
+        assert windows.watermark == START
+        assert windows.watermark.tzinfo == START.to("+02:00").tzinfo
+
+    def test_key(self):
+        events = [(START, "a"), (START.shift(minutes=1), "b")]
+        windows = TumblingWindows(
+            "minute",
+            5,
+            key=lambda event: event[0],
+            aggregate=lambda items: [name for _, name in items],
+        )
+
+        assert [names for _, _, names in windows.process(events)] == [["a", "b"]]
+
+    @pytest.mark.parametrize(
+        "frame, tz, week_start",
+        [
+            ("hour", "+05:30", 1),
+            ("day", "-03:00", 1),
+            ("week", None, 3),
+            ("week", "+01:00", 7),
+        ],
+    )
+    def test_tumbling_matches_span(self, frame, tz, week_start):
+        events = [START.shift(hours=7 * hours) for hours in range(100)]
+
+        windows = TumblingWindows(frame, tz=tz, week_start=week_start)
+        result = list(windows.process(events))
+
+        expected = {}
+        for event in events:
+            floor, ceil = event.to(tz or "UTC").span(frame, week_start=week_start)
+            expected.setdefault((floor, ceil), []).append(event)
+
+        assert [((start, end), events) for start, end, events in result] == list(
+            expected.items()
+        )
@@ -0,0 +1,297 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dateutil import tz
+
+import arrow
+from arrow import zones
+
+
+class TestZones:
+    def test_utc(self):
+        assert zones.UTC is tz.tzutc()
+
+    def test_local(self, mocker):
+        expected = tz.tzlocal()
+        mocker.patch("arrow.zones._local", None)
+        mocked_tzlocal = mocker.patch(
+            "arrow.zones.dateutil_tz.tzlocal", return_value=expected
+        )
+
+        local = zones.local()
+
+        assert local is expected
+        assert zones.local() is local
+        assert mocked_tzlocal.call_count == 1
+
+    @pytest.fixture
+    def local_source(self, mocker, tmp_path):
+        localtime = tmp_path / "localtime"
+        localtime.write_bytes(b"TZif")
+        mocker.patch("arrow.zones._LOCALTIME", str(localtime))
+        mocker.patch("arrow.zones._local", None)
+        mocker.patch("arrow.zones._local_checked", 0.0)
+        mocker.patch("arrow.zones._local_source_key", (None, None))
+        mocker.patch.dict("os.environ", {"TZ": "UTC"})
+        mocker.patch("arrow.zones.time.tzset", create=True)
+        mocker.spy(zones.dateutil_tz, "tzlocal")
+
+        return localtime
+
+    def expire_local_check(self, mocker):
+        mocker.patch("arrow.zones._local_checked", -zones.LOCAL_CHECK_INTERVAL)
+
+    def test_local_unchanged(self, mocker, local_source):
+        local = zones.local()
+        self.expire_local_check(mocker)
+
+        assert zones.local() is local
+        assert zones.dateutil_tz.tzlocal.call_count == 1
+        assert not zones.time.tzset.called
+
+    def test_local_tz_changed(self, mocker, local_source):
+        local = zones.local()
+        os.environ["TZ"] = "US/Pacific"
+
+        # changes are only checked for once the interval has passed
+        assert zones.local() is local
+
+        self.expire_local_check(mocker)
+
+        assert zones.local() is not local
+        assert zones.dateutil_tz.tzlocal.call_count == 2
+        assert zones.time.tzset.call_count == 1
+
+    def test_local_tz_unset(self, mocker, local_source):
+        local = zones.local()
+        del os.environ["TZ"]
+        self.expire_local_check(mocker)
+
+        assert zones.local() is not local
+
+    def test_local_localtime_changed(self, mocker, local_source):
+        local = zones.local()
+        local_source.write_bytes(b"TZif2")
+        self.expire_local_check(mocker)
+
+        assert zones.local() is not local
+
+    def test_local_localtime_removed(self, mocker, local_source):
+        local = zones.local()
+        local_source.unlink()
+        self.expire_local_check(mocker)
+
+        assert zones.local() is not local
+
+        self.expire_local_check(mocker)
+
+        assert zones.local() is zones.local()
+        assert zones.dateutil_tz.tzlocal.call_count == 2
+
+    @pytest.mark.parametrize(
+        "tzinfo",
+        [
+            tz.tzutc(),
+            tz.tzoffset(None, 3600),
+            timezone.utc,
+            tz.gettz("UTC"),
+            tz.gettz("Etc/GMT+5"),
+            tz.tzstr("EST5"),
+        ],
+    )
+    def test_has_fixed_offset(self, tzinfo):
+        assert zones.has_fixed_offset(tzinfo)
+        assert zones.has_fixed_offset(tzinfo)
+
+    @pytest.mark.parametrize(
+        "tzinfo",
+        [tz.gettz("US/Pacific"), tz.tzstr("EST5EDT")],
+    )
+    def test_has_changing_offset(self, tzinfo):
+        assert not zones.has_fixed_offset(tzinfo)
+        assert not zones.has_fixed_offset(tzinfo)
+
+    def test_has_fixed_offset_cache(self, mocker):
+        mocker.patch("arrow.zones._fixed_offsets", {})
+        mocker.patch("arrow.zones._FIXED_OFFSETS_SIZE", 2)
+        pacific, london, paris = (
+            tz.gettz(name) for name in ["US/Pacific", "Europe/London", "Europe/Paris"]
+        )
+
+        for tzinfo in [zones.UTC, pacific, pacific, london]:
+            zones.has_fixed_offset(tzinfo)
+        assert zones._fixed_offsets == {
+            id(pacific): (pacific, False),
+            id(london): (london, False),
+        }
+
+        zones.has_fixed_offset(paris)
+        assert zones._fixed_offsets == {id(paris): (paris, False)}
+
+    def test_transition_windows_fixed_offset(self):
+        for tzinfo in [zones.UTC, tz.tzoffset(None, 3600), tz.gettz("Etc/GMT+5")]:
+            assert list(zones.transition_windows(tzinfo, datetime(2020, 1, 1))) == []
+
+    def test_transition_windows_unknown_transitions(self):
+        tzinfo = tz.tzstr("EST5EDT,M3.2.0,M11.1.0")
+
+        assert list(zones.transition_windows(tzinfo, datetime(2020, 1, 1))) == [
+            (datetime.min.replace(tzinfo=tzinfo), datetime.max.replace(tzinfo=tzinfo))
+        ]
+
+    def test_transition_windows_after_last_transition(self):
+        tzinfo = tz.gettz("Asia/Kolkata")
+
+        assert list(zones.transition_windows(tzinfo, datetime(2000, 1, 1))) == []
+
+    def test_transition_windows_hold_imaginary_times(self):
+        tzinfo = tz.gettz("US/Pacific")
+        start = datetime(2019, 6, 1, tzinfo=tzinfo)
+        windows = zones.transition_windows(tzinfo, start)
+
+        first = next(windows)
+        assert first[0] <= datetime(2019, 11, 3, 1, tzinfo=tzinfo) < first[1]
+        assert first[0] > start
+
+        current = start
+        window = first
+        while current.year < 2021:
+            if not tz.datetime_exists(current):
+                while window[1] < current:
+                    window = next(windows)
+                assert window[0] <= current <= window[1]
+            current += timedelta(minutes=30)
+
+
+requires_zoneinfo = pytest.mark.skipif(
+    zones.zoneinfo is None, reason="zoneinfo needs Python 3.9 or later"
+)
+
+
+@pytest.fixture
+def zoneinfo_backend(mocker):
+    # restores the default backend afterwards
+    mocker.patch("arrow.zones._backend", zones._backend)
+    zones.set_backend("zoneinfo")
+
+
+class TestBackends:
+    def test_default(self):
+        assert zones.get_backend() == "dateutil"
+        assert zones.gettz("US/Pacific") is tz.gettz("US/Pacific")
+
+    def test_set_backend(self, mocker):
+        mocker.patch("arrow.zones._backend", zones._backend)
+
+        zones.set_backend("dateutil")
+
+        assert zones.get_backend() == "dateutil"
+
+    def test_set_backend_unsupported(self):
+        with pytest.raises(ValueError, match="Unsupported timezone backend 'pytz'"):
+            zones.set_backend("pytz")
+
+        assert zones.get_backend() == "dateutil"
+
+    @pytest.mark.parametrize(
+        "dt, exists, ambiguous, resolved",
+        [
+            (datetime(2013, 3, 10, 1, 30), True, False, datetime(2013, 3, 10, 1, 30)),
+            (datetime(2013, 3, 10, 2, 30), False, False, datetime(2013, 3, 10, 3, 30)),
+            (datetime(2013, 11, 3, 1, 30), True, True, datetime(2013, 11, 3, 1, 30)),
+            (datetime(2013, 11, 3, 2, 30), True, False, datetime(2013, 11, 3, 2, 30)),
+        ],
+    )
+    def test_dateutil(self, dt, exists, ambiguous, resolved):
+        dt = dt.replace(tzinfo=zones.gettz("US/Pacific"))
+
+        assert zones.datetime_exists(dt) is exists
+        assert zones.datetime_ambiguous(dt) is ambiguous
+        assert zones.resolve_imaginary(dt) == resolved.replace(tzinfo=dt.tzinfo)
+
+
+@requires_zoneinfo
+@pytest.mark.usefixtures("zoneinfo_backend")
+class TestZoneInfoBackend:
+    def test_gettz(self):
+        assert zones.get_backend() == "zoneinfo"
+        assert zones.gettz("US/Pacific") == zones.zoneinfo.ZoneInfo("US/Pacific")
+
+    @pytest.mark.parametrize(
+        "name", ["EST5EDT,M3.2.0,M11.1.0", "/usr/share/zoneinfo/US/Pacific", "Nope"]
+    )
+    def test_gettz_fallback(self, name):
+        assert zones.gettz(name) == tz.gettz(name)
+
+    @pytest.mark.parametrize(
+        "dt, exists, ambiguous, resolved",
+        [
+            (datetime(2013, 3, 10, 1, 30), True, False, datetime(2013, 3, 10, 1, 30)),
+            (datetime(2013, 3, 10, 2, 30), False, False, datetime(2013, 3, 10, 3, 30)),
+            (datetime(2013, 11, 3, 1, 30), True, True, datetime(2013, 11, 3, 1, 30)),
+            (datetime(2013, 11, 3, 2, 30), True, False, datetime(2013, 11, 3, 2, 30)),
+        ],
+    )
+    def test_skipped_and_repeated_times(self, dt, exists, ambiguous, resolved):
+        dt = dt.replace(tzinfo=zones.gettz("US/Pacific"))
+
+        assert zones.datetime_exists(dt) is exists
+        assert zones.datetime_ambiguous(dt) is ambiguous
+        assert zones.resolve_imaginary(dt) == resolved.replace(tzinfo=dt.tzinfo)
+
+    @pytest.mark.parametrize(
+        "tzinfo", [tz.gettz("US/Pacific"), tz.tzstr("PST8PDT,M3.2.0,M11.1.0")]
+    )
+    def test_other_timezones(self, tzinfo):
+        dt = datetime(2013, 3, 10, 2, 30, tzinfo=tzinfo)
+
+        assert not zones.datetime_exists(dt)
+        assert not zones.datetime_ambiguous(dt)
+        assert zones.resolve_imaginary(dt) == datetime(
+            2013, 3, 10, 3, 30, tzinfo=tzinfo
+        )
+
+    def test_arrow(self):
+        dt = arrow.Arrow(2013, 3, 10, 9, 30).to("US/Pacific")
+
+        assert dt.tzinfo == zones.zoneinfo.ZoneInfo("US/Pacific")
+        assert dt.isoformat() == "2013-03-10T01:30:00-08:00"
+        assert dt.shift(hours=1).isoformat() == "2013-03-10T03:30:00-07:00"
+        assert dt.shift(days=-1, hours=1).isoformat() == "2013-03-09T02:30:00-08:00"
+        assert dt.replace(hour=2).imaginary
+        assert arrow.Arrow(2013, 11, 3, 1, 30, tzinfo="US/Pacific").ambiguous
+        assert [d.isoformat() for d in arrow.Arrow.range("hour", dt, limit=3)] == [
+            "2013-03-10T01:30:00-08:00",
+            "2013-03-10T03:30:00-07:00",
+            "2013-03-10T04:30:00-07:00",
+        ]
+
+    @pytest.mark.parametrize(
+        "name, transitions",
+        [
+            ("US/Pacific", [datetime(2013, 3, 10), datetime(2013, 11, 3)]),
+            ("Europe/London", [datetime(2013, 3, 31), datetime(2013, 10, 27)]),
+            ("Australia/Lord_Howe", [datetime(2013, 4, 7), datetime(2013, 10, 6)]),
+        ],
+    )
+    def test_matches_dateutil(self, name, transitions):
+        zoneinfo_tz = zones.gettz(name)
+        dateutil_tz = tz.gettz(name)
+
+        for transition in transitions:
+            dt = transition - timedelta(days=1)
+
+            while dt < transition + timedelta(days=1):
+                expected = dt.replace(tzinfo=dateutil_tz)
+                actual = dt.replace(tzinfo=zoneinfo_tz)
+
+                assert zones.datetime_exists(actual) == tz.datetime_exists(expected)
+                assert zones.datetime_ambiguous(actual) == tz.datetime_ambiguous(
+                    expected
+                )
+                assert zones.resolve_imaginary(actual).replace(
+                    tzinfo=None
+                ) == tz.resolve_imaginary(expected).replace(tzinfo=None)
+
+                dt += timedelta(minutes=15)